@@ -0,0 +1,44 @@
+"""create personal records table
+
+Revision ID: 017754a14261
+Revises: 541b7f5ef07c
+Create Date: 2026-10-19 09:12:40.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017754a14261'
+down_revision: Union[str, Sequence[str], None] = '541b7f5ef07c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "personal_records",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("exercise_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("max_weight", sa.Numeric(precision=8, scale=2), nullable=True),
+        sa.Column("max_weight_achieved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("best_set_load", sa.Numeric(precision=12, scale=2), nullable=True),
+        sa.Column("best_set_load_achieved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("best_estimated_1rm", sa.Numeric(precision=8, scale=2), nullable=True),
+        sa.Column("best_estimated_1rm_achieved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"]),
+        sa.ForeignKeyConstraint(["exercise_id"], ["exercises.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "exercise_id"),
+    )
+    # Existing history is loaded with: python -m app.jobs.backfill_personal_records
+
+
+def downgrade() -> None:
+    op.drop_table("personal_records")
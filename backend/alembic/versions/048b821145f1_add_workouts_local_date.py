@@ -0,0 +1,47 @@
+"""add workouts local_date and users timezone
+
+Revision ID: 048b821145f1
+Revises: d6a78f336ab1
+Create Date: 2026-10-19 11:20:45.102937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '048b821145f1'
+down_revision: Union[str, Sequence[str], None] = 'd6a78f336ab1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("timezone", sa.String(length=64), nullable=True))
+
+    # Neither the submitting client's zone nor a user default exists yet, so every
+    # existing row is backfilled in UTC. app.services.local_dates redoes a user's
+    # UTC-derived dates once their timezone becomes known.
+    # Strategy: add nullable, backfill, then enforce NOT NULL.
+    op.add_column("workouts", sa.Column("local_date", sa.Date(), nullable=True))
+    op.execute(
+        """
+        UPDATE workouts AS w
+        SET local_date = (w.start_ts AT TIME ZONE COALESCE(u.timezone, 'UTC'))::date
+        FROM users AS u
+        WHERE u.user_id = w.user_id AND w.local_date IS NULL
+        """
+    )
+    op.alter_column("workouts", "local_date", nullable=False)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS workouts_user_local_date ON workouts (user_id, local_date, start_ts DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS workouts_user_local_date")
+    op.drop_column("workouts", "local_date")
+    op.drop_column("users", "timezone")
@@ -0,0 +1,72 @@
+"""create archive schema for cold workouts
+
+Revision ID: 4b8e2d6f1c3a
+Revises: 7dc066cd1a94
+Create Date: 2026-10-19 15:02:44.913027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8e2d6f1c3a'
+down_revision: Union[str, Sequence[str], None] = '7dc066cd1a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("workouts", "strength_sets", "cardio_sessions")
+
+
+def upgrade() -> None:
+    # Plain tables with the hot tables' columns. Archived rows are written once and
+    # never updated, so pages are packed full, and only the indexes the fallback
+    # reads use are kept.
+    op.execute("CREATE SCHEMA archive")
+    for table in TABLES:
+        op.execute(
+            f"CREATE TABLE archive.{table} (LIKE public.{table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            "WITH (fillfactor = 100)"
+        )
+
+    op.execute("ALTER TABLE archive.workouts ADD CONSTRAINT archive_workouts_pkey PRIMARY KEY (user_id, id)")
+    op.execute(
+        "ALTER TABLE archive.workouts ADD CONSTRAINT archive_workouts_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES public.users (user_id)"
+    )
+    op.execute("CREATE INDEX archive_workouts_user_local_date ON archive.workouts (user_id, local_date)")
+
+    op.execute(
+        "ALTER TABLE archive.strength_sets ADD CONSTRAINT archive_strength_sets_pkey PRIMARY KEY (user_id, id)"
+    )
+    op.execute(
+        "ALTER TABLE archive.strength_sets ADD CONSTRAINT archive_strength_sets_workout_id_fkey "
+        "FOREIGN KEY (user_id, workout_id) REFERENCES archive.workouts (user_id, id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "ALTER TABLE archive.strength_sets ADD CONSTRAINT archive_strength_sets_exercise_id_fkey "
+        "FOREIGN KEY (exercise_id) REFERENCES public.exercises (id)"
+    )
+    op.execute("CREATE INDEX archive_strength_sets_user_workout ON archive.strength_sets (user_id, workout_id)")
+    op.execute(
+        "CREATE INDEX archive_strength_sets_user_exercise_time "
+        "ON archive.strength_sets (user_id, exercise_id, performed_at, id)"
+    )
+
+    op.execute("ALTER TABLE archive.cardio_sessions ADD CONSTRAINT archive_cardio_sessions_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE archive.cardio_sessions ADD CONSTRAINT archive_cardio_sessions_workout_id_fkey "
+        "FOREIGN KEY (user_id, workout_id) REFERENCES archive.workouts (user_id, id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "CREATE INDEX archive_cardio_sessions_user_workout ON archive.cardio_sessions (user_id, workout_id)"
+    )
+
+
+def downgrade() -> None:
+    # Move anything archived back first so the downgrade loses no history.
+    for table in TABLES:
+        op.execute(f"INSERT INTO public.{table} SELECT * FROM archive.{table}")
+    op.execute("DROP SCHEMA archive CASCADE")
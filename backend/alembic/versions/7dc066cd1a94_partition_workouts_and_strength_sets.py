@@ -0,0 +1,152 @@
+"""hash-partition workouts and strength_sets by user_id
+
+Revision ID: 7dc066cd1a94
+Revises: 9c3e5f1a2b7d
+Create Date: 2026-10-19 14:20:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7dc066cd1a94'
+down_revision: Union[str, Sequence[str], None] = '9c3e5f1a2b7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every read and write is scoped to one user, so hashing on user_id lets each
+# query touch a single partition (and its smaller indexes). Changing the count
+# later means re-partitioning, so it is sized for growth.
+PARTITIONS = 16
+IDEMPOTENCY_INDEX = "uq_workouts_user_client_uuid_not_null"
+
+
+def _create_partitioned_copy(table: str) -> None:
+    op.execute(
+        f"CREATE TABLE {table}_partitioned (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY HASH (user_id)"
+    )
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE {table}_p{remainder} PARTITION OF {table}_partitioned "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+    op.execute(f"INSERT INTO {table}_partitioned SELECT * FROM {table}")
+
+
+def _create_plain_copy(table: str) -> None:
+    op.execute(f"CREATE TABLE {table}_plain (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    op.execute(f"INSERT INTO {table}_plain SELECT * FROM {table}")
+
+
+def upgrade() -> None:
+    # Rows are copied inside the migration transaction; on large installations run
+    # it in a maintenance window, since both tables are locked until it commits.
+    op.execute("ALTER TABLE cardio_sessions DROP CONSTRAINT cardio_sessions_workout_id_fkey")
+
+    _create_partitioned_copy("workouts")
+    _create_partitioned_copy("strength_sets")
+    op.execute("DROP TABLE strength_sets")
+    op.execute("DROP TABLE workouts")
+    op.execute("ALTER TABLE workouts_partitioned RENAME TO workouts")
+    op.execute("ALTER TABLE strength_sets_partitioned RENAME TO strength_sets")
+
+    # Unique constraints on a partitioned table must include the partition key.
+    op.execute("ALTER TABLE workouts ADD CONSTRAINT workouts_pkey PRIMARY KEY (user_id, id)")
+    op.execute(
+        "ALTER TABLE workouts ADD CONSTRAINT workouts_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (user_id)"
+    )
+    # Per-partition idempotency indexes get predictable names: a duplicate
+    # client_uuid is reported against the partition's index, not the parent's.
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE UNIQUE INDEX {IDEMPOTENCY_INDEX}_p{remainder} ON workouts_p{remainder} "
+            "(user_id, client_uuid) WHERE client_uuid IS NOT NULL"
+        )
+    op.execute(
+        f"CREATE UNIQUE INDEX {IDEMPOTENCY_INDEX} ON workouts (user_id, client_uuid) "
+        "WHERE client_uuid IS NOT NULL"
+    )
+    op.execute("CREATE INDEX workouts_user_time ON workouts (user_id, start_ts DESC)")
+    op.execute("CREATE INDEX workouts_user_local_date ON workouts (user_id, local_date, start_ts DESC)")
+    # ix_workouts_user_id is not recreated: the primary key now leads with user_id.
+
+    op.execute("ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_pkey PRIMARY KEY (user_id, id)")
+    op.execute(
+        "ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (user_id)"
+    )
+    op.execute(
+        "ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_workout_id_fkey "
+        "FOREIGN KEY (user_id, workout_id) REFERENCES workouts (user_id, id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_exercise_id_fkey "
+        "FOREIGN KEY (exercise_id) REFERENCES exercises (id)"
+    )
+    op.execute("CREATE INDEX strength_sets_workout_order ON strength_sets (workout_id, set_index)")
+    op.execute(
+        "CREATE INDEX strength_sets_user_exercise_time ON strength_sets (user_id, exercise_id, performed_at, id)"
+    )
+    op.execute("CREATE INDEX strength_sets_user_workout ON strength_sets (user_id, workout_id)")
+
+    op.execute(
+        "ALTER TABLE cardio_sessions ADD CONSTRAINT cardio_sessions_workout_id_fkey "
+        "FOREIGN KEY (user_id, workout_id) REFERENCES workouts (user_id, id) ON DELETE CASCADE"
+    )
+    op.execute("ANALYZE workouts")
+    op.execute("ANALYZE strength_sets")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE cardio_sessions DROP CONSTRAINT cardio_sessions_workout_id_fkey")
+
+    _create_plain_copy("workouts")
+    _create_plain_copy("strength_sets")
+    op.execute("DROP TABLE strength_sets")
+    op.execute("DROP TABLE workouts")
+    op.execute("ALTER TABLE workouts_plain RENAME TO workouts")
+    op.execute("ALTER TABLE strength_sets_plain RENAME TO strength_sets")
+
+    op.execute("ALTER TABLE workouts ADD CONSTRAINT workouts_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE workouts ADD CONSTRAINT workouts_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (user_id)"
+    )
+    op.execute("CREATE INDEX ix_workouts_user_id ON workouts (user_id)")
+    op.execute(
+        f"CREATE UNIQUE INDEX {IDEMPOTENCY_INDEX} ON workouts (user_id, client_uuid) "
+        "WHERE client_uuid IS NOT NULL"
+    )
+    op.execute("CREATE INDEX workouts_user_time ON workouts (user_id, start_ts DESC)")
+    op.execute("CREATE INDEX workouts_user_local_date ON workouts (user_id, local_date, start_ts DESC)")
+
+    op.execute("ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (user_id)"
+    )
+    op.execute(
+        "ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_workout_id_fkey "
+        "FOREIGN KEY (workout_id) REFERENCES workouts (id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "ALTER TABLE strength_sets ADD CONSTRAINT strength_sets_exercise_id_fkey "
+        "FOREIGN KEY (exercise_id) REFERENCES exercises (id)"
+    )
+    op.execute("CREATE INDEX strength_sets_workout_order ON strength_sets (workout_id, set_index)")
+    op.execute(
+        "CREATE INDEX strength_sets_user_exercise_time ON strength_sets (user_id, exercise_id, performed_at, id)"
+    )
+    op.execute("CREATE INDEX strength_sets_user_workout ON strength_sets (user_id, workout_id)")
+
+    op.execute(
+        "ALTER TABLE cardio_sessions ADD CONSTRAINT cardio_sessions_workout_id_fkey "
+        "FOREIGN KEY (workout_id) REFERENCES workouts (id) ON DELETE CASCADE"
+    )
+    op.execute("ANALYZE workouts")
+    op.execute("ANALYZE strength_sets")
@@ -0,0 +1,46 @@
+"""widen personal_records.best_estimated_1rm
+
+Revision ID: a7d3e9b1c5f4
+Revises: f2b8c4e6a9d1
+Create Date: 2026-10-19 18:02:55.417906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9b1c5f4'
+down_revision: Union[str, Sequence[str], None] = 'f2b8c4e6a9d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Estimates run up to weight * (1 + reps / 30), past the Numeric(8, 2) that bounds weight itself.
+    # Raising the precision at the same scale is a catalog-only change; the table is not rewritten.
+    op.alter_column(
+        "personal_records",
+        "best_estimated_1rm",
+        type_=sa.Numeric(10, 2),
+        existing_type=sa.Numeric(8, 2),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    # Estimates that no longer fit are dropped; backfill_personal_records cannot restore them either.
+    op.execute(
+        "UPDATE personal_records SET best_estimated_1rm = NULL, best_estimated_1rm_achieved_at = NULL "
+        "WHERE best_estimated_1rm >= 1000000"
+    )
+    op.alter_column(
+        "personal_records",
+        "best_estimated_1rm",
+        type_=sa.Numeric(8, 2),
+        existing_type=sa.Numeric(10, 2),
+        existing_nullable=True,
+    )
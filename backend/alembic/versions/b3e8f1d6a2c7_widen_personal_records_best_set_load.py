@@ -0,0 +1,46 @@
+"""widen personal_records.best_set_load
+
+Revision ID: b3e8f1d6a2c7
+Revises: a7d3e9b1c5f4
+Create Date: 2026-10-19 20:14:08.630521
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8f1d6a2c7'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e9b1c5f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # weight is Numeric(8, 2) and reps an Integer, so a set's load reaches about 2.1e15;
+    # Numeric(18, 2) holds any product. Same scale, so again a catalog-only change.
+    op.alter_column(
+        "personal_records",
+        "best_set_load",
+        type_=sa.Numeric(18, 2),
+        existing_type=sa.Numeric(12, 2),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    # Loads that no longer fit are dropped; backfill_personal_records cannot restore them either.
+    op.execute(
+        "UPDATE personal_records SET best_set_load = NULL, best_set_load_achieved_at = NULL "
+        "WHERE best_set_load >= 10000000000"
+    )
+    op.alter_column(
+        "personal_records",
+        "best_set_load",
+        type_=sa.Numeric(12, 2),
+        existing_type=sa.Numeric(18, 2),
+        existing_nullable=True,
+    )
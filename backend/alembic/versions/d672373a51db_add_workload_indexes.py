@@ -0,0 +1,47 @@
+"""add workload-driven indexes for workouts and dashboard reads
+
+Revision ID: d672373a51db
+Revises: 048b821145f1
+Create Date: 2026-10-19 12:41:09.337162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd672373a51db'
+down_revision: Union[str, Sequence[str], None] = '048b821145f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps strength_sets writable while the indexes build; it
+    # cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        # list_workouts per-row set counts (index-only) and dashboard_day
+        # "user_id = ? AND workout_id IN (...)" set fetches.
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS strength_sets_user_workout "
+            "ON strength_sets (user_id, workout_id)"
+        )
+        # The single-column user_id index is a prefix of the composite above.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_strength_sets_user_id")
+        # dashboard_day / trends muscle attribution: index-only lookups by exercise_id.
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS exercise_muscle_map_exercise_cover "
+            "ON exercise_muscle_map (exercise_id) INCLUDE (muscle_group_id, is_primary)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS exercise_muscle_map_exercise_cover")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_strength_sets_user_id "
+            "ON strength_sets (user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS strength_sets_user_workout")
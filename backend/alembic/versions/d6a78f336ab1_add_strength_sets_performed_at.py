@@ -0,0 +1,49 @@
+"""add strength_sets performed_at with exercise history index
+
+Revision ID: d6a78f336ab1
+Revises: 017754a14261
+Create Date: 2026-10-19 10:03:18.774520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a78f336ab1'
+down_revision: Union[str, Sequence[str], None] = '017754a14261'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # performed_at denormalizes workouts.start_ts onto each set so per-exercise
+    # history can be read from a single index without joining workouts.
+    # Strategy: add nullable, backfill from the parent workout, then enforce NOT NULL.
+    op.add_column(
+        "strength_sets",
+        sa.Column("performed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE strength_sets AS s
+        SET performed_at = w.start_ts
+        FROM workouts AS w
+        WHERE w.id = s.workout_id AND s.performed_at IS NULL
+        """
+    )
+    op.alter_column("strength_sets", "performed_at", nullable=False)
+    op.create_index(
+        "strength_sets_user_exercise_time",
+        "strength_sets",
+        ["user_id", "exercise_id", "performed_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("strength_sets_user_exercise_time", table_name="strength_sets")
+    op.drop_column("strength_sets", "performed_at")
@@ -0,0 +1,58 @@
+"""add soft deletes to workouts and strength_sets
+
+Revision ID: e5a1c9d7b3f2
+Revises: 4b8e2d6f1c3a
+Create Date: 2026-10-19 15:48:12.604391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c9d7b3f2'
+down_revision: Union[str, Sequence[str], None] = '4b8e2d6f1c3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Read indexes, rebuilt to cover live rows only: reads filter on deleted_at IS NULL,
+# so deleted rows never widen the scans and the indexes stay the size they are today.
+READ_INDEXES = (
+    ("workouts_user_time", "workouts", "user_id, start_ts DESC"),
+    ("workouts_user_local_date", "workouts", "user_id, local_date, start_ts DESC"),
+    ("strength_sets_workout_order", "strength_sets", "workout_id, set_index"),
+    ("strength_sets_user_exercise_time", "strength_sets", "user_id, exercise_id, performed_at, id"),
+    ("strength_sets_user_workout", "strength_sets", "user_id, workout_id"),
+    ("archive.archive_workouts_user_local_date", "archive.workouts", "user_id, local_date"),
+    ("archive.archive_strength_sets_user_workout", "archive.strength_sets", "user_id, workout_id"),
+    (
+        "archive.archive_strength_sets_user_exercise_time",
+        "archive.strength_sets",
+        "user_id, exercise_id, performed_at, id",
+    ),
+)
+TABLES = ("workouts", "strength_sets", "archive.workouts", "archive.strength_sets")
+
+
+def _recreate_read_indexes(where: str) -> None:
+    for qualified_name, table, columns in READ_INDEXES:
+        name = qualified_name.rpartition(".")[2]
+        op.execute(f"DROP INDEX {qualified_name}")
+        op.execute(f"CREATE INDEX {name} ON {table} ({columns}){where}")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN deleted_at TIMESTAMP WITH TIME ZONE")
+    _recreate_read_indexes(" WHERE deleted_at IS NULL")
+
+
+def downgrade() -> None:
+    # Without the column, soft-deleted rows would reappear; remove them for good.
+    for table in ("archive.strength_sets", "archive.workouts", "strength_sets", "workouts"):
+        op.execute(f"DELETE FROM {table} WHERE deleted_at IS NOT NULL")
+    _recreate_read_indexes("")
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN deleted_at")
@@ -0,0 +1,38 @@
+"""add trigram index on exercise names
+
+Revision ID: f2b8c4e6a9d1
+Revises: e5a1c9d7b3f2
+Create Date: 2026-10-19 17:21:40.318275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8c4e6a9d1'
+down_revision: Union[str, Sequence[str], None] = 'e5a1c9d7b3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Both extensions ship with Postgres and are trusted, so the database owner can create them.
+    # btree_gin lets user_id sit in the same GIN index, so fuzzy search reads one user's names only.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    # CONCURRENTLY keeps exercises writable while the index builds; it
+    # cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS exercises_user_name_trgm "
+            "ON exercises USING gin (user_id, lower(name) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS exercises_user_name_trgm")
+    # The extensions are left installed; other objects may have come to depend on them.
@@ -1,46 +1,125 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.core.security import decode_access_token
+from app.core.revocation import SessionRevocations
+from app.core.security import decode_access_claims
+from app.core.timing import timed_phase
+from app.core.user_cache import CachedUser
 from app.db.models.user import User
 from app.db.session import get_db
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-) -> User:
+def _token_subject(credentials: HTTPAuthorizationCredentials | None, revocations: SessionRevocations) -> int:
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
 
-    token = credentials.credentials
     try:
-        user_id = decode_access_token(token)
+        claims = decode_access_claims(credentials.credentials)
     except (JWTError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         ) from None
 
-    user = db.execute(select(User).where(User.user_id == user_id)).scalar_one_or_none()
-    if user is None:
+    if revocations.is_revoked(claims.session_id):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
+            detail="Token revoked",
         )
+    return claims.user_id
 
-    request.state.user_id = user.user_id
+
+def token_is_valid(credentials: HTTPAuthorizationCredentials | None, revocations: SessionRevocations) -> bool:
+    """Re-check a token already accepted once, e.g. on a long-lived stream that may outlive it."""
+    try:
+        _token_subject(credentials, revocations)
+    except HTTPException:
+        return False
+    return True
+
+
+def get_token_user_id(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> int:
+    """Claims-only auth: trust the signed token without touching the database.
+
+    Only for endpoints whose queries are all scoped by user_id, where a token
+    that outlives its user can at most read an empty result.
+    """
+    with timed_phase("auth_ms"):
+        user_id = _token_subject(credentials, request.app.state.session_revocations)
+    request.state.user_id = user_id
+    return user_id
+
+
+def get_current_identity(
+    request: Request,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> CachedUser:
+    """Verify the token's user still exists, answering from the identity cache when possible."""
+    with timed_phase("auth_ms"):
+        user_id = _token_subject(credentials, request.app.state.session_revocations)
+        user_cache = request.app.state.user_cache
+        identity = user_cache.get(user_id)
+        if identity is None:
+            row = db.execute(select(User.user_id, User.timezone).where(User.user_id == user_id)).one_or_none()
+            if row is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid token",
+                )
+            identity = CachedUser(user_id=row.user_id, timezone=row.timezone)
+            user_cache.put(identity)
+
+    request.state.user_id = identity.user_id
+    return identity
+
+
+def get_current_user(
+    request: Request,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> User:
+    with timed_phase("auth_ms"):
+        user_id = _token_subject(credentials, request.app.state.session_revocations)
+        # Set before the lookup so replica routing can see this user's recent writes.
+        request.state.user_id = user_id
+        user = db.execute(select(User).where(User.user_id == user_id)).scalar_one_or_none()
+        if user is None:
+            request.app.state.user_cache.invalidate(user_id)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token",
+            )
+
+    request.app.state.user_cache.put(CachedUser(user_id=user.user_id, timezone=user.timezone))
     return user
 
 
-def get_current_user_id(current_user: User = Depends(get_current_user)) -> int:
-    return current_user.user_id
+def get_current_user_id(identity: CachedUser = Depends(get_current_identity)) -> int:
+    return identity.user_id
+
+
+def resolve_client_timezone(client_timezone: str | None, fallback: str | None = None) -> ZoneInfo:
+    """Resolve the X-Client-Timezone header, falling back to a stored zone name, then UTC."""
+    if not client_timezone:
+        return ZoneInfo(fallback or "UTC")
+    try:
+        return ZoneInfo(client_timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid X-Client-Timezone header",
+        ) from None
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import time
+
+import anyio.to_thread
+from fastapi.routing import APIRoute
+
+from app.core.config import Settings, settings as default_settings
+from app.core.profiling import (
+    ProfileRequest,
+    current_profile,
+    profiled_call,
+    profiling_enabled,
+    save_profile,
+    should_profile,
+)
+from app.core.timing import RequestTimings, current_timings, timed_phase
+from app.db.consistency import CONSISTENCY_HEADER
+
+
+def _instrumented_call(call):
+    if asyncio.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def instrumented_async(*args, **kwargs):
+            with timed_phase("handler_ms"), profiled_call():
+                return await call(*args, **kwargs)
+
+        return instrumented_async
+
+    @functools.wraps(call)
+    def instrumented_sync(*args, **kwargs):
+        # Runs on the worker thread, so the profiler samples the thread doing the work.
+        with timed_phase("handler_ms"), profiled_call():
+            return call(*args, **kwargs)
+
+    return instrumented_sync
+
+
+class InstrumentedRoute(APIRoute):
+    """APIRoute adding an optional Server-Timing header, on-demand handler profiling and,
+    with read replicas configured, the consistency token of the request's writes.
+
+    Each request follows the settings of the app serving it (``app.state.settings``),
+    so routers can be shared by apps built with different configs. With all three
+    off the request goes straight to the stock handler.
+    """
+
+    def get_route_handler(self):
+        stock_handler = super().get_route_handler()
+        # Build a second handler around an instrumented copy of the endpoint, after FastAPI
+        # has analysed the original signature so dependency resolution still sees it.
+        stock_dependant = self.dependant
+        self.dependant = copy.copy(stock_dependant)
+        self.dependant.call = _instrumented_call(stock_dependant.call)
+        try:
+            handler = super().get_route_handler()
+        finally:
+            self.dependant = stock_dependant
+        route_path = self.path_format
+
+        async def instrumented_handler(request):
+            config: Settings = getattr(request.app.state, "settings", default_settings)
+            profiling = profiling_enabled(config)
+            if not config.server_timing_enabled and not profiling and not config.database_replica_urls:
+                return await stock_handler(request)
+
+            timings = RequestTimings() if config.server_timing_enabled else None
+            profile = (
+                ProfileRequest(config.profile_interval_ms / 1000.0)
+                if profiling and should_profile(config, request.scope, route_path)
+                else None
+            )
+            timings_token = current_timings.set(timings)
+            profile_token = current_profile.set(profile)
+            started = time.perf_counter()
+            try:
+                response = await handler(request)
+            finally:
+                current_profile.reset(profile_token)
+                current_timings.reset(timings_token)
+            if timings is not None:
+                response.headers["Server-Timing"] = timings.header((time.perf_counter() - started) * 1000.0)
+            consistency_token = getattr(request.state, "consistency_token", None)
+            if consistency_token is not None:
+                response.headers[CONSISTENCY_HEADER] = consistency_token
+            if profile is not None and profile.sampler is not None:
+                request_id = getattr(request.state, "request_id", None) or str(id(request))
+                response.headers["X-Profile-Id"] = await anyio.to_thread.run_sync(
+                    save_profile, profile.sampler, request_id, route_path, config.profile_dir
+                )
+            return response
+
+        return instrumented_handler
@@ -1,26 +1,91 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import anyio.to_thread
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from fastapi import Request
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
-from app.core.security import create_access_token, hash_password, verify_password
+from app.api.deps import get_current_user, resolve_client_timezone
+from app.api.routing import InstrumentedRoute
+from app.core.password_hashing import PasswordHashingUnavailable
+from app.core.security import create_access_token
 from app.db.models.user import User
 from app.db.session import get_db
-from app.schemas.auth import LoginRequest, MeResponse, SignupRequest, TokenResponse
+from app.schemas.auth import (
+    LoginRequest,
+    MeResponse,
+    MeUpdateRequest,
+    RefreshRequest,
+    SignupRequest,
+    TokenResponse,
+)
+from app.services.local_dates import rederive_local_dates
+from app.services.refresh_tokens import (
+    RefreshTokenRejected,
+    issue_refresh_token,
+    revoke_refresh_token,
+    rotate_refresh_token,
+)
 
-router = APIRouter(prefix="/v1/auth", tags=["auth"])
+router = APIRouter(prefix="/v1/auth", tags=["auth"], route_class=InstrumentedRoute)
 logger = logging.getLogger("athos.domain")
 
 
+def _hashing_unavailable(request: Request, event: str) -> HTTPException:
+    logger.warning(
+        "domain_event event=%s reason=hashing_unavailable request_id=%s",
+        event,
+        getattr(request.state, "request_id", None),
+    )
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _start_session(db: Session, user_id: int) -> TokenResponse:
+    family_id, refresh_token = issue_refresh_token(db, user_id)
+    db.commit()
+    return TokenResponse(
+        access_token=create_access_token(user_id, session_id=str(family_id)),
+        refresh_token=refresh_token,
+    )
+
+
+def _find_user(db: Session, email: str) -> User | None:
+    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+    # Don't hold a pooled connection while waiting on the hashing pool.
+    db.close()
+    return user
+
+
+def _insert_user(db: Session, user: User) -> None:
+    db.add(user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+    db.refresh(user)
+
+
+# Signup and login are async so a request waiting on bcrypt holds no worker thread;
+# their short database steps still run on the threadpool.
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def signup(payload: SignupRequest, request: Request, db: Session = Depends(get_db)):
+async def signup(
+    payload: SignupRequest,
+    request: Request,
+    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
+    db: Session = Depends(get_db),
+):
     email = payload.email.lower().strip()
+    # The signup client's zone becomes the default for workouts logged without a header.
+    default_timezone = payload.timezone or resolve_client_timezone(client_timezone).key
 
-    existing_user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+    existing_user = await anyio.to_thread.run_sync(_find_user, db, email)
     if existing_user is not None:
         logger.info(
             "domain_event event=signup_failed reason=email_conflict request_id=%s",
@@ -31,19 +96,23 @@ def signup(payload: SignupRequest, request: Request, db: Session = Depends(get_d
             detail="Email already in use",
         )
 
+    try:
+        password_hash = await request.app.state.password_hashing.hash_async(payload.password)
+    except PasswordHashingUnavailable:
+        raise _hashing_unavailable(request, "signup_failed") from None
+
     user = User(
         email=email,
         name=payload.name.strip(),
         birth_year=payload.birth_year,
         birth_month=payload.birth_month,
-        password_hash=hash_password(payload.password),
+        timezone=default_timezone,
+        password_hash=password_hash,
     )
 
-    db.add(user)
     try:
-        db.commit()
+        await anyio.to_thread.run_sync(_insert_user, db, user)
     except IntegrityError:
-        db.rollback()
         logger.info(
             "domain_event event=signup_failed reason=integrity_error request_id=%s",
             getattr(request.state, "request_id", None),
@@ -53,22 +122,29 @@ def signup(payload: SignupRequest, request: Request, db: Session = Depends(get_d
             detail="Email already in use",
         ) from None
 
-    db.refresh(user)
+    # Lets the session commit below pin this user's next reads to the primary (read-your-writes).
+    request.state.user_id = user.user_id
     logger.info(
         "domain_event event=signup_success user_id=%s request_id=%s",
         user.user_id,
         getattr(request.state, "request_id", None),
     )
-    token = create_access_token(user.user_id)
-    return TokenResponse(access_token=token)
+    return await anyio.to_thread.run_sync(_start_session, db, user.user_id)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)):
+async def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)):
     email = payload.email.lower().strip()
 
-    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
-    if user is None or not verify_password(payload.password, user.password_hash):
+    user = await anyio.to_thread.run_sync(_find_user, db, email)
+    try:
+        password_ok = user is not None and await request.app.state.password_hashing.verify_async(
+            payload.password, user.password_hash
+        )
+    except PasswordHashingUnavailable:
+        raise _hashing_unavailable(request, "login_failed") from None
+
+    if not password_ok:
         logger.info(
             "domain_event event=login_failed reason=invalid_credentials request_id=%s",
             getattr(request.state, "request_id", None),
@@ -78,21 +154,95 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
             detail="Invalid credentials",
         )
 
+    request.state.user_id = user.user_id
     logger.info(
         "domain_event event=login_success user_id=%s request_id=%s",
         user.user_id,
         getattr(request.state, "request_id", None),
     )
-    token = create_access_token(user.user_id)
-    return TokenResponse(access_token=token)
+    return await anyio.to_thread.run_sync(_start_session, db, user.user_id)
 
 
-@router.get("/me", response_model=MeResponse)
-def me(current_user: User = Depends(get_current_user)):
+@router.post("/refresh", response_model=TokenResponse)
+def refresh(payload: RefreshRequest, request: Request, db: Session = Depends(get_db)):
+    try:
+        user_id, family_id, refresh_token = rotate_refresh_token(db, payload.refresh_token)
+    except RefreshTokenRejected as exc:
+        # A reused token revokes its whole session; persist that before rejecting.
+        db.commit()
+        if exc.family_id is not None:
+            request.app.state.session_revocations.add(str(exc.family_id))
+        logger.info(
+            "domain_event event=refresh_failed reason=%s request_id=%s",
+            exc.reason,
+            getattr(request.state, "request_id", None),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        ) from None
+
+    db.commit()
+    logger.info(
+        "domain_event event=refresh_success user_id=%s request_id=%s",
+        user_id,
+        getattr(request.state, "request_id", None),
+    )
+    return TokenResponse(
+        access_token=create_access_token(user_id, session_id=str(family_id)),
+        refresh_token=refresh_token,
+    )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(payload: RefreshRequest, request: Request, db: Session = Depends(get_db)):
+    family_id = revoke_refresh_token(db, payload.refresh_token)
+    db.commit()
+    if family_id is not None:
+        request.app.state.session_revocations.add(str(family_id))
+    logger.info(
+        "domain_event event=logout revoked=%s request_id=%s",
+        family_id is not None,
+        getattr(request.state, "request_id", None),
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _me_response(current_user: User) -> MeResponse:
     return MeResponse(
         user_id=current_user.user_id,
         email=current_user.email,
         name=current_user.name,
         birth_year=current_user.birth_year,
         birth_month=current_user.birth_month,
+        timezone=current_user.timezone,
+    )
+
+
+@router.get("/me", response_model=MeResponse)
+def me(current_user: User = Depends(get_current_user)):
+    return _me_response(current_user)
+
+
+@router.patch("/me", response_model=MeResponse)
+def update_me(
+    payload: MeUpdateRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    rederived = 0
+    if current_user.timezone is None:
+        # Accounts from before users.timezone had their dates backfilled in UTC; redo those in the real zone.
+        rederived = rederive_local_dates(db, current_user.user_id, payload.timezone)
+    current_user.timezone = payload.timezone
+    db.commit()
+    # Only after commit, or a concurrent cache miss could re-cache the old timezone for the whole TTL.
+    request.app.state.user_cache.invalidate(current_user.user_id)
+    logger.info(
+        "domain_event event=user_updated user_id=%s rederived_workouts=%s request_id=%s",
+        current_user.user_id,
+        rederived,
+        getattr(request.state, "request_id", None),
     )
+    return _me_response(current_user)
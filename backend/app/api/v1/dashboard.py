@@ -1,23 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from datetime import date as date_cls
-from datetime import datetime, time, timedelta, timezone
+from datetime import timedelta
 import logging
 from uuid import UUID
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+import numpy as np
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user_id
-from app.db.models.cardio_session import CardioSession
+from app.api.deps import bearer_scheme, get_token_user_id, resolve_client_timezone, token_is_valid
+from app.api.routing import InstrumentedRoute
+from app.core.live_updates import TooManyStreams, sse_event
+from app.db.archive import ARCHIVE, HOT, StorageTier, may_be_archived
 from app.db.models.enums import Modality
 from app.db.models.exercise import Exercise
 from app.db.models.muscle_group import ExerciseMuscleMap, MuscleGroup
-from app.db.models.strength_set import StrengthSet
-from app.db.models.workout import Workout
 from app.db.session import get_db
 from app.schemas.dashboard import (
     CardioSessionDetailResponse,
@@ -26,121 +29,117 @@ from app.schemas.dashboard import (
     DayTelemetryResponse,
     MaxWeightPerExerciseResponse,
     MuscleGroupTrainingLoadResponse,
+    MuscleGroupTrendResponse,
     StrengthSetDashboardResponse,
+    TrainingLoadSeriesResponse,
+    TrainingLoadTrendsResponse,
     WorkoutDashboardItemResponse,
 )
+from app.services.training_load import (
+    ACUTE_WINDOW_DAYS,
+    CHRONIC_WINDOW_DAYS,
+    acute_chronic_ratio,
+    daily_load_matrix,
+    rolling_sum,
+    to_optional_floats,
+)
 
-router = APIRouter(prefix="/v1/dashboard", tags=["dashboard"])
+router = APIRouter(prefix="/v1/dashboard", tags=["dashboard"], route_class=InstrumentedRoute)
 logger = logging.getLogger("athos.domain")
 
-
-def _resolve_client_timezone(client_timezone: str | None) -> ZoneInfo:
-    if not client_timezone:
-        return ZoneInfo("UTC")
-    try:
-        return ZoneInfo(client_timezone)
-    except ZoneInfoNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Invalid X-Client-Timezone header",
-        ) from None
+MAX_TREND_DAYS = 5 * 366
+# Comment lines keep proxies from timing out idle streams; the token is re-checked at the same pace.
+STREAM_HEARTBEAT_SECONDS = 25.0
+STREAM_READY_TIMEOUT_SECONDS = 5.0
+STREAM_RETRY_MS = 5000
 
 
-@router.get("/day", response_model=DashboardDayResponse)
-def dashboard_day(
-    request: Request,
-    dashboard_date: date_cls = Query(..., alias="date"),
-    limit: int = Query(50, ge=1, le=200),
-    top_k: int = Query(10, ge=1, le=50),
-    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
-    db: Session = Depends(get_db),
-    current_user_id: int = Depends(get_current_user_id),
-):
-    tz = _resolve_client_timezone(client_timezone)
-    local_start = datetime.combine(dashboard_date, time.min, tzinfo=tz)
-    local_end = local_start + timedelta(days=1)
-    start_utc = local_start.astimezone(timezone.utc)
-    end_utc = local_end.astimezone(timezone.utc)
-
-    workouts = db.execute(
-        select(Workout)
+def _day_workouts_stmt(user_id: int, day: date_cls, limit: int, tier: StorageTier = HOT):
+    workouts = tier.workouts
+    return (
+        select(workouts)
         .where(
-            Workout.user_id == current_user_id,
-            Workout.start_ts >= start_utc,
-            Workout.start_ts < end_utc,
+            workouts.user_id == user_id,
+            workouts.local_date == day,
+            workouts.deleted_at.is_(None),
         )
-        .order_by(Workout.start_ts.desc())
+        .order_by(workouts.start_ts.desc())
         .limit(limit)
-    ).scalars().all()
+    )
 
-    workout_ids = [w.id for w in workouts]
-    if not workout_ids:
-        logger.info(
-            "domain_event event=dashboard_day_read user_id=%s date=%s workout_count=%s top_k=%s request_id=%s",
-            current_user_id,
-            dashboard_date.isoformat(),
-            0,
-            top_k,
-            getattr(request.state, "request_id", None),
-        )
-        return DashboardDayResponse(
-            workouts=[],
-            telemetry=DayTelemetryResponse(
-                total_training_load=0.0,
-                best_set_load=None,
-                best_set_exercise_name=None,
-                max_weight_per_exercise=[],
-                muscle_group_training_load=[],
-                cardio_totals=CardioTotalsResponse(
-                    total_distance_miles=0.0,
-                    total_duration_seconds=None,
-                ),
-            ),
-        )
 
-    strength_rows = db.execute(
-        select(StrengthSet, Exercise.name.label("exercise_name"))
-        .join(Exercise, Exercise.id == StrengthSet.exercise_id)
+def _day_strength_rows_stmt(user_id: int, workout_ids: list[UUID], tier: StorageTier = HOT):
+    strength_sets = tier.strength_sets
+    return (
+        select(strength_sets, Exercise.name.label("exercise_name"))
+        .join(Exercise, Exercise.id == strength_sets.exercise_id)
         .where(
-            StrengthSet.user_id == current_user_id,
-            StrengthSet.workout_id.in_(workout_ids),
-            Exercise.user_id == current_user_id,
+            strength_sets.user_id == user_id,
+            strength_sets.workout_id.in_(workout_ids),
+            strength_sets.deleted_at.is_(None),
+            Exercise.user_id == user_id,
         )
         .order_by(
-            StrengthSet.workout_id,
-            StrengthSet.set_index.is_(None),
-            StrengthSet.set_index.asc(),
-            StrengthSet.id.asc(),
+            strength_sets.workout_id,
+            strength_sets.set_index.is_(None),
+            strength_sets.set_index.asc(),
+            strength_sets.id.asc(),
         )
-    ).all()
+    )
 
-    cardio_rows = db.execute(
-        select(CardioSession)
+
+def _day_cardio_rows_stmt(user_id: int, workout_ids: list[UUID], tier: StorageTier = HOT):
+    cardio_sessions = tier.cardio_sessions
+    return select(cardio_sessions).where(
+        cardio_sessions.user_id == user_id,
+        cardio_sessions.workout_id.in_(workout_ids),
+    )
+
+
+def _muscle_mappings_stmt(exercise_ids: list[UUID]):
+    return (
+        select(
+            ExerciseMuscleMap.exercise_id,
+            ExerciseMuscleMap.is_primary,
+            MuscleGroup.name,
+        )
+        .join(MuscleGroup, MuscleGroup.id == ExerciseMuscleMap.muscle_group_id)
+        .where(ExerciseMuscleMap.exercise_id.in_(exercise_ids))
+    )
+
+
+def _trend_load_stmt(user_id: int, window_start: date_cls, end_date: date_cls, tier: StorageTier = HOT):
+    workouts, strength_sets = tier.workouts, tier.strength_sets
+    # Same load definition as dashboard_day: weight x reps, sets missing either are ignored.
+    return (
+        select(
+            workouts.local_date,
+            strength_sets.exercise_id,
+            func.sum(strength_sets.weight * strength_sets.reps).label("load"),
+        )
+        .join(workouts, workouts.id == strength_sets.workout_id)
         .where(
-            CardioSession.user_id == current_user_id,
-            CardioSession.workout_id.in_(workout_ids),
+            strength_sets.user_id == user_id,
+            workouts.user_id == user_id,
+            workouts.local_date >= window_start,
+            workouts.local_date <= end_date,
+            workouts.deleted_at.is_(None),
+            strength_sets.deleted_at.is_(None),
+            strength_sets.weight.is_not(None),
+            strength_sets.reps.is_not(None),
         )
-    ).scalars().all()
+        .group_by(workouts.local_date, strength_sets.exercise_id)
+    )
 
-    exercise_ids = list({set_row.exercise_id for set_row, _ in strength_rows})
+
+def _build_day_response(workouts, strength_rows, cardio_rows, mappings, top_k: int) -> DashboardDayResponse:
+    """Aggregate one day's rows into the dashboard response; pure, so it can be benchmarked without a database."""
     exercise_group_names: dict[UUID, list[str]] = defaultdict(list)
     exercise_primary_group_names: dict[UUID, list[str]] = defaultdict(list)
-
-    if exercise_ids:
-        mappings = db.execute(
-            select(
-                ExerciseMuscleMap.exercise_id,
-                ExerciseMuscleMap.is_primary,
-                MuscleGroup.name,
-            )
-            .join(MuscleGroup, MuscleGroup.id == ExerciseMuscleMap.muscle_group_id)
-            .where(ExerciseMuscleMap.exercise_id.in_(exercise_ids))
-        ).all()
-
-        for exercise_id, is_primary, muscle_group_name in mappings:
-            exercise_group_names[exercise_id].append(muscle_group_name)
-            if is_primary:
-                exercise_primary_group_names[exercise_id].append(muscle_group_name)
+    for exercise_id, is_primary, muscle_group_name in mappings:
+        exercise_group_names[exercise_id].append(muscle_group_name)
+        if is_primary:
+            exercise_primary_group_names[exercise_id].append(muscle_group_name)
 
     strength_by_workout: dict[UUID, list[StrengthSetDashboardResponse]] = defaultdict(list)
     cardio_by_workout: dict[UUID, CardioSessionDetailResponse] = {}
@@ -221,6 +220,7 @@ def dashboard_day(
                 title=workout.title,
                 start_ts=workout.start_ts,
                 end_ts=workout.end_ts,
+                local_date=workout.local_date,
                 source=workout.source,
                 provider=workout.provider,
                 client_uuid=workout.client_uuid,
@@ -258,12 +258,243 @@ def dashboard_day(
             total_duration_seconds=total_duration_seconds_value if has_duration else None,
         ),
     )
+    return DashboardDayResponse(workouts=workout_items, telemetry=telemetry)
+
+
+@router.get("/day", response_model=DashboardDayResponse)
+def dashboard_day(
+    request: Request,
+    dashboard_date: date_cls = Query(..., alias="date"),
+    limit: int = Query(50, ge=1, le=200),
+    top_k: int = Query(10, ge=1, le=50),
+    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    # Day membership is fixed by workouts.local_date at write time; the header is still validated.
+    resolve_client_timezone(client_timezone)
+
+    # A backdated write can land in the hot tables after its day was archived, so read both tiers.
+    tiers = (HOT, ARCHIVE) if may_be_archived(request.app.state.settings, dashboard_date) else (HOT,)
+    workouts = []
+    for tier in tiers:
+        workouts += db.execute(_day_workouts_stmt(current_user_id, dashboard_date, limit, tier)).scalars().all()
+    if len(tiers) > 1:
+        workouts = sorted(workouts, key=lambda workout: workout.start_ts, reverse=True)[:limit]
+
+    workout_ids = [w.id for w in workouts]
+    if not workout_ids:
+        logger.info(
+            "domain_event event=dashboard_day_read user_id=%s date=%s workout_count=%s top_k=%s request_id=%s",
+            current_user_id,
+            dashboard_date.isoformat(),
+            0,
+            top_k,
+            getattr(request.state, "request_id", None),
+        )
+        return DashboardDayResponse(
+            workouts=[],
+            telemetry=DayTelemetryResponse(
+                total_training_load=0.0,
+                best_set_load=None,
+                best_set_exercise_name=None,
+                max_weight_per_exercise=[],
+                muscle_group_training_load=[],
+                cardio_totals=CardioTotalsResponse(
+                    total_distance_miles=0.0,
+                    total_duration_seconds=None,
+                ),
+            ),
+        )
+
+    strength_rows, cardio_rows = [], []
+    for tier in tiers:
+        strength_rows += db.execute(_day_strength_rows_stmt(current_user_id, workout_ids, tier)).all()
+        cardio_rows += db.execute(_day_cardio_rows_stmt(current_user_id, workout_ids, tier)).scalars().all()
+
+    exercise_ids = list({set_row.exercise_id for set_row, _ in strength_rows})
+    mappings = db.execute(_muscle_mappings_stmt(exercise_ids)).all() if exercise_ids else []
+    response = _build_day_response(workouts, strength_rows, cardio_rows, mappings, top_k)
+
     logger.info(
         "domain_event event=dashboard_day_read user_id=%s date=%s workout_count=%s top_k=%s request_id=%s",
         current_user_id,
         dashboard_date.isoformat(),
-        len(workout_items),
+        len(response.workouts),
         top_k,
         getattr(request.state, "request_id", None),
     )
-    return DashboardDayResponse(workouts=workout_items, telemetry=telemetry)
+    return response
+
+
+def _load_series(daily: np.ndarray) -> list[TrainingLoadSeriesResponse]:
+    """Build one series per column of a days x columns load matrix (warm-up rows included)."""
+    acute = rolling_sum(daily, ACUTE_WINDOW_DAYS)
+    chronic = rolling_sum(daily, CHRONIC_WINDOW_DAYS)
+    ratio = acute_chronic_ratio(acute, chronic)
+
+    # Drop the chronic-window warm-up rows that precede the requested range.
+    warmup = CHRONIC_WINDOW_DAYS - 1
+    daily, acute, chronic, ratio = daily[warmup:], acute[warmup:], chronic[warmup:], ratio[warmup:]
+
+    return [
+        TrainingLoadSeriesResponse(
+            daily_load=np.round(daily[:, col], 2).tolist(),
+            rolling_7d_load=np.round(acute[:, col], 2).tolist(),
+            rolling_28d_load=np.round(chronic[:, col], 2).tolist(),
+            acute_chronic_ratio=to_optional_floats(ratio[:, col]),
+        )
+        for col in range(daily.shape[1])
+    ]
+
+
+@router.get("/trends", response_model=TrainingLoadTrendsResponse)
+def training_load_trends(
+    request: Request,
+    start_date: date_cls = Query(..., alias="start"),
+    end_date: date_cls = Query(..., alias="end"),
+    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="end must be on or after start",
+        )
+    day_count = (end_date - start_date).days + 1
+    if day_count > MAX_TREND_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Date range must not exceed {MAX_TREND_DAYS} days",
+        )
+
+    resolve_client_timezone(client_timezone)
+    window_start = start_date - timedelta(days=CHRONIC_WINDOW_DAYS - 1)
+    window_days = day_count + CHRONIC_WINDOW_DAYS - 1
+
+    load_rows = db.execute(_trend_load_stmt(current_user_id, window_start, end_date)).all()
+    if may_be_archived(request.app.state.settings, window_start):
+        # A (day, exercise) pair can have rows in both tiers; the matrix scatter adds them up.
+        load_rows += db.execute(_trend_load_stmt(current_user_id, window_start, end_date, ARCHIVE)).all()
+
+    exercise_ids = sorted({exercise_id for _, exercise_id, _ in load_rows})
+    exercise_column = {exercise_id: idx for idx, exercise_id in enumerate(exercise_ids)}
+
+    day_index = np.fromiter(
+        ((row_day - window_start).days for row_day, _, _ in load_rows),
+        dtype=np.int64,
+        count=len(load_rows),
+    )
+    column_index = np.fromiter(
+        (exercise_column[exercise_id] for _, exercise_id, _ in load_rows),
+        dtype=np.int64,
+        count=len(load_rows),
+    )
+    loads = np.fromiter((float(load) for _, _, load in load_rows), dtype=np.float64, count=len(load_rows))
+
+    by_exercise = daily_load_matrix(day_index, column_index, loads, window_days, len(exercise_ids))
+    (overall,) = _load_series(by_exercise.sum(axis=1, keepdims=True))
+
+    muscle_groups: list[MuscleGroupTrendResponse] = []
+    if exercise_ids:
+        mappings = db.execute(_muscle_mappings_stmt(exercise_ids)).all()
+
+        exercise_group_names: dict[UUID, list[str]] = defaultdict(list)
+        exercise_primary_group_names: dict[UUID, list[str]] = defaultdict(list)
+        for exercise_id, is_primary, muscle_group_name in mappings:
+            exercise_group_names[exercise_id].append(muscle_group_name)
+            if is_primary:
+                exercise_primary_group_names[exercise_id].append(muscle_group_name)
+
+        selected_groups_by_exercise = {
+            exercise_id: exercise_primary_group_names.get(exercise_id) or exercise_group_names.get(exercise_id, [])
+            for exercise_id in exercise_ids
+        }
+        group_names = sorted({name for names in selected_groups_by_exercise.values() for name in names})
+        group_column = {name: idx for idx, name in enumerate(group_names)}
+        attribution = np.zeros((len(exercise_ids), len(group_names)))
+        for exercise_id, selected_groups in selected_groups_by_exercise.items():
+            for muscle_group_name in selected_groups:
+                attribution[exercise_column[exercise_id], group_column[muscle_group_name]] = 1.0
+
+        by_group = by_exercise @ attribution
+        muscle_groups = [
+            MuscleGroupTrendResponse(muscle_group=name, **series.model_dump())
+            for name, series in zip(group_names, _load_series(by_group))
+        ]
+
+    logger.info(
+        "domain_event event=training_load_trends_read user_id=%s start=%s end=%s day_count=%s request_id=%s",
+        current_user_id,
+        start_date.isoformat(),
+        end_date.isoformat(),
+        day_count,
+        getattr(request.state, "request_id", None),
+    )
+    return TrainingLoadTrendsResponse(
+        start_date=start_date,
+        end_date=end_date,
+        dates=[start_date + timedelta(days=offset) for offset in range(day_count)],
+        overall=overall,
+        muscle_groups=muscle_groups,
+    )
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def dashboard_stream(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    """Server-sent events announcing which of the user's days changed; clients refetch those days.
+
+    Events are sent for committed writes only and a burst of writes is merged
+    into one event. A ``resync`` flag means changes may have been missed and
+    everything on screen should be refetched.
+    """
+    workout_changes = request.app.state.workout_changes
+    try:
+        subscriber = workout_changes.subscribe(current_user_id)
+    except TooManyStreams as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many live update streams",
+            headers={"Retry-After": str(STREAM_RETRY_MS // 1000)},
+        ) from exc
+    if not await workout_changes.wait_listening(STREAM_READY_TIMEOUT_SECONDS):
+        workout_changes.unsubscribe(subscriber)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live updates unavailable",
+            headers={"Retry-After": str(STREAM_RETRY_MS // 1000)},
+        )
+
+    request_id = getattr(request.state, "request_id", None)
+    logger.info("domain_event event=dashboard_stream_opened user_id=%s request_id=%s", current_user_id, request_id)
+
+    async def events():
+        try:
+            yield f"retry: {STREAM_RETRY_MS}\n".encode() + sse_event("ready", {})
+            while True:
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if not token_is_valid(credentials, request.app.state.session_revocations):
+                        yield sse_event("unauthorized", {})
+                        return
+                    yield b": keepalive\n\n"
+                    continue
+                dates, resync = subscriber.take()
+                yield sse_event("workouts_changed", {"dates": dates, "resync": resync})
+        finally:
+            workout_changes.unsubscribe(subscriber)
+            logger.info(
+                "domain_event event=dashboard_stream_closed user_id=%s request_id=%s", current_user_id, request_id
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
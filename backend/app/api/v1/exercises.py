@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import base64
+from datetime import date as date_cls
+from datetime import datetime
+import logging
+from typing import Literal
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+import numpy as np
+from sqlalchemy import and_, func, literal, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_token_user_id, resolve_client_timezone
+from app.api.routing import InstrumentedRoute
+from app.core.exercise_index import ExerciseName, normalize_name
+from app.db.archive import ARCHIVE, HOT, StorageTier
+from app.db.models.exercise import Exercise
+from app.db.session import get_db
+from app.schemas.exercises import (
+    ExerciseChartPointResponse,
+    ExerciseChartResponse,
+    ExerciseHistoryPageResponse,
+    ExerciseHistorySetResponse,
+    ExerciseSearchItemResponse,
+    ExerciseSearchResponse,
+)
+from app.services.downsampling import bucket_bounds, lttb_indices, reduce_max, reduce_sum
+from app.services.personal_records import estimated_1rm, estimated_1rm_sql
+
+router = APIRouter(prefix="/v1/exercises", tags=["exercises"], route_class=InstrumentedRoute)
+logger = logging.getLogger("athos.domain")
+
+# Shorter queries share too few trigrams with a name for fuzzy matches to mean much.
+FUZZY_MIN_QUERY_LENGTH = 3
+
+
+def _get_user_exercise(db: Session, user_id: int, exercise_id: UUID) -> Exercise:
+    exercise = db.execute(
+        select(Exercise).where(
+            Exercise.id == exercise_id,
+            Exercise.user_id == user_id,
+        )
+    ).scalar_one_or_none()
+    if exercise is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
+    return exercise
+
+
+def _user_exercise_names_stmt(user_id: int):
+    return select(Exercise.id, Exercise.name).where(Exercise.user_id == user_id, Exercise.is_active.is_(True))
+
+
+def _fuzzy_search_stmt(user_id: int, query: str, limit: int):
+    name = func.lower(Exercise.name)
+    # word_similarity scores the query against the best-matching stretch of the name, which suits
+    # partial input; "<%" applies pg_trgm.word_similarity_threshold through exercises_user_name_trgm.
+    return (
+        select(Exercise.id, Exercise.name)
+        .where(
+            Exercise.user_id == user_id,
+            Exercise.is_active.is_(True),
+            literal(query).op("<%")(name),
+        )
+        .order_by(func.word_similarity(query, name).desc(), Exercise.name)
+        .limit(limit)
+    )
+
+
+def _encode_cursor(performed_at: datetime, set_id: UUID) -> str:
+    raw = f"{performed_at.isoformat()}|{set_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        performed_at, set_id = raw.split("|", 1)
+        return datetime.fromisoformat(performed_at), UUID(set_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid cursor",
+        ) from None
+
+
+def _optional_float(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def _history_page_stmt(
+    user_id: int,
+    exercise_id: UUID,
+    cursor_position: tuple[datetime, UUID] | None,
+    limit: int,
+    tier: StorageTier = HOT,
+):
+    strength_sets = tier.strength_sets
+    # Keyset pagination, newest first, served by the (user_id, exercise_id, performed_at, id) index.
+    stmt = select(strength_sets).where(
+        strength_sets.user_id == user_id,
+        strength_sets.exercise_id == exercise_id,
+        strength_sets.deleted_at.is_(None),
+    )
+    if cursor_position is not None:
+        stmt = stmt.where(tuple_(strength_sets.performed_at, strength_sets.id) < tuple_(*cursor_position))
+    return stmt.order_by(strength_sets.performed_at.desc(), strength_sets.id.desc()).limit(limit)
+
+
+@router.get("/search", response_model=ExerciseSearchResponse)
+def search_exercises(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=255),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    """Typeahead over the user's exercise names: word-prefix matches from memory, topped up with fuzzy matches."""
+    exercise_prefixes = request.app.state.exercise_prefixes
+    index = exercise_prefixes.get(current_user_id)
+    if index is None:
+        rows = db.execute(_user_exercise_names_stmt(current_user_id)).all()
+        index = exercise_prefixes.put(current_user_id, (ExerciseName(id=row.id, name=row.name) for row in rows))
+
+    items = [
+        ExerciseSearchItemResponse(id=exercise.id, name=exercise.name, match="prefix")
+        for exercise in index.lookup(q, limit)
+    ]
+    query = normalize_name(q)
+    if len(items) < limit and len(query) >= FUZZY_MIN_QUERY_LENGTH:
+        seen = {item.id for item in items}
+        for row in db.execute(_fuzzy_search_stmt(current_user_id, query, limit)):
+            if row.id not in seen and len(items) < limit:
+                items.append(ExerciseSearchItemResponse(id=row.id, name=row.name, match="fuzzy"))
+
+    logger.info(
+        "domain_event event=exercise_search user_id=%s query_length=%s result_count=%s request_id=%s",
+        current_user_id,
+        len(query),
+        len(items),
+        getattr(request.state, "request_id", None),
+    )
+    return ExerciseSearchResponse(items=items)
+
+
+@router.get("/{exercise_id}/history", response_model=ExerciseHistoryPageResponse)
+def exercise_history(
+    exercise_id: UUID,
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    exercise = _get_user_exercise(db, current_user_id, exercise_id)
+    cursor_position = _decode_cursor(cursor) if cursor is not None else None
+
+    # Backdated writes can put hot sets among archived ones, so each page merges both tiers by the cursor key.
+    set_rows = []
+    for tier in (HOT, ARCHIVE):
+        set_rows += db.execute(
+            _history_page_stmt(current_user_id, exercise.id, cursor_position, limit + 1, tier)
+        ).scalars().all()
+    set_rows = sorted(set_rows, key=lambda set_row: (set_row.performed_at, set_row.id), reverse=True)[: limit + 1]
+
+    next_cursor = None
+    if len(set_rows) > limit:
+        set_rows = set_rows[:limit]
+        next_cursor = _encode_cursor(set_rows[-1].performed_at, set_rows[-1].id)
+
+    logger.info(
+        "domain_event event=exercise_history_read user_id=%s exercise_id=%s item_count=%s has_more=%s request_id=%s",
+        current_user_id,
+        exercise.id,
+        len(set_rows),
+        next_cursor is not None,
+        getattr(request.state, "request_id", None),
+    )
+    return ExerciseHistoryPageResponse(
+        exercise_id=exercise.id,
+        exercise_name=exercise.name,
+        items=[
+            ExerciseHistorySetResponse(
+                id=set_row.id,
+                workout_id=set_row.workout_id,
+                performed_at=set_row.performed_at,
+                set_index=set_row.set_index,
+                weight=set_row.weight,
+                reps=set_row.reps,
+                duration_seconds=set_row.duration_seconds,
+                rpe=set_row.rpe,
+                notes=set_row.notes,
+                estimated_1rm=(
+                    estimated_1rm(float(set_row.weight), set_row.reps)
+                    if set_row.weight is not None and set_row.reps is not None
+                    else None
+                ),
+            )
+            for set_row in set_rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/{exercise_id}/history/chart", response_model=ExerciseChartResponse)
+def exercise_history_chart(
+    exercise_id: UUID,
+    request: Request,
+    points: int = Query(300, ge=10, le=2000),
+    method: Literal["bucket", "lttb"] = Query("bucket"),
+    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    # Days are each workout's local_date, fixed at write time as for day reads; the header is still validated.
+    resolve_client_timezone(client_timezone)
+    exercise = _get_user_exercise(db, current_user_id, exercise_id)
+
+    # Whole history across both tiers, so the chart is unchanged by archiving.
+    history = union_all(
+        *(
+            select(tier.workouts.local_date, tier.strength_sets.weight, tier.strength_sets.reps)
+            .join(
+                tier.workouts,
+                and_(
+                    tier.workouts.user_id == tier.strength_sets.user_id,
+                    tier.workouts.id == tier.strength_sets.workout_id,
+                ),
+            )
+            .where(
+                tier.strength_sets.user_id == current_user_id,
+                tier.strength_sets.exercise_id == exercise.id,
+                tier.strength_sets.deleted_at.is_(None),
+                tier.workouts.deleted_at.is_(None),
+            )
+            for tier in (HOT, ARCHIVE)
+        )
+    ).subquery("history")
+    local_day = history.c.local_date.label("local_day")
+    day_rows = db.execute(
+        select(
+            local_day,
+            func.max(history.c.weight),
+            func.coalesce(func.sum(history.c.weight * history.c.reps), 0),
+            func.max(estimated_1rm_sql(history.c)),
+            func.count(),
+        )
+        .group_by(local_day)
+        .order_by(local_day)
+    ).all()
+
+    count = len(day_rows)
+    day_ordinals = np.fromiter((row[0].toordinal() for row in day_rows), dtype=np.int64, count=count)
+    max_weight = np.array([np.nan if row[1] is None else float(row[1]) for row in day_rows], dtype=np.float64)
+    volume = np.fromiter((float(row[2]) for row in day_rows), dtype=np.float64, count=count)
+    best_e1rm = np.array([np.nan if row[3] is None else float(row[3]) for row in day_rows], dtype=np.float64)
+    set_count = np.fromiter((row[4] for row in day_rows), dtype=np.int64, count=count)
+
+    period_days = 1
+    if count > points:
+        if method == "lttb":
+            keep = lttb_indices(day_ordinals.astype(np.float64), np.nan_to_num(max_weight), points)
+            day_ordinals, max_weight, volume, best_e1rm, set_count = (
+                day_ordinals[keep],
+                max_weight[keep],
+                volume[keep],
+                best_e1rm[keep],
+                set_count[keep],
+            )
+        else:
+            starts, day_ordinals, period_days = bucket_bounds(day_ordinals, points)
+            max_weight = reduce_max(max_weight, starts)
+            volume = reduce_sum(volume, starts)
+            best_e1rm = reduce_max(best_e1rm, starts)
+            set_count = reduce_sum(set_count, starts)
+
+    logger.info(
+        "domain_event event=exercise_chart_read user_id=%s exercise_id=%s method=%s source_points=%s points=%s request_id=%s",
+        current_user_id,
+        exercise.id,
+        method,
+        count,
+        len(day_ordinals),
+        getattr(request.state, "request_id", None),
+    )
+    return ExerciseChartResponse(
+        exercise_id=exercise.id,
+        exercise_name=exercise.name,
+        method=method,
+        period_days=period_days,
+        source_point_count=count,
+        points=[
+            ExerciseChartPointResponse(
+                date=date_cls.fromordinal(int(ordinal)),
+                max_weight=_optional_float(weight),
+                volume=round(float(period_volume), 2),
+                best_estimated_1rm=_optional_float(e1rm),
+                set_count=int(sets),
+            )
+            for ordinal, weight, period_volume, e1rm, sets in zip(
+                day_ordinals, max_weight, volume, best_e1rm, set_count
+            )
+        ],
+    )
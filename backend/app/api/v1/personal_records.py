@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_token_user_id
+from app.api.routing import InstrumentedRoute
+from app.db.models.exercise import Exercise
+from app.db.models.personal_record import PersonalRecord
+from app.db.session import get_db
+from app.schemas.personal_records import PersonalRecordResponse
+
+router = APIRouter(prefix="/v1/personal-records", tags=["personal-records"], route_class=InstrumentedRoute)
+logger = logging.getLogger("athos.domain")
+
+
+def _to_response(record: PersonalRecord, exercise_name: str) -> PersonalRecordResponse:
+    return PersonalRecordResponse(
+        exercise_id=record.exercise_id,
+        exercise_name=exercise_name,
+        max_weight=record.max_weight,
+        max_weight_achieved_at=record.max_weight_achieved_at,
+        best_set_load=record.best_set_load,
+        best_set_load_achieved_at=record.best_set_load_achieved_at,
+        best_estimated_1rm=record.best_estimated_1rm,
+        best_estimated_1rm_achieved_at=record.best_estimated_1rm_achieved_at,
+    )
+
+
+@router.get("", response_model=list[PersonalRecordResponse])
+def list_personal_records(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    rows = db.execute(
+        select(PersonalRecord, Exercise.name)
+        .join(Exercise, Exercise.id == PersonalRecord.exercise_id)
+        .where(
+            PersonalRecord.user_id == current_user_id,
+            PersonalRecord.max_weight.is_not(None),
+        )
+        .order_by(func.lower(Exercise.name))
+    ).all()
+
+    logger.info(
+        "domain_event event=personal_records_read user_id=%s record_count=%s request_id=%s",
+        current_user_id,
+        len(rows),
+        getattr(request.state, "request_id", None),
+    )
+    return [_to_response(record, exercise_name) for record, exercise_name in rows]
+
+
+@router.get("/{exercise_id}", response_model=PersonalRecordResponse)
+def get_personal_record(
+    exercise_id: UUID,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    row = db.execute(
+        select(PersonalRecord, Exercise.name)
+        .join(Exercise, Exercise.id == PersonalRecord.exercise_id)
+        .where(
+            PersonalRecord.user_id == current_user_id,
+            PersonalRecord.exercise_id == exercise_id,
+            PersonalRecord.max_weight.is_not(None),
+        )
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Personal record not found")
+
+    record, exercise_name = row
+    return _to_response(record, exercise_name)
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+from collections import Counter
 from datetime import date as date_cls
-from datetime import datetime, time, timedelta, timezone
+from datetime import datetime, timezone
 import logging
-from uuid import UUID
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from uuid import UUID, uuid4
+from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.responses import JSONResponse
-from sqlalchemy import func, select
+from sqlalchemy import String, and_, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user_id
+from app.api.deps import get_current_identity, get_token_user_id, resolve_client_timezone
+from app.api.routing import InstrumentedRoute
+from app.core.live_updates import notify_workouts_changed
+from app.core.user_cache import CachedUser
+from app.db.archive import ARCHIVE, HOT, StorageTier, may_be_archived
 from app.db.models.cardio_session import CardioSession
 from app.db.models.enums import Modality
 from app.db.models.exercise import Exercise
@@ -21,122 +27,139 @@ from app.db.models.workout import Workout
 from app.db.session import get_db
 from app.schemas.workouts import (
     CardioSessionDetailResponse,
+    PersonalRecordHitResponse,
     StrengthSetDetailResponse,
+    StrengthSetUpdateRequest,
     WorkoutCreateRequest,
+    WorkoutCalendarDayResponse,
     WorkoutCreateResponse,
     WorkoutDetailResponse,
     WorkoutListItemResponse,
+    WorkoutUpdateRequest,
 )
+from app.services.local_dates import adopt_timezone
+from app.services.personal_records import rebuild_personal_records, record_personal_bests
 
-router = APIRouter(prefix="/v1/workouts", tags=["workouts"])
+router = APIRouter(prefix="/v1/workouts", tags=["workouts"], route_class=InstrumentedRoute)
 logger = logging.getLogger("athos.domain")
 
 IDEMPOTENCY_CONSTRAINT = "uq_workouts_user_client_uuid_not_null"
-EXERCISE_NAME_UNIQUE_CONSTRAINT = "uq_exercises_user_name_lower"
-
-
-def _is_exercise_name_conflict(exc: IntegrityError) -> bool:
-    diag = getattr(exc.orig, "diag", None)
-    constraint_name = getattr(diag, "constraint_name", None)
-    if constraint_name == EXERCISE_NAME_UNIQUE_CONSTRAINT:
-        return True
-    return EXERCISE_NAME_UNIQUE_CONSTRAINT in str(exc.orig)
-
-
-def _get_or_create_exercise(
-    db: Session,
-    user_id: int,
-    exercise_id: UUID | None,
-    exercise_name: str | None,
-) -> Exercise:
-    if exercise_id is not None:
-        exercise = db.execute(
-            select(Exercise).where(
-                Exercise.id == exercise_id,
-                Exercise.user_id == user_id,
-            )
-        ).scalar_one_or_none()
-        if exercise is None:
+MAX_CALENDAR_DAYS = 366
+
+
+def _resolve_exercises(db: Session, user_id: int, set_payloads) -> tuple[list[Exercise], bool]:
+    """Resolve each set's exercise (by id, else by case-insensitive name) in a fixed number of queries.
+
+    Missing names are created with ON CONFLICT DO NOTHING, so a concurrent request
+    creating the same exercise is absorbed without aborting the workout transaction.
+    Also returns whether any were inserted, so the caller can drop the user's
+    search index once the transaction commits.
+    """
+    requested_ids = {set_payload.exercise_id for set_payload in set_payloads} - {None}
+    by_id: dict[UUID, Exercise] = {}
+    if requested_ids:
+        by_id = {
+            exercise.id: exercise
+            for exercise in db.execute(
+                select(Exercise).where(Exercise.user_id == user_id, Exercise.id.in_(requested_ids))
+            ).scalars()
+        }
+        if len(by_id) != len(requested_ids):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Exercise not found",
             )
-        return exercise
-
-    assert exercise_name is not None
-    normalized_name = exercise_name.strip()
 
-    exercise = db.execute(
-        select(Exercise).where(
-            Exercise.user_id == user_id,
-            func.lower(Exercise.name) == normalized_name.lower(),
+    # Postgres decides which spellings name the same exercise: Python's str.lower() differs from
+    # lower() for some letters (e.g. final sigma, dotted I), so names are never keyed by it.
+    spellings = list(
+        dict.fromkeys(
+            set_payload.exercise_name.strip() for set_payload in set_payloads if set_payload.exercise_id is None
         )
-    ).scalar_one_or_none()
-
-    if exercise is not None:
-        return exercise
+    )
 
-    # Concurrency-safe create-on-write:
-    # use a SAVEPOINT so unique conflicts on exercise name don't abort
-    # the outer workout transaction.
-    try:
-        with db.begin_nested():
-            exercise = Exercise(
-                user_id=user_id,
-                name=normalized_name,
-                default_modality=Modality.STRENGTH,
+    by_name: dict[str, Exercise] = {}
+    created = False
+    if spellings:
+        requested = values(column("name", String), name="requested_names").data([(name,) for name in spellings])
+        name_lookup = (
+            select(requested.c.name, Exercise)
+            .select_from(requested)
+            .join(
+                Exercise,
+                and_(Exercise.user_id == user_id, func.lower(Exercise.name) == func.lower(requested.c.name)),
             )
-            db.add(exercise)
-            db.flush()
-            return exercise
-    except IntegrityError as exc:
-        if not _is_exercise_name_conflict(exc):
-            raise
-
-    exercise = db.execute(
-        select(Exercise).where(
-            Exercise.user_id == user_id,
-            func.lower(Exercise.name) == normalized_name.lower(),
         )
-    ).scalar_one_or_none()
-    if exercise is not None:
-        return exercise
-    raise
+        by_name = {row.name: row.Exercise for row in db.execute(name_lookup)}
+        missing = [name for name in spellings if name not in by_name]
+        if missing:
+            # Rows are inserted in request order, so the first spelling of an exercise wins.
+            db.execute(
+                pg_insert(Exercise)
+                .values(
+                    [
+                        {
+                            "id": uuid4(),
+                            "user_id": user_id,
+                            "name": name,
+                            "default_modality": Modality.STRENGTH,
+                        }
+                        for name in missing
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+            created = True
+            by_name = {row.name: row.Exercise for row in db.execute(name_lookup)}
+        unresolved = [name for name in spellings if name not in by_name]
+        if unresolved:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Could not resolve exercise name {unresolved[0]!r}",
+            )
+
+    exercises = [
+        by_id[set_payload.exercise_id]
+        if set_payload.exercise_id is not None
+        else by_name[set_payload.exercise_name.strip()]
+        for set_payload in set_payloads
+    ]
+    return exercises, created
 
 
 def _is_idempotency_conflict(exc: IntegrityError) -> bool:
     diag = getattr(exc.orig, "diag", None)
     constraint_name = getattr(diag, "constraint_name", None)
-    if constraint_name == IDEMPOTENCY_CONSTRAINT:
+    # Postgres names the violated partition index (IDEMPOTENCY_CONSTRAINT + "_p<n>"), not the parent.
+    if constraint_name and constraint_name.startswith(IDEMPOTENCY_CONSTRAINT):
         return True
     return IDEMPOTENCY_CONSTRAINT in str(exc.orig)
 
 
-def _resolve_client_timezone(client_timezone: str | None) -> ZoneInfo:
-    if not client_timezone:
-        return ZoneInfo("UTC")
-    try:
-        return ZoneInfo(client_timezone)
-    except ZoneInfoNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Invalid X-Client-Timezone header",
-        ) from None
+def _local_date(start_ts: datetime, tz: ZoneInfo) -> date_cls:
+    # Naive timestamps are stored as UTC by the database session, so read them the same way.
+    if start_ts.tzinfo is None:
+        start_ts = start_ts.replace(tzinfo=timezone.utc)
+    return start_ts.astimezone(tz).date()
 
 
 @router.post("", response_model=WorkoutCreateResponse, status_code=status.HTTP_201_CREATED)
 def create_workout(
     payload: WorkoutCreateRequest,
     request: Request,
+    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
     db: Session = Depends(get_db),
-    current_user_id: int = Depends(get_current_user_id),
+    identity: CachedUser = Depends(get_current_identity),
 ):
+    current_user_id = identity.user_id
+    tz = resolve_client_timezone(client_timezone, identity.timezone)
     workout = Workout(
         user_id=current_user_id,
         workout_type=payload.workout_type,
         title=payload.title,
         start_ts=payload.start_ts,
         end_ts=payload.end_ts,
+        local_date=_local_date(payload.start_ts, tz),
         source=payload.source,
         provider=payload.provider,
         client_uuid=payload.client_uuid,
@@ -144,26 +167,30 @@ def create_workout(
 
     strength_count = 0
     cardio_created = False
+    personal_record_hits: list[PersonalRecordHitResponse] = []
+    timezone_adopted = False
+    exercises_created = False
 
     try:
+        # Users predating users.timezone take the zone of their first write that sends one.
+        if identity.timezone is None and client_timezone:
+            timezone_adopted = adopt_timezone(db, current_user_id, tz.key)
+
         db.add(workout)
         db.flush()
 
         if payload.strength_sets:
-            for idx, set_payload in enumerate(payload.strength_sets, start=1):
-                exercise = _get_or_create_exercise(
-                    db=db,
-                    user_id=current_user_id,
-                    exercise_id=set_payload.exercise_id,
-                    exercise_name=set_payload.exercise_name,
-                )
-
+            exercise_names: dict[UUID, str] = {}
+            performances: list[tuple[UUID, float | None, int | None]] = []
+            exercises, exercises_created = _resolve_exercises(db, current_user_id, payload.strength_sets)
+            for idx, (set_payload, exercise) in enumerate(zip(payload.strength_sets, exercises), start=1):
                 db.add(
                     StrengthSet(
                         user_id=current_user_id,
                         workout_id=workout.id,
                         exercise_id=exercise.id,
                         set_index=set_payload.set_index or idx,
+                        performed_at=workout.start_ts,
                         weight=set_payload.weight,
                         reps=set_payload.reps,
                         duration_seconds=set_payload.duration_seconds,
@@ -172,6 +199,19 @@ def create_workout(
                     )
                 )
                 strength_count += 1
+                exercise_names[exercise.id] = exercise.name
+                performances.append((exercise.id, set_payload.weight, set_payload.reps))
+
+            personal_record_hits = [
+                PersonalRecordHitResponse(
+                    exercise_id=hit.exercise_id,
+                    exercise_name=exercise_names[hit.exercise_id],
+                    max_weight=hit.max_weight,
+                    best_set_load=hit.best_set_load,
+                    best_estimated_1rm=hit.best_estimated_1rm,
+                )
+                for hit in record_personal_bests(db, current_user_id, workout.start_ts, performances)
+            ]
 
         elif payload.cardio_session is not None:
             db.add(
@@ -189,6 +229,7 @@ def create_workout(
             )
             cardio_created = True
 
+        notify_workouts_changed(db, current_user_id, workout.local_date)
         db.commit()
 
     except IntegrityError as exc:
@@ -200,6 +241,13 @@ def create_workout(
                     Workout.client_uuid == payload.client_uuid,
                 )
             ).scalar_one_or_none()
+            if existing_workout is not None and existing_workout.deleted_at is not None:
+                # The unique index still holds the deleted row's client_uuid, so the replay cannot be
+                # created again, and answering with its id would hand out a workout that reads as 404.
+                raise HTTPException(
+                    status_code=status.HTTP_410_GONE,
+                    detail="The workout created with this client_uuid was deleted",
+                ) from None
             if existing_workout is not None:
                 logger.info(
                     "domain_event event=workout_idempotency_hit user_id=%s workout_id=%s request_id=%s",
@@ -225,13 +273,19 @@ def create_workout(
         db.rollback()
         raise
 
+    if timezone_adopted:
+        request.app.state.user_cache.invalidate(current_user_id)
+    if exercises_created:
+        # Only after commit, or a concurrent search could cache an index without the new names.
+        request.app.state.exercise_prefixes.invalidate(current_user_id)
     logger.info(
-        "domain_event event=workout_created user_id=%s workout_id=%s workout_type=%s strength_set_count=%s cardio_session_created=%s start_ts_defaulted=%s request_id=%s",
+        "domain_event event=workout_created user_id=%s workout_id=%s workout_type=%s strength_set_count=%s cardio_session_created=%s personal_record_count=%s start_ts_defaulted=%s request_id=%s",
         current_user_id,
         workout.id,
         workout.workout_type.value,
         strength_count,
         cardio_created,
+        len(personal_record_hits),
         payload.start_ts_defaulted,
         getattr(request.state, "request_id", None),
     )
@@ -240,61 +294,98 @@ def create_workout(
         workout_type=workout.workout_type,
         strength_set_count=strength_count,
         cardio_session_created=cardio_created,
+        personal_records=personal_record_hits,
     )
 
 
-@router.get("", response_model=list[WorkoutListItemResponse])
-def list_workouts(
-    workout_date: date_cls = Query(..., alias="date"),
-    limit: int = Query(20, ge=1, le=200),
-    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
-    db: Session = Depends(get_db),
-    current_user_id: int = Depends(get_current_user_id),
-):
-    tz = _resolve_client_timezone(client_timezone)
-    local_start = datetime.combine(workout_date, time.min, tzinfo=tz)
-    local_end = local_start + timedelta(days=1)
-    start_utc = local_start.astimezone(timezone.utc)
-    end_utc = local_end.astimezone(timezone.utc)
-
-    strength_counts = (
-        select(
-            StrengthSet.workout_id.label("workout_id"),
-            func.count(StrengthSet.id).label("strength_set_count"),
+def _list_workouts_stmt(user_id: int, workout_date: date_cls, limit: int, tier: StorageTier = HOT):
+    workouts, strength_sets, cardio_sessions = tier.workouts, tier.strength_sets, tier.cardio_sessions
+    # Per-row correlated counts are evaluated only for the rows that survive the
+    # LIMIT, so cost tracks page size rather than the user's lifetime set count.
+    strength_set_count = (
+        select(func.count())
+        .where(
+            strength_sets.user_id == user_id,
+            strength_sets.workout_id == workouts.id,
+            strength_sets.deleted_at.is_(None),
         )
-        .where(StrengthSet.user_id == current_user_id)
-        .group_by(StrengthSet.workout_id)
-        .subquery()
+        .correlate(workouts)
+        .scalar_subquery()
     )
-
-    cardio_counts = (
-        select(
-            CardioSession.workout_id.label("workout_id"),
-            func.count(CardioSession.id).label("cardio_count"),
+    cardio_session_created = (
+        select(cardio_sessions.id)
+        .where(
+            cardio_sessions.user_id == user_id,
+            cardio_sessions.workout_id == workouts.id,
         )
-        .where(CardioSession.user_id == current_user_id)
-        .group_by(CardioSession.workout_id)
-        .subquery()
+        .correlate(workouts)
+        .exists()
     )
-
-    stmt = (
+    return (
         select(
-            Workout,
-            func.coalesce(strength_counts.c.strength_set_count, 0).label("strength_set_count"),
-            (func.coalesce(cardio_counts.c.cardio_count, 0) > 0).label("cardio_session_created"),
+            workouts,
+            strength_set_count.label("strength_set_count"),
+            cardio_session_created.label("cardio_session_created"),
         )
-        .outerjoin(strength_counts, strength_counts.c.workout_id == Workout.id)
-        .outerjoin(cardio_counts, cardio_counts.c.workout_id == Workout.id)
         .where(
-            Workout.user_id == current_user_id,
-            Workout.start_ts >= start_utc,
-            Workout.start_ts < end_utc,
+            workouts.user_id == user_id,
+            workouts.local_date == workout_date,
+            workouts.deleted_at.is_(None),
         )
-        .order_by(Workout.start_ts.desc())
+        .order_by(workouts.start_ts.desc())
         .limit(limit)
     )
 
-    rows = db.execute(stmt).all()
+
+def _workout_strength_rows_stmt(user_id: int, workout_id: UUID, tier: StorageTier = HOT):
+    strength_sets = tier.strength_sets
+    return (
+        select(strength_sets, Exercise.name.label("exercise_name"))
+        .join(Exercise, Exercise.id == strength_sets.exercise_id)
+        .where(
+            strength_sets.workout_id == workout_id,
+            strength_sets.user_id == user_id,
+            strength_sets.deleted_at.is_(None),
+        )
+        .order_by(
+            strength_sets.set_index.is_(None),
+            strength_sets.set_index.asc(),
+            strength_sets.id.asc(),
+        )
+    )
+
+
+def _calendar_counts_stmt(user_id: int, start_date: date_cls, end_date: date_cls, tier: StorageTier = HOT):
+    workouts = tier.workouts
+    return (
+        select(workouts.local_date, func.count())
+        .where(
+            workouts.user_id == user_id,
+            workouts.local_date >= start_date,
+            workouts.local_date <= end_date,
+            workouts.deleted_at.is_(None),
+        )
+        .group_by(workouts.local_date)
+    )
+
+
+@router.get("", response_model=list[WorkoutListItemResponse])
+def list_workouts(
+    request: Request,
+    workout_date: date_cls = Query(..., alias="date"),
+    limit: int = Query(20, ge=1, le=200),
+    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    # Day membership is fixed by workouts.local_date at write time; the header is still validated.
+    resolve_client_timezone(client_timezone)
+
+    rows = db.execute(_list_workouts_stmt(current_user_id, workout_date, limit)).all()
+    if may_be_archived(request.app.state.settings, workout_date):
+        # A backdated write can land in the hot tables after its day was archived, so read both tiers.
+        rows += db.execute(_list_workouts_stmt(current_user_id, workout_date, limit, ARCHIVE)).all()
+        rows = sorted(rows, key=lambda row: row[0].start_ts, reverse=True)[:limit]
     return [
         WorkoutListItemResponse(
             id=workout.id,
@@ -302,6 +393,7 @@ def list_workouts(
             title=workout.title,
             start_ts=workout.start_ts,
             end_ts=workout.end_ts,
+            local_date=workout.local_date,
             source=workout.source,
             provider=workout.provider,
             client_uuid=workout.client_uuid,
@@ -312,38 +404,68 @@ def list_workouts(
     ]
 
 
-@router.get("/{workout_id}", response_model=WorkoutDetailResponse)
-def get_workout(
-    workout_id: UUID,
+@router.get("/calendar", response_model=list[WorkoutCalendarDayResponse])
+def workout_calendar(
+    request: Request,
+    start_date: date_cls = Query(..., alias="start"),
+    end_date: date_cls = Query(..., alias="end"),
     db: Session = Depends(get_db),
-    current_user_id: int = Depends(get_current_user_id),
+    current_user_id: int = Depends(get_token_user_id),
 ):
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="end must be on or after start",
+        )
+    if (end_date - start_date).days >= MAX_CALENDAR_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Date range must not exceed {MAX_CALENDAR_DAYS} days",
+        )
+
+    # A day can have workouts in both tiers (backdated writes after archiving), so counts are added.
+    tiers = (HOT, ARCHIVE) if may_be_archived(request.app.state.settings, start_date) else (HOT,)
+    counts: Counter[date_cls] = Counter()
+    for tier in tiers:
+        for local_date, workout_count in db.execute(
+            _calendar_counts_stmt(current_user_id, start_date, end_date, tier)
+        ).all():
+            counts[local_date] += workout_count
+    rows = sorted(counts.items())
+
+    logger.info(
+        "domain_event event=workout_calendar_read user_id=%s start=%s end=%s active_days=%s request_id=%s",
+        current_user_id,
+        start_date.isoformat(),
+        end_date.isoformat(),
+        len(rows),
+        getattr(request.state, "request_id", None),
+    )
+    return [
+        WorkoutCalendarDayResponse(date=local_date, workout_count=int(workout_count))
+        for local_date, workout_count in rows
+    ]
+
+
+def _workout_detail(
+    db: Session, user_id: int, workout_id: UUID, tier: StorageTier = HOT
+) -> WorkoutDetailResponse | None:
+    workouts, cardio_sessions = tier.workouts, tier.cardio_sessions
     workout = db.execute(
-        select(Workout).where(
-            Workout.id == workout_id,
-            Workout.user_id == current_user_id,
+        select(workouts).where(
+            workouts.id == workout_id,
+            workouts.user_id == user_id,
+            workouts.deleted_at.is_(None),
         )
     ).scalar_one_or_none()
     if workout is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
+        return None
 
     strength_sets: list[StrengthSetDetailResponse] = []
     cardio_session: CardioSessionDetailResponse | None = None
 
     if workout.workout_type == Modality.STRENGTH:
-        strength_rows = db.execute(
-            select(StrengthSet, Exercise.name.label("exercise_name"))
-            .join(Exercise, Exercise.id == StrengthSet.exercise_id)
-            .where(
-                StrengthSet.workout_id == workout.id,
-                StrengthSet.user_id == current_user_id,
-            )
-            .order_by(
-                StrengthSet.set_index.is_(None),
-                StrengthSet.set_index.asc(),
-                StrengthSet.id.asc(),
-            )
-        ).all()
+        strength_rows = db.execute(_workout_strength_rows_stmt(user_id, workout.id, tier)).all()
         strength_sets = [
             StrengthSetDetailResponse(
                 id=set_row.id,
@@ -361,9 +483,9 @@ def get_workout(
         ]
     elif workout.workout_type == Modality.CARDIO:
         cardio = db.execute(
-            select(CardioSession).where(
-                CardioSession.workout_id == workout.id,
-                CardioSession.user_id == current_user_id,
+            select(cardio_sessions).where(
+                cardio_sessions.workout_id == workout.id,
+                cardio_sessions.user_id == user_id,
             )
         ).scalar_one_or_none()
         if cardio is not None:
@@ -385,9 +507,302 @@ def get_workout(
         title=workout.title,
         start_ts=workout.start_ts,
         end_ts=workout.end_ts,
+        local_date=workout.local_date,
         source=workout.source,
         provider=workout.provider,
         client_uuid=workout.client_uuid,
+        version=workout.version,
         strength_sets=strength_sets,
         cardio_session=cardio_session,
     )
+
+
+@router.get("/{workout_id}", response_model=WorkoutDetailResponse)
+def get_workout(
+    workout_id: UUID,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    # An id missing from the hot tables may belong to a workout moved to the archive.
+    detail = _workout_detail(db, current_user_id, workout_id) or _workout_detail(
+        db, current_user_id, workout_id, ARCHIVE
+    )
+    if detail is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
+    response.headers["ETag"] = _etag(detail.version)
+    return detail
+
+
+def _etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _expected_version(if_match: str | None, required: bool) -> int | None:
+    """The workout version an If-Match header names; edits without one could overwrite unseen changes."""
+    if if_match is None:
+        if required:
+            raise HTTPException(
+                status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+                detail="If-Match header with the workout ETag is required",
+            )
+        return None
+    value = if_match.strip().removeprefix("W/").strip('"')
+    if not value.isdigit():
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="If-Match does not match")
+    return int(value)
+
+
+def _missing_or_stale(db: Session, user_id: int, workout_id: UUID) -> HTTPException:
+    """Explain why a version-checked update of a live workout matched no row; the caller rolls back."""
+    current_version = db.execute(
+        select(Workout.version).where(
+            Workout.user_id == user_id,
+            Workout.id == workout_id,
+            Workout.deleted_at.is_(None),
+        )
+    ).scalar_one_or_none()
+    if current_version is None:
+        # Archived workouts are read-only, so they are not found here either.
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Workout was modified by another request",
+        headers={"ETag": _etag(current_version)},
+    )
+
+
+def _update_workout_row(
+    db: Session, user_id: int, workout_id: UUID, expected_version: int | None, **values
+) -> tuple[int, date_cls]:
+    """Update one live workout row and bump its version, checking expected_version when given.
+
+    Returns the new version and the workout's (updated) local date.
+    The row lock taken here also serializes concurrent edits of the workout's sets.
+    """
+    conditions = [Workout.user_id == user_id, Workout.id == workout_id, Workout.deleted_at.is_(None)]
+    if expected_version is not None:
+        conditions.append(Workout.version == expected_version)
+    row = db.execute(
+        update(Workout)
+        .where(*conditions)
+        .values(**values, version=Workout.version + 1)
+        .returning(Workout.version, Workout.local_date)
+    ).one_or_none()
+    if row is None:
+        raise _missing_or_stale(db, user_id, workout_id)
+    return row.version, row.local_date
+
+
+@router.patch("/{workout_id}", response_model=WorkoutDetailResponse)
+def update_workout(
+    workout_id: UUID,
+    payload: WorkoutUpdateRequest,
+    request: Request,
+    response: Response,
+    if_match: str | None = Header(default=None, alias="If-Match"),
+    client_timezone: str | None = Header(default=None, alias="X-Client-Timezone"),
+    db: Session = Depends(get_db),
+    identity: CachedUser = Depends(get_current_identity),
+):
+    current_user_id = identity.user_id
+    expected_version = _expected_version(if_match, required=True)
+    changes = payload.model_dump(include=payload.model_fields_set)
+    if "start_ts" in changes:
+        tz = resolve_client_timezone(client_timezone, identity.timezone)
+        changes["local_date"] = _local_date(payload.start_ts, tz)
+
+    try:
+        previous_date = None
+        if "start_ts" in changes:
+            previous_date = db.execute(
+                select(Workout.local_date).where(Workout.user_id == current_user_id, Workout.id == workout_id)
+            ).scalar_one_or_none()
+        new_version, local_date = _update_workout_row(db, current_user_id, workout_id, expected_version, **changes)
+        if "start_ts" in changes:
+            # Sets carry a copy of start_ts, and records remember when they were set.
+            exercise_ids = db.execute(
+                update(StrengthSet)
+                .where(
+                    StrengthSet.user_id == current_user_id,
+                    StrengthSet.workout_id == workout_id,
+                    StrengthSet.deleted_at.is_(None),
+                )
+                .values(performed_at=payload.start_ts)
+                .returning(StrengthSet.exercise_id)
+            ).scalars().all()
+            if exercise_ids:
+                rebuild_personal_records(db, current_user_id, sorted(set(exercise_ids)))
+        notify_workouts_changed(db, current_user_id, previous_date, local_date)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "domain_event event=workout_updated user_id=%s workout_id=%s fields=%s version=%s request_id=%s",
+        current_user_id,
+        workout_id,
+        ",".join(sorted(payload.model_fields_set)),
+        new_version,
+        getattr(request.state, "request_id", None),
+    )
+    response.headers["ETag"] = _etag(new_version)
+    return _workout_detail(db, current_user_id, workout_id)
+
+
+@router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_workout(
+    workout_id: UUID,
+    request: Request,
+    if_match: str | None = Header(default=None, alias="If-Match"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    expected_version = _expected_version(if_match, required=False)
+    try:
+        _, local_date = _update_workout_row(db, current_user_id, workout_id, expected_version, deleted_at=func.now())
+        exercise_ids = db.execute(
+            update(StrengthSet)
+            .where(
+                StrengthSet.user_id == current_user_id,
+                StrengthSet.workout_id == workout_id,
+                StrengthSet.deleted_at.is_(None),
+            )
+            .values(deleted_at=func.now())
+            .returning(StrengthSet.exercise_id)
+        ).scalars().all()
+        if exercise_ids:
+            rebuild_personal_records(db, current_user_id, sorted(set(exercise_ids)))
+        notify_workouts_changed(db, current_user_id, local_date)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "domain_event event=workout_deleted user_id=%s workout_id=%s strength_set_count=%s request_id=%s",
+        current_user_id,
+        workout_id,
+        len(exercise_ids),
+        getattr(request.state, "request_id", None),
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.patch("/{workout_id}/sets/{set_id}", response_model=StrengthSetDetailResponse)
+def update_strength_set(
+    workout_id: UUID,
+    set_id: UUID,
+    payload: StrengthSetUpdateRequest,
+    request: Request,
+    response: Response,
+    if_match: str | None = Header(default=None, alias="If-Match"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    expected_version = _expected_version(if_match, required=True)
+    changes = payload.model_dump(include=payload.model_fields_set)
+
+    try:
+        if "exercise_id" in changes:
+            exercise_found = db.execute(
+                select(Exercise.id).where(Exercise.user_id == current_user_id, Exercise.id == payload.exercise_id)
+            ).scalar_one_or_none()
+            if exercise_found is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
+
+        new_version, local_date = _update_workout_row(db, current_user_id, workout_id, expected_version)
+        previous_exercise_id = db.execute(
+            select(StrengthSet.exercise_id).where(
+                StrengthSet.user_id == current_user_id,
+                StrengthSet.workout_id == workout_id,
+                StrengthSet.id == set_id,
+                StrengthSet.deleted_at.is_(None),
+            )
+        ).scalar_one_or_none()
+        if previous_exercise_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Strength set not found")
+
+        set_row = db.execute(
+            update(StrengthSet)
+            .where(StrengthSet.user_id == current_user_id, StrengthSet.id == set_id)
+            .values(**changes)
+            .returning(StrengthSet)
+        ).scalar_one()
+        if changes.keys() & {"exercise_id", "weight", "reps"}:
+            rebuild_personal_records(
+                db, current_user_id, sorted({previous_exercise_id, set_row.exercise_id})
+            )
+        exercise_name = db.execute(select(Exercise.name).where(Exercise.id == set_row.exercise_id)).scalar_one()
+        notify_workouts_changed(db, current_user_id, local_date)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "domain_event event=strength_set_updated user_id=%s workout_id=%s set_id=%s fields=%s version=%s request_id=%s",
+        current_user_id,
+        workout_id,
+        set_id,
+        ",".join(sorted(payload.model_fields_set)),
+        new_version,
+        getattr(request.state, "request_id", None),
+    )
+    response.headers["ETag"] = _etag(new_version)
+    return StrengthSetDetailResponse(
+        id=set_row.id,
+        workout_id=set_row.workout_id,
+        exercise_id=set_row.exercise_id,
+        exercise_name=exercise_name,
+        set_index=set_row.set_index,
+        weight=set_row.weight,
+        reps=set_row.reps,
+        duration_seconds=set_row.duration_seconds,
+        rpe=set_row.rpe,
+        notes=set_row.notes,
+    )
+
+
+@router.delete("/{workout_id}/sets/{set_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_strength_set(
+    workout_id: UUID,
+    set_id: UUID,
+    request: Request,
+    if_match: str | None = Header(default=None, alias="If-Match"),
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_token_user_id),
+):
+    expected_version = _expected_version(if_match, required=False)
+    try:
+        new_version, local_date = _update_workout_row(db, current_user_id, workout_id, expected_version)
+        exercise_id = db.execute(
+            update(StrengthSet)
+            .where(
+                StrengthSet.user_id == current_user_id,
+                StrengthSet.workout_id == workout_id,
+                StrengthSet.id == set_id,
+                StrengthSet.deleted_at.is_(None),
+            )
+            .values(deleted_at=func.now())
+            .returning(StrengthSet.exercise_id)
+        ).scalar_one_or_none()
+        if exercise_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Strength set not found")
+        rebuild_personal_records(db, current_user_id, [exercise_id])
+        notify_workouts_changed(db, current_user_id, local_date)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "domain_event event=strength_set_deleted user_id=%s workout_id=%s set_id=%s version=%s request_id=%s",
+        current_user_id,
+        workout_id,
+        set_id,
+        new_version,
+        getattr(request.state, "request_id", None),
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers={"ETag": _etag(new_version)})
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_list(name: str) -> tuple[str, ...]:
+    return tuple(item.strip() for item in os.getenv(name, "").split(",") if item.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Process-wide runtime settings, read from the environment once at import."""
+
+    database_url: str | None
+    # Streaming replicas for GET handlers; empty sends everything to database_url.
+    database_replica_urls: tuple[str, ...]
+    # After a user's write their reads stay on the primary until a replica has replayed it, at most this long.
+    read_your_writes_seconds: float
+    # Workouts whose local date is this many days old are moved to the archive schema by
+    # app.jobs.archive_workouts; reads for older dates or unknown ids fall back to it.
+    archive_after_days: int
+    # Persistent connections kept open per process, plus burst connections beyond that.
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_timeout_seconds: float
+    db_pool_recycle_seconds: int
+    # "always" issues a liveness check on every checkout; "never" relies on db_pool_recycle_seconds.
+    db_pre_ping: str
+    # Transaction-pooling PgBouncer cannot keep server-side prepared statements between transactions.
+    db_pgbouncer: bool
+    # Revoked refresh-token families are pulled from the database this often.
+    revocation_poll_seconds: float
+    # bcrypt process pool: worker processes, jobs queued or running at once, and how long a caller waits.
+    password_hash_workers: int
+    password_hash_max_pending: int
+    password_hash_timeout_seconds: float
+    # Sync endpoints run on this many threads; None sizes it to the connection pool.
+    worker_threads: int | None
+    # Per-user token buckets on the write and dashboard endpoints (see app.main.RATE_LIMIT_RULES).
+    rate_limit_enabled: bool
+    # Adds a Server-Timing header with per-phase durations and the SQL query count to API responses.
+    server_timing_enabled: bool
+    # Open live-update streams (GET /v1/dashboard/stream) per process; each holds an idle HTTP connection.
+    live_updates_max_subscribers: int
+    # Verified identities (user id and timezone) cached per process, so most requests skip the users lookup.
+    auth_user_cache_ttl_seconds: float
+    auth_user_cache_max_entries: int
+    # Per-user exercise name indexes behind GET /v1/exercises/search; other processes' new exercises
+    # show up after the TTL. At most exercise_index_max_users users are kept (0 disables the cache).
+    exercise_index_ttl_seconds: float
+    exercise_index_max_users: int
+    # Requests sending X-Profile-Token with this value are profiled; unset disables the header.
+    profile_token: str | None
+    # Fraction of requests to profile on profile_routes (all routes when empty).
+    profile_sample_rate: float
+    profile_routes: tuple[str, ...]
+    profile_interval_ms: float
+    profile_dir: str
+
+    @classmethod
+    def from_env(cls) -> Settings:
+        pre_ping = os.getenv("DB_PRE_PING", "always").strip().lower()
+        if pre_ping not in {"always", "never"}:
+            raise RuntimeError("DB_PRE_PING must be 'always' or 'never'")
+        worker_threads = os.getenv("WORKER_THREADS")
+        archive_after_days = int(os.getenv("ARCHIVE_AFTER_DAYS", 730))
+        if archive_after_days < 1:
+            raise RuntimeError("ARCHIVE_AFTER_DAYS must be at least 1")
+        return cls(
+            database_url=os.getenv("DATABASE_URL"),
+            database_replica_urls=_env_list("DATABASE_REPLICA_URLS"),
+            read_your_writes_seconds=float(os.getenv("READ_YOUR_WRITES_SECONDS", 5)),
+            archive_after_days=archive_after_days,
+            db_pool_size=int(os.getenv("DB_POOL_SIZE", 10)),
+            db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+            db_pool_timeout_seconds=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", 10)),
+            db_pool_recycle_seconds=int(os.getenv("DB_POOL_RECYCLE_SECONDS", 1800)),
+            db_pre_ping=pre_ping,
+            db_pgbouncer=_env_bool("DB_PGBOUNCER", False),
+            revocation_poll_seconds=float(os.getenv("REVOCATION_POLL_SECONDS", 5)),
+            password_hash_workers=int(os.getenv("PASSWORD_HASH_WORKERS", 2)),
+            password_hash_max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", 16)),
+            password_hash_timeout_seconds=float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", 10)),
+            worker_threads=int(worker_threads) if worker_threads else None,
+            rate_limit_enabled=_env_bool("RATE_LIMIT_ENABLED", True),
+            server_timing_enabled=_env_bool("SERVER_TIMING_ENABLED", False),
+            live_updates_max_subscribers=int(os.getenv("LIVE_UPDATES_MAX_SUBSCRIBERS", 10000)),
+            auth_user_cache_ttl_seconds=float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", 60)),
+            auth_user_cache_max_entries=int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", 10000)),
+            exercise_index_ttl_seconds=float(os.getenv("EXERCISE_INDEX_TTL_SECONDS", 60)),
+            exercise_index_max_users=int(os.getenv("EXERCISE_INDEX_MAX_USERS", 10000)),
+            profile_token=os.getenv("PROFILE_TOKEN") or None,
+            profile_sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", 0)),
+            profile_routes=_env_list("PROFILE_ROUTES"),
+            profile_interval_ms=float(os.getenv("PROFILE_INTERVAL_MS", 2)),
+            profile_dir=os.getenv("PROFILE_DIR", "/tmp/athos-profiles"),
+        )
+
+
+settings = Settings.from_env()
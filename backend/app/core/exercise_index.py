@@ -0,0 +1,72 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+import re
+from typing import Iterable
+from uuid import UUID
+
+from app.core.ttl_cache import TTLCache
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase and collapse punctuation/whitespace runs, so "T-Bar  Row" and "t bar row" compare equal."""
+    return " ".join(_SEPARATORS.sub(" ", name.lower()).split())
+
+
+@dataclass(frozen=True)
+class ExerciseName:
+    id: UUID
+    name: str
+
+
+class ExercisePrefixIndex:
+    """Sorted name keys for one user's exercises, answering prefix queries with a bisect.
+
+    Whole names are searched first, then the names from their second word on,
+    so "press" finds "Bench Press" after anything starting with "press". Each
+    lookup costs O(log n + limit) however many exercises the user has.
+    """
+
+    def __init__(self, exercises: Iterable[ExerciseName]):
+        names: list[tuple[str, ExerciseName]] = []
+        words: list[tuple[str, ExerciseName]] = []
+        for exercise in exercises:
+            parts = normalize_name(exercise.name).split(" ")
+            names.append((" ".join(parts), exercise))
+            words.extend((" ".join(parts[start:]), exercise) for start in range(1, len(parts)))
+        names.sort(key=lambda entry: (entry[0], entry[1].name))
+        words.sort(key=lambda entry: (entry[0], entry[1].name))
+        self._name_keys = [key for key, _ in names]
+        self._names = [exercise for _, exercise in names]
+        self._word_keys = [key for key, _ in words]
+        self._words = [exercise for _, exercise in words]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def lookup(self, prefix: str, limit: int) -> list[ExerciseName]:
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return []
+        matches: dict[UUID, ExerciseName] = {}
+        for keys, exercises in ((self._name_keys, self._names), (self._word_keys, self._words)):
+            position = bisect_left(keys, prefix)
+            while position < len(keys) and len(matches) < limit and keys[position].startswith(prefix):
+                exercise = exercises[position]
+                matches.setdefault(exercise.id, exercise)
+                position += 1
+        return list(matches.values())
+
+
+class ExercisePrefixCache(TTLCache[int, ExercisePrefixIndex]):
+    """Per-user prefix indexes in a TTL-bounded LRU.
+
+    Writers invalidate a user's entry after committing new exercises; the TTL
+    bounds staleness for exercises added through other processes.
+    """
+
+    def put(self, user_id: int, exercises: Iterable[ExerciseName]) -> ExercisePrefixIndex:
+        index = ExercisePrefixIndex(exercises)
+        self.set(user_id, index)
+        return index
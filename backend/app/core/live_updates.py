@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import json
+import logging
+import threading
+
+import psycopg
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.session import Database
+
+logger = logging.getLogger("athos.live")
+
+# Postgres channel carrying {"user_id": ..., "dates": [...]} after each committed workout change.
+CHANNEL = "workout_changes"
+MAX_STREAMS_PER_USER = 8
+LISTEN_POLL_SECONDS = 1.0
+RECONNECT_SECONDS = 2.0
+
+
+def notify_workouts_changed(db: Session, user_id: int, *local_dates) -> None:
+    """Queue a change notification in the caller's transaction; Postgres delivers it on commit only."""
+    dates = sorted({day.isoformat() for day in local_dates if day is not None})
+    payload = json.dumps({"user_id": user_id, "dates": dates}, separators=(",", ":"))
+    db.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+@dataclass(eq=False)
+class Subscriber:
+    """One open stream. Changes arriving before the stream wakes are merged, so a burst is one event."""
+
+    user_id: int
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    pending_dates: set[str] = field(default_factory=set)
+    # Set when notifications may have been missed (listener reconnect); the client should refetch.
+    resync: bool = False
+
+    def take(self) -> tuple[list[str], bool]:
+        dates, resync = sorted(self.pending_dates), self.resync
+        self.pending_dates.clear()
+        self.resync = False
+        self.wakeup.clear()
+        return dates, resync
+
+
+class TooManyStreams(Exception):
+    pass
+
+
+class WorkoutChangeHub:
+    """Fans workout change notifications out to this process's open streams.
+
+    A single LISTEN connection per process, opened with the first subscriber,
+    feeds every stream, so an idle subscriber costs an event and a set rather
+    than a database connection or a thread. Subscribers are only touched on
+    the event loop; the listener thread hands notifications over with
+    call_soon_threadsafe.
+    """
+
+    def __init__(self, max_subscribers: int, database: Database):
+        self.max_subscribers = max_subscribers
+        self.database = database
+        self._subscribers: dict[int, set[Subscriber]] = {}
+        self._count = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._listening: asyncio.Event | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int) -> Subscriber:
+        if self._count >= self.max_subscribers:
+            raise TooManyStreams("process stream limit reached")
+        streams = self._subscribers.setdefault(user_id, set())
+        if len(streams) >= MAX_STREAMS_PER_USER:
+            raise TooManyStreams("per-user stream limit reached")
+        subscriber = Subscriber(user_id)
+        streams.add(subscriber)
+        self._count += 1
+        self._ensure_listening(asyncio.get_running_loop())
+        return subscriber
+
+    async def wait_listening(self, timeout: float) -> bool:
+        """Whether the LISTEN connection is up; streams report ready only then, so no change falls in between."""
+        try:
+            await asyncio.wait_for(self._listening.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        streams = self._subscribers.get(subscriber.user_id)
+        if streams is None or subscriber not in streams:
+            return
+        streams.discard(subscriber)
+        self._count -= 1
+        if not streams:
+            del self._subscribers[subscriber.user_id]
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": self._count,
+            "users": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "listening": self._listening is not None and self._listening.is_set(),
+        }
+
+    def _deliver(self, user_id: int, dates: list[str]) -> None:
+        for subscriber in self._subscribers.get(user_id, ()):
+            subscriber.pending_dates.update(dates)
+            subscriber.wakeup.set()
+
+    def _connected(self, reconnected: bool) -> None:
+        self._listening.set()
+        if not reconnected:
+            return
+        # Anything sent while disconnected is lost; have open streams refetch once.
+        for streams in self._subscribers.values():
+            for subscriber in streams:
+                subscriber.resync = True
+                subscriber.wakeup.set()
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            user_id, dates = int(message["user_id"]), list(message["dates"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("live_updates_bad_payload payload=%r", payload)
+            return
+        self._loop.call_soon_threadsafe(self._deliver, user_id, dates)
+
+    def _ensure_listening(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._loop = loop
+            self._listening = asyncio.Event()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="workout-change-listener", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        # A plain libpq connection outside the pool: it stays checked out for the process lifetime.
+        conninfo = self.database.engine().url.set(drivername="postgresql").render_as_string(hide_password=False)
+        reconnected = False
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(conninfo, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {CHANNEL}")
+                    self._loop.call_soon_threadsafe(self._connected, reconnected)
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=LISTEN_POLL_SECONDS):
+                            self._dispatch(notify.payload)
+            except Exception:
+                if self._stop.is_set():
+                    return
+                logger.exception("live_updates_listener_failed")
+                self._loop.call_soon_threadsafe(self._listening.clear)
+                self._stop.wait(RECONNECT_SECONDS)
+            reconnected = True
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=LISTEN_POLL_SECONDS + 1)
+
+
+def sse_event(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
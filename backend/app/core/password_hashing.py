@@ -0,0 +1,171 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+import time
+
+from app.core.metrics import Counter, Gauge
+from app.core.security import hash_password, verify_password
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 16
+DEFAULT_TIMEOUT_SECONDS = 10.0
+LATENCY_WINDOW = 1024
+
+
+class PasswordHashingUnavailable(RuntimeError):
+    """Raised when the hashing pool is saturated or too slow to answer."""
+
+
+class PasswordHashingPool:
+    """Runs bcrypt in a small dedicated process pool with a hard cap on in-flight jobs.
+
+    Callers await their own job only, without holding a thread;
+    once ``max_pending`` jobs are queued or running, new work is rejected
+    immediately instead of stacking requests behind bcrypt. A job keeps its slot
+    until it finishes, even when its caller has given up waiting.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._latencies_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn keeps workers independent of the server's threads and open DB sockets.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _submit(self, fn, *args) -> Future:
+        """Start a job, holding its slot until the job itself finishes, not until its caller stops waiting."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise PasswordHashingUnavailable("password hashing queue is full")
+
+        started = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+
+        def finished(future: Future) -> None:
+            with self._lock:
+                self._pending -= 1
+                if not future.cancelled() and future.exception() is None:
+                    self._completed += 1
+                    self._latencies_ms.append((time.perf_counter() - started) * 1000)
+            self._slots.release()
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+            self._discard_executor()
+            raise PasswordHashingUnavailable("password hashing pool restarted") from None
+        future.add_done_callback(finished)
+        return future
+
+    def _timed_out_job(self, future: Future) -> PasswordHashingUnavailable:
+        # Drops the job if it is still queued; a running one keeps its slot until bcrypt returns.
+        future.cancel()
+        with self._lock:
+            self._timed_out += 1
+        return PasswordHashingUnavailable("password hashing timed out")
+
+    async def _run_async(self, fn, *args):
+        future = self._submit(fn, *args)
+        try:
+            # On timeout the cancellation reaches the job only if it has not started; see _timed_out_job.
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            raise self._timed_out_job(future) from None
+        except BrokenProcessPool:
+            # A crashed worker poisons the executor; start a fresh one on the next call.
+            self._discard_executor()
+            raise PasswordHashingUnavailable("password hashing pool restarted") from None
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(hash_password, password)
+
+    async def verify_async(self, password: str, password_hash: str) -> bool:
+        return await self._run_async(verify_password, password, password_hash)
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            pending = self._pending
+            completed = self._completed
+            rejected = self._rejected
+            timed_out = self._timed_out
+
+        def percentile(fraction: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))], 2)
+
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "queue_depth": pending,
+            "completed": completed,
+            "rejected": rejected,
+            "timed_out": timed_out,
+            "latency_ms_p50": percentile(0.50),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_max": round(latencies[-1], 2) if latencies else None,
+        }
+
+    def _discard_executor(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        self._discard_executor()
+
+
+def hashing_metrics(pool: PasswordHashingPool):
+    """Scrape-time view of ``pool.stats()`` for /metrics."""
+    stats = pool.stats()
+    for name, key, documentation in (
+        ("password_hash_workers", "workers", "Processes in the password hashing pool."),
+        ("password_hash_max_pending", "max_pending", "Hashing jobs allowed queued or running at once."),
+        ("password_hash_queue_depth", "queue_depth", "Hashing jobs currently queued or running."),
+        ("password_hash_latency_ms_p50", "latency_ms_p50", "Median hashing job latency over recent jobs."),
+        ("password_hash_latency_ms_p95", "latency_ms_p95", "95th percentile hashing job latency over recent jobs."),
+    ):
+        if stats[key] is None:
+            continue
+        gauge = Gauge(name, documentation)
+        gauge.set(stats[key])
+        yield gauge
+    for name, key, documentation in (
+        ("password_hash_completed_total", "completed", "Hashing jobs completed."),
+        ("password_hash_rejected_total", "rejected", "Hashing jobs rejected because the queue was full."),
+        ("password_hash_timed_out_total", "timed_out", "Hashing jobs whose caller stopped waiting."),
+    ):
+        counter = Counter(name, documentation)
+        counter.inc(amount=stats[key])
+        yield counter
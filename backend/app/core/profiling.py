@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import hmac
+import json
+import os
+from pathlib import Path
+import random
+import re
+import sys
+import threading
+import time
+
+from app.core.config import Settings
+
+PROFILE_HEADER = "x-profile-token"
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class StackSampler:
+    """Samples one thread's Python stack on a background thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval_seconds: float):
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.samples: list[tuple[tuple[str, str, int], ...]] = []
+        self.weights_ms: list[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self.started = 0.0
+        self.stopped = 0.0
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append(tuple(stack))
+            self.weights_ms.append((now - last) * 1000.0)
+            last = now
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.stopped = time.perf_counter()
+
+    def to_speedscope(self, name: str) -> dict:
+        frame_index: dict[tuple[str, str, int], int] = {}
+        frames: list[dict] = []
+        samples: list[list[int]] = []
+        for stack in self.samples:
+            indexed = []
+            for key in stack:
+                index = frame_index.get(key)
+                if index is None:
+                    index = frame_index[key] = len(frames)
+                    frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                indexed.append(index)
+            samples.append(indexed)
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "athos",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round((self.stopped - self.started) * 1000.0, 3),
+                    "samples": samples,
+                    "weights": [round(weight, 3) for weight in self.weights_ms],
+                }
+            ],
+        }
+
+
+class ProfileRequest:
+    """Marks the current request as profiled; the handler wrapper fills in the sampler."""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.sampler: StackSampler | None = None
+
+
+current_profile: ContextVar[ProfileRequest | None] = ContextVar("current_profile", default=None)
+
+
+def profiling_enabled(config: Settings) -> bool:
+    return bool(config.profile_token) or config.profile_sample_rate > 0
+
+
+def should_profile(config: Settings, scope, route_path: str) -> bool:
+    """Profile when the admin header carries the configured token, or the route is sampled."""
+    if config.profile_token:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER.encode():
+                # Bytes, since compare_digest rejects str with non-ASCII characters.
+                return hmac.compare_digest(value, config.profile_token.encode())
+    if config.profile_sample_rate <= 0:
+        return False
+    if config.profile_routes and route_path not in config.profile_routes:
+        return False
+    return random.random() < config.profile_sample_rate
+
+
+@contextmanager
+def profiled_call():
+    """Sample the calling thread for the duration of the block when the request is being profiled."""
+    profile = current_profile.get()
+    if profile is None:
+        yield
+        return
+    sampler = StackSampler(threading.get_ident(), profile.interval_seconds)
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        profile.sampler = sampler
+
+
+def save_profile(sampler: StackSampler, request_id: str, route_path: str, profile_dir: str) -> str:
+    """Write a speedscope profile named after the request id into profile_dir; returns the file name."""
+    safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", request_id)[:128]
+    directory = Path(profile_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    file_name = f"{safe_id}.speedscope.json"
+    payload = sampler.to_speedscope(f"{route_path} {request_id}")
+    tmp_path = directory / f".{file_name}.{os.getpid()}"
+    tmp_path.write_text(json.dumps(payload))
+    tmp_path.replace(directory / file_name)
+    return file_name
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+import logging
+import threading
+
+from sqlalchemy import func, select
+
+from app.core.security import ACCESS_TOKEN_EXPIRE_MINUTES
+from app.db.models.refresh_token import RefreshToken
+from app.db.session import Database, SessionLocal
+
+logger = logging.getLogger("athos.auth")
+
+DEFAULT_POLL_SECONDS = 5.0
+# Re-read a little history each poll so revocations committed out of order are not skipped.
+POLL_OVERLAP = timedelta(seconds=60)
+
+
+class SessionRevocations:
+    """Revoked session ids held in memory so every request checks revocation with a set lookup.
+
+    A background thread pulls newly revoked refresh-token families from the
+    database; revocations made by this process are added immediately. Entries
+    are kept only as long as an access token issued before the revocation can
+    still be valid.
+    """
+
+    def __init__(self, database: Database, poll_seconds: float = DEFAULT_POLL_SECONDS):
+        self.database = database
+        self.poll_seconds = poll_seconds
+        self.retention = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        self._revoked: dict[str, datetime] = {}
+        self._high_water: datetime | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def is_revoked(self, session_id: str | None) -> bool:
+        return session_id is not None and session_id in self._revoked
+
+    def add(self, session_id: str, revoked_at: datetime | None = None) -> None:
+        with self._lock:
+            self._revoked[session_id] = revoked_at or datetime.now(timezone.utc)
+
+    def sync(self) -> None:
+        now = datetime.now(timezone.utc)
+        since = now - self.retention if self._high_water is None else self._high_water - POLL_OVERLAP
+        with SessionLocal(database=self.database) as db:
+            rows = db.execute(
+                select(RefreshToken.family_id, func.max(RefreshToken.revoked_at))
+                .where(RefreshToken.revoked_at > since)
+                .group_by(RefreshToken.family_id)
+            ).all()
+
+        cutoff = now - self.retention
+        with self._lock:
+            for family_id, revoked_at in rows:
+                self._revoked[str(family_id)] = revoked_at
+                if self._high_water is None or revoked_at > self._high_water:
+                    self._high_water = revoked_at
+            if self._high_water is None:
+                self._high_water = since
+            # Rebuild rather than delete in place so lock-free readers never see a resizing dict.
+            self._revoked = {sid: at for sid, at in self._revoked.items() if at > cutoff}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.sync()
+            except Exception:
+                logger.exception("revocation_sync_failed")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        try:
+            self.sync()
+        except Exception:
+            logger.exception("revocation_sync_failed")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="session-revocations", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds)
+            self._thread = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
@@ -1,5 +1,11 @@
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import hashlib
 import os
+import threading
+import time
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -10,8 +16,10 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+VERIFIED_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("VERIFIED_TOKEN_CACHE_MAX_ENTRIES", 10_000))
 
 
+@lru_cache(maxsize=1)
 def _get_jwt_secret() -> str:
     secret = os.getenv("JWT_SECRET")
     if not secret:
@@ -27,18 +35,97 @@ def verify_password(plain_password: str, password_hash: str) -> bool:
     return pwd_context.verify(plain_password, password_hash)
 
 
-def create_access_token(user_id: int, expires_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES) -> str:
+def create_access_token(
+    user_id: int,
+    expires_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES,
+    session_id: str | None = None,
+) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)
     payload = {
         "sub": str(user_id),
         "exp": expire,
     }
+    if session_id is not None:
+        payload["sid"] = session_id
     return jwt.encode(payload, _get_jwt_secret(), algorithm=ALGORITHM)
 
 
-def decode_access_token(token: str) -> int:
+@dataclass(frozen=True)
+class AccessClaims:
+    user_id: int
+    # Refresh-token family the access token was issued from; None for tokens minted outside a login session.
+    session_id: str | None
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of already-verified tokens, keyed by digest and dropped at the token's ``exp``.
+
+    Only successful verifications are stored, so a forged or tampered token
+    always goes through full signature verification.
+    """
+
+    def __init__(self, max_entries: int = VERIFIED_TOKEN_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, AccessClaims]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> AccessClaims | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, key: bytes, expires_at: float, claims: AccessClaims) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_tokens = VerifiedTokenCache()
+
+
+def _verify_access_token(token: str) -> tuple[AccessClaims, float]:
     payload = jwt.decode(token, _get_jwt_secret(), algorithms=[ALGORITHM])
     subject = payload.get("sub")
     if subject is None:
         raise JWTError("Missing subject")
-    return int(subject)
+    expires_at = payload.get("exp")
+    if expires_at is None:
+        raise JWTError("Missing expiry")
+    return AccessClaims(user_id=int(subject), session_id=payload.get("sid")), float(expires_at)
+
+
+def decode_access_claims(token: str) -> AccessClaims:
+    key = verified_tokens.digest(token)
+    claims = verified_tokens.get(key)
+    if claims is not None:
+        return claims
+
+    claims, expires_at = _verify_access_token(token)
+    verified_tokens.put(key, expires_at, claims)
+    return claims
+
+
+def decode_access_token(token: str) -> int:
+    return decode_access_claims(token).user_id
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import time
+
+
+@dataclass
+class RequestTimings:
+    """Per-request phase durations (ms) and SQL totals, filled in while Server-Timing is enabled."""
+
+    auth_ms: float = 0.0
+    handler_ms: float = 0.0
+    db_ms: float = 0.0
+    db_queries: int = 0
+
+    def record_query(self, elapsed_ms: float) -> None:
+        self.db_ms += elapsed_ms
+        self.db_queries += 1
+
+    def header(self, total_ms: float) -> str:
+        app_ms = max(self.handler_ms - self.db_ms, 0.0)
+        serialize_ms = max(total_ms - self.handler_ms - self.auth_ms, 0.0)
+        return ", ".join(
+            [
+                f"auth;dur={self.auth_ms:.2f}",
+                f'db;dur={self.db_ms:.2f};desc="{self.db_queries} queries"',
+                f"app;dur={app_ms:.2f}",
+                f"serialize;dur={serialize_ms:.2f}",
+                f"total;dur={total_ms:.2f}",
+            ]
+        )
+
+
+# Worker threads inherit the request's context, so sync endpoints and the engine hooks see the same object.
+current_timings: ContextVar[RequestTimings | None] = ContextVar("current_timings", default=None)
+
+
+@contextmanager
+def timed_phase(attribute: str):
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(timings, attribute, getattr(timings, attribute) + (time.perf_counter() - started) * 1000.0)
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from app.core.ttl_cache import TTLCache
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """The slice of a users row that authenticated requests need beyond the token."""
+
+    user_id: int
+    timezone: str | None
+
+
+class AuthenticatedUserCache(TTLCache[int, CachedUser]):
+    """Bounded LRU of verified user identities whose entries expire after a fixed TTL.
+
+    Endpoints that change a user row invalidate its entry after committing, so a
+    concurrent miss cannot re-cache the old row; the TTL bounds staleness for
+    changes made by other processes.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(ttl_seconds, max_entries)
+
+    def put(self, identity: CachedUser) -> None:
+        self.set(identity.user_id, identity)
+
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import MetaData
+from sqlalchemy.orm import aliased
+
+from app.core.config import Settings
+from app.db.models.cardio_session import CardioSession
+from app.db.models.strength_set import StrengthSet
+from app.db.models.workout import Workout
+
+# Workouts older than the archive horizon, with their sets and cardio sessions, live in
+# this schema (created by migration 4b8e2d6f1c3a) instead of the hot, partitioned tables.
+ARCHIVE_SCHEMA = "archive"
+
+archive_metadata = MetaData(schema=ARCHIVE_SCHEMA)
+archived_workouts = Workout.__table__.to_metadata(archive_metadata, schema=ARCHIVE_SCHEMA)
+archived_strength_sets = StrengthSet.__table__.to_metadata(archive_metadata, schema=ARCHIVE_SCHEMA)
+archived_cardio_sessions = CardioSession.__table__.to_metadata(archive_metadata, schema=ARCHIVE_SCHEMA)
+
+
+@dataclass(frozen=True)
+class StorageTier:
+    """Entities to build a query against; the archive's load as ordinary Workout/StrengthSet/CardioSession objects."""
+
+    name: str
+    workouts: Any
+    strength_sets: Any
+    cardio_sessions: Any
+
+
+HOT = StorageTier("hot", Workout, StrengthSet, CardioSession)
+ARCHIVE = StorageTier(
+    "archive",
+    aliased(Workout, archived_workouts, adapt_on_names=True),
+    aliased(StrengthSet, archived_strength_sets, adapt_on_names=True),
+    aliased(CardioSession, archived_cardio_sessions, adapt_on_names=True),
+)
+
+# Hot table -> archive table, in the order rows must be inserted (parents first).
+ARCHIVE_TABLES = (
+    (Workout.__table__, archived_workouts),
+    (StrengthSet.__table__, archived_strength_sets),
+    (CardioSession.__table__, archived_cardio_sessions),
+)
+
+
+def archive_cutoff(config: Settings, today: date | None = None) -> date:
+    """Workouts with a local date before this belong in the archive."""
+    today = today or datetime.now(timezone.utc).date()
+    return today - timedelta(days=config.archive_after_days)
+
+
+def may_be_archived(config: Settings, day: date) -> bool:
+    # The job archives before the cutoff of its own run, which is never later than today's.
+    return day < archive_cutoff(config)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Response header carrying the primary's WAL position after a write; clients echo it on reads.
+CONSISTENCY_HEADER = "X-Consistency-Token"
+RECENT_WRITES_MAX_ENTRIES = 50_000
+# A replica's replay position only moves forward, so a recent reading that is already
+# past the required LSN proves it has caught up without asking again.
+REPLAY_LSN_CACHE_SECONDS = 0.25
+
+
+def parse_lsn(value) -> int | None:
+    """Parse a Postgres ``pg_lsn`` text value such as ``16/B374D848``; None when malformed."""
+    if not value:
+        return None
+    high, sep, low = str(value).strip().partition("/")
+    if not sep:
+        return None
+    try:
+        return (int(high, 16) << 32) | int(low, 16)
+    except ValueError:
+        return None
+
+
+def format_lsn(value: int) -> str:
+    return f"{value >> 32:X}/{value & 0xFFFFFFFF:X}"
+
+
+class RecentWrites:
+    """Per-user primary WAL position after their latest write, kept for a short pinning window.
+
+    Covers clients that do not echo the consistency header; it is per process,
+    so across workers the header is what carries read-your-writes.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = RECENT_WRITES_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[float, int]] = OrderedDict()
+
+    def note(self, user_id: int, lsn: int) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, lsn)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, user_id: int) -> int | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_replay_lock = threading.Lock()
+_replay_positions: dict[int, tuple[float, int]] = {}
+
+
+def current_primary_lsn(engine: Engine) -> int | None:
+    with engine.connect() as conn:
+        return parse_lsn(conn.scalar(text("SELECT pg_current_wal_lsn()")))
+
+
+def replica_has_replayed(engine: Engine, lsn: int) -> bool:
+    key = id(engine)
+    now = time.monotonic()
+    with _replay_lock:
+        cached = _replay_positions.get(key)
+    if cached is not None and cached[1] >= lsn and now - cached[0] < REPLAY_LSN_CACHE_SECONDS:
+        return True
+    with engine.connect() as conn:
+        replayed = parse_lsn(conn.scalar(text("SELECT pg_last_wal_replay_lsn()")))
+    if replayed is None:
+        return False
+    with _replay_lock:
+        _replay_positions[key] = (now, replayed)
+    return replayed >= lsn
+
+
+def required_lsn(request, recent_writes: RecentWrites) -> int | None:
+    """Highest WAL position this request must observe: its echoed token or the user's recent write."""
+    if request is None:
+        return None
+    candidates = [parse_lsn(request.headers.get(CONSISTENCY_HEADER))]
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is not None:
+        candidates.append(recent_writes.get(user_id))
+    positions = [lsn for lsn in candidates if lsn is not None]
+    return max(positions) if positions else None
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import Counter, Gauge, db_query_duration_seconds, db_query_errors_total
+from app.core.timing import current_timings
+from app.db.pool import InstrumentedQueuePool
+
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+
+def _operation(statement: str) -> str:
+    words = statement.lstrip()[:16].split(None, 1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement through engine events."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        db_query_duration_seconds.observe(elapsed, (_operation(statement),))
+        timings = current_timings.get()
+        if timings is not None:
+            timings.record_query(elapsed * 1000.0)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        starts = context.connection.info.get("query_started") if context.connection is not None else None
+        if starts:
+            starts.pop()
+        db_query_errors_total.inc((_operation(context.statement or ""),))
+
+
+def pool_metrics(engine: Engine):
+    """Pool gauges and counters for a registry collector; empty for pools without telemetry."""
+    if not isinstance(engine.pool, InstrumentedQueuePool):
+        return
+    stats = engine.pool.stats()
+    for name, key, documentation in (
+        ("db_pool_size", "pool_size", "Persistent connections the pool keeps."),
+        ("db_pool_checked_out", "checked_out", "Connections currently checked out."),
+        ("db_pool_idle", "idle", "Connections idle in the pool."),
+        ("db_pool_overflow", "overflow", "Overflow connections currently open."),
+    ):
+        gauge = Gauge(name, documentation)
+        gauge.set(stats[key])
+        yield gauge
+    for name, key, documentation in (
+        ("db_pool_checkouts_total", "checkouts", "Connection checkouts."),
+        ("db_pool_checkouts_waited_total", "checkouts_waited", "Checkouts that waited for a free connection."),
+        ("db_pool_checkout_timeouts_total", "checkout_timeouts", "Checkouts that timed out."),
+    ):
+        counter = Counter(name, documentation)
+        counter.inc(amount=stats[key])
+        yield counter
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, Text, func
+from sqlalchemy import DateTime, ForeignKey, ForeignKeyConstraint, Index, Integer, Numeric, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,17 +13,18 @@ from app.db.session import Base
 class CardioSession(Base):
     __tablename__ = "cardio_sessions"
     __table_args__ = (
+        ForeignKeyConstraint(
+            ["user_id", "workout_id"],
+            ["workouts.user_id", "workouts.id"],
+            name="cardio_sessions_workout_id_fkey",
+            ondelete="CASCADE",
+        ),
         Index("cardio_sessions_user_time", "user_id", "workout_id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=False, index=True)
-    workout_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("workouts.id", ondelete="CASCADE"),
-        nullable=False,
-        unique=True,
-    )
+    workout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, unique=True)
     distance_miles: Mapped[float | None] = mapped_column(Numeric(8, 3), nullable=True)
     duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
     incline: Mapped[float | None] = mapped_column(Numeric(5, 2), nullable=True)
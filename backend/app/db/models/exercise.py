@@ -20,6 +20,13 @@ class Exercise(Base):
             text("lower(name)"),
             unique=True,
         ),
+        # Fuzzy name search (word_similarity / <%); needs the pg_trgm and btree_gin extensions.
+        Index(
+            "exercises_user_name_trgm",
+            "user_id",
+            text("lower(name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
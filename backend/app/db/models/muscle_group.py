@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -26,6 +26,13 @@ class MuscleGroup(Base):
 
 class ExerciseMuscleMap(Base):
     __tablename__ = "exercise_muscle_map"
+    __table_args__ = (
+        Index(
+            "exercise_muscle_map_exercise_cover",
+            "exercise_id",
+            postgresql_include=["muscle_group_id", "is_primary"],
+        ),
+    )
 
     exercise_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
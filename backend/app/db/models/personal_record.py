@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+from sqlalchemy import DateTime, ForeignKey, Numeric, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class PersonalRecord(Base):
+    __tablename__ = "personal_records"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), primary_key=True)
+    exercise_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("exercises.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    max_weight: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
+    max_weight_achieved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    best_set_load: Mapped[float | None] = mapped_column(Numeric(18, 2), nullable=True)
+    best_set_load_achieved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    best_estimated_1rm: Mapped[float | None] = mapped_column(Numeric(10, 2), nullable=True)
+    best_estimated_1rm_achieved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
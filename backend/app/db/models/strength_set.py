@@ -3,7 +3,18 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, Text, func
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    Numeric,
+    PrimaryKeyConstraint,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,27 +24,46 @@ from app.db.session import Base
 class StrengthSet(Base):
     __tablename__ = "strength_sets"
     __table_args__ = (
-        Index("strength_sets_workout_order", "workout_id", "set_index"),
+        # Hash-partitioned by user_id like workouts (migration 7dc066cd1a94).
+        PrimaryKeyConstraint("user_id", "id", name="strength_sets_pkey"),
+        ForeignKeyConstraint(
+            ["user_id", "workout_id"],
+            ["workouts.user_id", "workouts.id"],
+            name="strength_sets_workout_id_fkey",
+            ondelete="CASCADE",
+        ),
+        # Read indexes cover live rows only, like workouts'.
+        Index("strength_sets_workout_order", "workout_id", "set_index", postgresql_where=text("deleted_at IS NULL")),
+        Index(
+            "strength_sets_user_exercise_time",
+            "user_id",
+            "exercise_id",
+            "performed_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("strength_sets_user_workout", "user_id", "workout_id", postgresql_where=text("deleted_at IS NULL")),
+        {"postgresql_partition_by": "HASH (user_id)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=False, index=True)
-    workout_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("workouts.id", ondelete="CASCADE"),
-        nullable=False,
-    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), primary_key=True)
+    workout_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     exercise_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("exercises.id"),
         nullable=False,
     )
     set_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Copy of the parent workout's start_ts, kept so exercise history is index-only.
+    performed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     weight: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
     reps: Mapped[int | None] = mapped_column(Integer, nullable=True)
     duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
     rpe: Mapped[float | None] = mapped_column(Numeric(4, 2), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Set when the set, or its whole workout, is deleted.
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -23,6 +23,8 @@ class User(Base):
     birth_year: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     birth_month: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Default IANA zone for deriving workouts.local_date when a client sends no X-Client-Timezone.
+    timezone: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
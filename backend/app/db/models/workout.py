@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 import uuid
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, func, text
+from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, Integer, PrimaryKeyConstraint, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,8 @@ from app.db.session import Base
 class Workout(Base):
     __tablename__ = "workouts"
     __table_args__ = (
+        # Hash-partitioned by user_id (migration 7dc066cd1a94), so the primary key must include it.
+        PrimaryKeyConstraint("user_id", "id", name="workouts_pkey"),
         Index(
             "uq_workouts_user_client_uuid_not_null",
             "user_id",
@@ -21,19 +23,32 @@ class Workout(Base):
             unique=True,
             postgresql_where=text("client_uuid IS NOT NULL"),
         ),
-        Index("workouts_user_time", "user_id", text("start_ts DESC")),
+        # Read indexes cover live rows only (migration e5a1c9d7b3f2); queries filter on deleted_at IS NULL.
+        Index("workouts_user_time", "user_id", text("start_ts DESC"), postgresql_where=text("deleted_at IS NULL")),
+        Index(
+            "workouts_user_local_date",
+            "user_id",
+            "local_date",
+            text("start_ts DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        {"postgresql_partition_by": "HASH (user_id)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.user_id"), primary_key=True)
     workout_type: Mapped[Modality] = mapped_column(Enum(Modality, name="modality"), nullable=False)
     title: Mapped[str | None] = mapped_column(String(255), nullable=True)
     start_ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_ts: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Calendar day of start_ts in the submitting client's timezone, fixed at write time.
+    local_date: Mapped[date] = mapped_column(Date, nullable=False)
     source: Mapped[str | None] = mapped_column(String(50), nullable=True)
     provider: Mapped[str | None] = mapped_column(String(100), nullable=True)
     client_uuid: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # Bumped by every edit to the workout or its sets; sent as the ETag and checked against If-Match.
     version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
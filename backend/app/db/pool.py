@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import deque
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+WAIT_WINDOW = 2048
+
+
+class PoolTelemetry:
+    """Checkout wait times and saturation counters for the engine's connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits_ms: deque[float] = deque(maxlen=WAIT_WINDOW)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waited = 0
+        self.max_wait_ms = 0.0
+
+    def record(self, wait_ms: float, waited: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._waits_ms.append(wait_ms)
+            if waited:
+                self.waited += 1
+            if wait_ms > self.max_wait_ms:
+                self.max_wait_ms = wait_ms
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = sorted(self._waits_ms)
+            counters = {
+                "checkouts": self.checkouts,
+                "checkouts_waited": self.waited,
+                "checkout_timeouts": self.timeouts,
+                "wait_ms_max": round(self.max_wait_ms, 3),
+            }
+
+        def percentile(fraction: float) -> float | None:
+            if not waits:
+                return None
+            return round(waits[min(len(waits) - 1, int(fraction * len(waits)))], 3)
+
+        counters["wait_ms_p50"] = percentile(0.50)
+        counters["wait_ms_p99"] = percentile(0.99)
+        return counters
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times every checkout and counts waits and timeouts in its own ``telemetry``."""
+
+    # Checkouts slower than this waited on a free connection rather than just taking one.
+    WAITED_THRESHOLD_MS = 1.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolTelemetry()
+
+    def recreate(self):
+        # Engine.dispose() swaps in a recreated pool; keep counting where the old one left off.
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.telemetry.record_timeout()
+            raise
+        wait_ms = (time.perf_counter() - started) * 1000.0
+        self.telemetry.record(wait_ms, wait_ms >= self.WAITED_THRESHOLD_MS)
+        return record
+
+    def stats(self) -> dict:
+        checked_out = self.checkedout()
+        capacity = self.size() + max(self._max_overflow, 0)
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": checked_out,
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "saturation": round(checked_out / capacity, 3) if capacity else None,
+            **self.telemetry.snapshot(),
+        }
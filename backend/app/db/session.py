@@ -1,19 +1,182 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
-import os
+from __future__ import annotations
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+import itertools
+import threading
 
-if not DATABASE_URL:
-    raise RuntimeError("DATABASE_URL is not set")
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import Settings, settings as default_settings
+from app.db.consistency import RecentWrites, current_primary_lsn, format_lsn, replica_has_replayed, required_lsn
+from app.db.metrics import instrument_engine
+from app.db.pool import InstrumentedQueuePool
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _create_engine(config: Settings, url: str | None, poolclass=InstrumentedQueuePool) -> Engine:
+    if not url:
+        raise RuntimeError("DATABASE_URL is not set")
+    engine = create_engine(
+        url,
+        poolclass=poolclass,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout_seconds,
+        pool_recycle=config.db_pool_recycle_seconds,
+        pool_pre_ping=config.db_pre_ping == "always",
+        # psycopg prepares repeated statements server-side; PgBouncer transaction pooling can't route them.
+        connect_args={"prepare_threshold": None} if config.db_pgbouncer else {},
+    )
+    instrument_engine(engine)
+    return engine
+
+
+class Database:
+    """The engines for one configuration: a primary plus optional read replicas.
+
+    Engines are built on first use rather than at construction, so importing
+    models, jobs or the app costs nothing and each (forked) process opens its
+    own pools. Every app from ``create_app`` owns one (``app.state.database``);
+    jobs, scripts and sessions made outside a request use ``default_database``.
+    """
+
+    def __init__(self, config: Settings):
+        self.settings = config
+        self.recent_writes = RecentWrites(ttl_seconds=config.read_your_writes_seconds)
+        self._engine: Engine | None = None
+        self._replica_engines: list[Engine] | None = None
+        self._lock = threading.Lock()
+        self._replica_cursor = itertools.count()
+
+    @property
+    def engine_created(self) -> bool:
+        return self._engine is not None
+
+    def engine(self) -> Engine:
+        """The primary engine, which takes all writes."""
+        engine = self._engine
+        if engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._engine = _create_engine(self.settings, self.settings.database_url)
+                engine = self._engine
+        return engine
+
+    def replica_engines(self) -> list[Engine]:
+        # Replica pools are plain QueuePools so the pool stats and gauges keep describing the primary.
+        engines = self._replica_engines
+        if engines is None:
+            with self._lock:
+                if self._replica_engines is None:
+                    self._replica_engines = [
+                        _create_engine(self.settings, url, poolclass=QueuePool)
+                        for url in self.settings.database_replica_urls
+                    ]
+                engines = self._replica_engines
+        return engines
+
+    def route(self, read_only: bool, request=None) -> Engine:
+        """Read-only work goes to a replica that has replayed what the request must see, else the primary."""
+        primary = self.engine()
+        if not read_only:
+            return primary
+        replicas = self.replica_engines()
+        if not replicas:
+            return primary
+        start = next(self._replica_cursor) % len(replicas)
+        ordered = replicas[start:] + replicas[:start]
+        lsn = required_lsn(request, self.recent_writes)
+        if lsn is None:
+            return ordered[0]
+        for replica in ordered:
+            if replica_has_replayed(replica, lsn):
+                return replica
+        return primary
+
+    def dispose(self) -> None:
+        """Close pooled connections and drop the engines; the next use builds fresh ones."""
+        with self._lock:
+            engines = ([self._engine] if self._engine is not None else []) + (self._replica_engines or [])
+            self._engine, self._replica_engines = None, None
+        for engine in engines:
+            engine.dispose()
+
+
+default_database = Database(default_settings)
+
+
+def configure_database(config: Settings) -> None:
+    """Point ``default_database`` at ``config``; engines built from earlier settings are disposed."""
+    global default_database
+    previous, default_database = default_database, Database(config)
+    previous.dispose()
+
+
+def get_engine() -> Engine:
+    """The default database's primary engine."""
+    return default_database.engine()
+
+
+def get_replica_engines() -> list[Engine]:
+    return default_database.replica_engines()
+
+
+def dispose_engine() -> None:
+    default_database.dispose()
+
+
+def __getattr__(name: str):
+    # Backwards-compatible ``from app.db.session import engine``.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class RoutingSession(Session):
+    """Session that picks its engine at first use.
+
+    Read-only request sessions go to a replica; with a pending consistency
+    requirement (see ``app.db.consistency``) only to one that has replayed it,
+    otherwise to the primary. Everything else uses the primary.
+    """
+
+    def __init__(self, *args, request=None, read_only: bool = False, database: Database | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.request = request
+        self.read_only = read_only
+        self.database = database or default_database
+        self._routed_engine: Engine | None = None
+
+    def get_bind(self, mapper=None, **kwargs):
+        if self.bind is not None:
+            return super().get_bind(mapper, **kwargs)
+        if self._routed_engine is None:
+            self._routed_engine = self.database.route(self.read_only, self.request)
+        return self._routed_engine
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _record_write_position(session: RoutingSession) -> None:
+    # Only worth a round trip when some reads may be served by a lagging replica.
+    database = session.database
+    if session.read_only or session.request is None or not database.settings.database_replica_urls:
+        return
+    lsn = current_primary_lsn(database.engine())
+    if lsn is None:
+        return
+    state = session.request.state
+    state.consistency_token = format_lsn(lsn)
+    user_id = getattr(state, "user_id", None)
+    if user_id is not None:
+        database.recent_writes.note(user_id, lsn)
 
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-)
 
 SessionLocal = sessionmaker(
-    bind=engine,
+    class_=RoutingSession,
     autoflush=False,
     autocommit=False,
 )
@@ -23,9 +186,13 @@ class Base(DeclarativeBase):
     pass
 
 
-def get_db():
-    db = SessionLocal()
+def get_db(request: Request):
+    db = SessionLocal(
+        request=request,
+        read_only=request.method in READ_ONLY_METHODS,
+        database=getattr(request.app.state, "database", None),
+    )
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1 @@
+"""Maintenance jobs, run with ``python -m app.jobs.<name>`` from the backend directory."""
@@ -0,0 +1,160 @@
+"""Move workouts older than the archive horizon out of the hot tables.
+
+Usage:
+    python -m app.jobs.archive_workouts [--horizon-days N] [--user-id N ...] [--batch-size N]
+
+Workouts whose local date is before today minus the horizon (ARCHIVE_AFTER_DAYS
+by default, and never less) move to the ``archive`` schema together with their strength sets
+and cardio session. Archived workouts that are inside the horizon again, after
+it was raised, move back. Each batch is its own transaction, so the job can be
+stopped and re-run at any point; the API reads whichever tier holds a workout.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime, timedelta, timezone
+import logging
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.archive import ARCHIVE_TABLES
+from app.db.models.user import User
+from app.db.session import SessionLocal
+
+logger = logging.getLogger("athos.jobs")
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def move_workouts(
+    db: Session,
+    user_id: int,
+    cutoff: date,
+    *,
+    to_archive: bool,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Move up to batch_size of a user's workouts on the wrong side of cutoff to the other tier.
+
+    With to_archive, hot workouts dated before the cutoff are archived; otherwise
+    archived workouts dated on or after it are restored. Runs in the caller's
+    transaction and returns the number of workouts moved.
+    """
+    tables = ARCHIVE_TABLES if to_archive else [(archived, hot) for hot, archived in ARCHIVE_TABLES]
+    (source_workouts, target_workouts), *children = tables
+    if to_archive:
+        on_wrong_side = source_workouts.c.local_date < cutoff
+    else:
+        on_wrong_side = source_workouts.c.local_date >= cutoff
+    # FOR UPDATE holds off concurrent edits until the batch commits; an edit that ran
+    # between the copy and the delete below would otherwise be lost.
+    workout_ids = db.execute(
+        select(source_workouts.c.id)
+        .where(source_workouts.c.user_id == user_id, on_wrong_side)
+        .order_by(source_workouts.c.local_date)
+        .limit(batch_size)
+        .with_for_update()
+    ).scalars().all()
+    if not workout_ids:
+        return 0
+
+    # Parents are copied first so the target's foreign keys hold. Sets and sessions then
+    # move with DELETE ... RETURNING, and the source workouts go last, cascading to nothing.
+    in_batch = (source_workouts.c.user_id == user_id, source_workouts.c.id.in_(workout_ids))
+    db.execute(
+        insert(target_workouts).from_select(
+            [column.name for column in source_workouts.c],
+            select(source_workouts).where(*in_batch),
+        )
+    )
+    for source, target in children:
+        moved = (
+            delete(source)
+            .where(source.c.user_id == user_id, source.c.workout_id.in_(workout_ids))
+            .returning(*source.c)
+            .cte(f"moved_{source.name}")
+        )
+        column_names = [column.name for column in source.c]
+        db.execute(insert(target).from_select(column_names, select(*(moved.c[name] for name in column_names))))
+    db.execute(delete(source_workouts).where(*in_batch))
+    return len(workout_ids)
+
+
+def _move_all(db: Session, user_id: int, cutoff: date, to_archive: bool, batch_size: int) -> int:
+    total = 0
+    while True:
+        moved = move_workouts(db, user_id, cutoff, to_archive=to_archive, batch_size=batch_size)
+        db.commit()
+        total += moved
+        if moved < batch_size:
+            return total
+
+
+def _tier_sizes(db: Session) -> dict[str, int]:
+    # Partitioned parents have no storage of their own; their size is the sum of the partitions.
+    return dict(
+        db.execute(
+            text(
+                "SELECT 'hot', coalesce(sum(pg_total_relation_size(inhrelid)), 0) "
+                "+ pg_total_relation_size('public.cardio_sessions') FROM pg_inherits "
+                "WHERE inhparent IN ('public.workouts'::regclass, 'public.strength_sets'::regclass) "
+                "UNION ALL SELECT 'archive', pg_total_relation_size('archive.workouts') "
+                "+ pg_total_relation_size('archive.strength_sets') + pg_total_relation_size('archive.cardio_sessions')"
+            )
+        ).all()
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Move workouts older than the archive horizon out of the hot tables.")
+    parser.add_argument("--horizon-days", type=int, default=settings.archive_after_days)
+    parser.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        dest="user_ids",
+        help="Limit the run to this user (repeatable). Defaults to every user.",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    if args.horizon_days < settings.archive_after_days:
+        # The API only looks in the archive for dates older than ARCHIVE_AFTER_DAYS; anything
+        # newer moved there would vanish from lists and detail reads.
+        parser.error(f"--horizon-days must be at least ARCHIVE_AFTER_DAYS ({settings.archive_after_days})")
+
+    cutoff = datetime.now(timezone.utc).date() - timedelta(days=args.horizon_days)
+    with SessionLocal() as db:
+        user_ids = args.user_ids or db.execute(select(User.user_id).order_by(User.user_id)).scalars().all()
+
+        archived_total = restored_total = 0
+        for user_id in user_ids:
+            archived = _move_all(db, user_id, cutoff, True, args.batch_size)
+            restored = _move_all(db, user_id, cutoff, False, args.batch_size)
+            archived_total += archived
+            restored_total += restored
+            if archived or restored:
+                logger.info(
+                    "job_event job=archive_workouts user_id=%s archived=%s restored=%s",
+                    user_id,
+                    archived,
+                    restored,
+                )
+
+        sizes = _tier_sizes(db)
+
+    logger.info(
+        "job_event job=archive_workouts users=%s cutoff=%s archived=%s restored=%s hot_bytes=%s archive_bytes=%s status=done",
+        len(user_ids),
+        cutoff.isoformat(),
+        archived_total,
+        restored_total,
+        sizes["hot"],
+        sizes["archive"],
+    )
+
+
+if __name__ == "__main__":
+    main()
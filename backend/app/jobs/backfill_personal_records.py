@@ -0,0 +1,51 @@
+"""Rebuild personal_records from strength_sets history.
+
+Usage:
+    python -m app.jobs.backfill_personal_records [--user-id N ...]
+
+Each user is rebuilt and committed separately, so the job can be re-run
+safely and only holds row locks for one user at a time.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+
+from sqlalchemy import select
+
+from app.db.models.strength_set import StrengthSet
+from app.db.session import SessionLocal
+from app.services.personal_records import rebuild_personal_records
+
+logger = logging.getLogger("athos.jobs")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild personal_records from strength_sets history.")
+    parser.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        dest="user_ids",
+        help="Limit the rebuild to this user (repeatable). Defaults to every user with strength sets.",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    with SessionLocal() as db:
+        user_ids = args.user_ids or db.execute(
+            select(StrengthSet.user_id).distinct().order_by(StrengthSet.user_id)
+        ).scalars().all()
+
+        total = 0
+        for user_id in user_ids:
+            written = rebuild_personal_records(db, user_id)
+            db.commit()
+            total += written
+            logger.info("job_event job=backfill_personal_records user_id=%s records=%s", user_id, written)
+
+    logger.info("job_event job=backfill_personal_records users=%s records=%s status=done", len(user_ids), total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Create users with synthetic training history directly in Postgres.
+
+Usage:
+    python -m app.jobs.generate_synthetic_history --users 3 --workouts 2000 --sets-per-workout 8
+
+Histories grow backwards from today at ``--workouts-per-day``, so a bigger
+history means more days rather than denser days: a single day (and any
+page of it) stays the same size while lifetime totals grow. Every user
+shares the password ``--password`` so load tests can log in as them.
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+import logging
+import random
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.db.models.cardio_session import CardioSession
+from app.db.models.enums import Modality
+from app.db.models.exercise import Exercise
+from app.db.models.muscle_group import ExerciseMuscleMap, MuscleGroup
+from app.db.models.strength_set import StrengthSet
+from app.db.models.user import User
+from app.db.models.workout import Workout
+from app.db.session import SessionLocal
+
+logger = logging.getLogger("athos.jobs")
+
+DEFAULT_PASSWORD = "synthetic-password"
+INSERT_BATCH_ROWS = 5_000
+MUSCLE_GROUP_NAMES = (
+    "Chest", "Back", "Shoulders", "Biceps", "Triceps", "Forearms",
+    "Quads", "Hamstrings", "Glutes", "Calves", "Core", "Lats",
+)
+
+
+@dataclass(frozen=True)
+class HistorySpec:
+    workouts: int
+    sets_per_workout: int = 8
+    exercises: int = 30
+    muscles_per_exercise: int = 2
+    workouts_per_day: int = 1
+    cardio_every: int = 5  # every Nth workout is cardio; 0 disables cardio
+    end_day: date | None = None
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class SyntheticUser:
+    user_id: int
+    email: str
+    workout_ids: list[UUID]
+    strength_workout_ids: list[UUID]
+    last_day: date
+    set_count: int
+
+
+def _insert_batched(db: Session, model, rows: list[dict]) -> None:
+    for start in range(0, len(rows), INSERT_BATCH_ROWS):
+        db.execute(insert(model), rows[start:start + INSERT_BATCH_ROWS])
+
+
+def ensure_muscle_groups(db: Session) -> list[UUID]:
+    db.execute(
+        pg_insert(MuscleGroup)
+        .values([{"id": uuid4(), "name": name} for name in MUSCLE_GROUP_NAMES])
+        .on_conflict_do_nothing(index_elements=[MuscleGroup.name])
+    )
+    return list(
+        db.execute(select(MuscleGroup.id).where(MuscleGroup.name.in_(MUSCLE_GROUP_NAMES)).order_by(MuscleGroup.name))
+        .scalars()
+        .all()
+    )
+
+
+def generate_user_history(db: Session, spec: HistorySpec, password_hash: str, email: str | None = None) -> SyntheticUser:
+    """Insert one user with ``spec.workouts`` workouts and their sets; the caller commits."""
+    rng = random.Random(spec.seed)
+    email = email or f"synthetic.{uuid4().hex[:12]}@example.com"
+    user_id = db.execute(
+        insert(User)
+        .values(
+            email=email,
+            name="Synthetic User",
+            birth_year=1990,
+            birth_month=1,
+            password_hash=password_hash,
+            timezone="UTC",
+        )
+        .returning(User.user_id)
+    ).scalar_one()
+
+    group_ids = ensure_muscle_groups(db)
+    exercise_rows = [
+        {"id": uuid4(), "user_id": user_id, "name": f"Synthetic Lift {i}", "default_modality": Modality.STRENGTH}
+        for i in range(spec.exercises)
+    ]
+    _insert_batched(db, Exercise, exercise_rows)
+    muscles = min(spec.muscles_per_exercise, len(group_ids))
+    _insert_batched(
+        db,
+        ExerciseMuscleMap,
+        [
+            {"exercise_id": row["id"], "muscle_group_id": group_id, "is_primary": offset == 0}
+            for row in exercise_rows
+            for offset, group_id in enumerate(rng.sample(group_ids, k=muscles))
+        ],
+    )
+
+    last_day = spec.end_day or date.today()
+    workout_rows, set_rows, cardio_rows = [], [], []
+    strength_workout_ids = []
+    for w in range(spec.workouts):
+        local_date = last_day - timedelta(days=w // spec.workouts_per_day)
+        start_ts = datetime.combine(local_date, time(6, 0), tzinfo=timezone.utc) + timedelta(
+            minutes=40 * (w % spec.workouts_per_day)
+        )
+        is_cardio = spec.cardio_every > 0 and w % spec.cardio_every == spec.cardio_every - 1
+        workout_id = uuid4()
+        workout_rows.append(
+            {
+                "id": workout_id,
+                "user_id": user_id,
+                "workout_type": Modality.CARDIO if is_cardio else Modality.STRENGTH,
+                "title": "Synthetic cardio" if is_cardio else "Synthetic strength",
+                "start_ts": start_ts,
+                "end_ts": start_ts + timedelta(minutes=50),
+                "local_date": local_date,
+                "source": "synthetic",
+            }
+        )
+        if is_cardio:
+            cardio_rows.append(
+                {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "workout_id": workout_id,
+                    "distance_miles": round(rng.uniform(1.0, 8.0), 3),
+                    "duration_seconds": rng.randrange(900, 3600),
+                }
+            )
+            continue
+        strength_workout_ids.append(workout_id)
+        for s in range(spec.sets_per_workout):
+            set_rows.append(
+                {
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "workout_id": workout_id,
+                    "exercise_id": exercise_rows[rng.randrange(spec.exercises)]["id"],
+                    "set_index": s + 1,
+                    "performed_at": start_ts,
+                    "weight": round(rng.uniform(20, 200), 1),
+                    "reps": rng.randrange(3, 15),
+                    "rpe": rng.choice((6.0, 7.0, 8.0, 9.0)),
+                }
+            )
+    _insert_batched(db, Workout, workout_rows)
+    _insert_batched(db, StrengthSet, set_rows)
+    _insert_batched(db, CardioSession, cardio_rows)
+    return SyntheticUser(
+        user_id=user_id,
+        email=email,
+        workout_ids=[row["id"] for row in workout_rows],
+        strength_workout_ids=strength_workout_ids,
+        last_day=last_day,
+        set_count=len(set_rows),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Create users with synthetic training history.")
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--workouts", type=int, default=1_000, help="workouts per user")
+    parser.add_argument("--sets-per-workout", type=int, default=8)
+    parser.add_argument("--exercises", type=int, default=30, help="exercises per user")
+    parser.add_argument("--muscles-per-exercise", type=int, default=2)
+    parser.add_argument("--workouts-per-day", type=int, default=1)
+    parser.add_argument("--cardio-every", type=int, default=5, help="every Nth workout is cardio (0 disables)")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    password_hash = hash_password(args.password)
+    with SessionLocal() as db:
+        for index in range(args.users):
+            spec = HistorySpec(
+                workouts=args.workouts,
+                sets_per_workout=args.sets_per_workout,
+                exercises=args.exercises,
+                muscles_per_exercise=args.muscles_per_exercise,
+                workouts_per_day=args.workouts_per_day,
+                cardio_every=args.cardio_every,
+                seed=args.seed + index,
+            )
+            user = generate_user_history(db, spec, password_hash)
+            db.commit()
+            logger.info(
+                "job_event job=generate_synthetic_history user_id=%s email=%s workouts=%s sets=%s",
+                user.user_id,
+                user.email,
+                len(user.workout_ids),
+                user.set_count,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,179 @@
+from contextlib import asynccontextmanager
+import itertools
 import logging
 
-from fastapi import FastAPI, Depends
+import anyio.to_thread
+from fastapi import APIRouter, Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.api.v1.auth import router as auth_router
 from app.api.v1.dashboard import router as dashboard_router
+from app.api.v1.exercises import router as exercises_router
+from app.api.v1.personal_records import router as personal_records_router
 from app.api.v1.workouts import router as workouts_router
-from app.db.session import get_db
+from app.core.config import Settings, settings as default_settings
+from app.core.exercise_index import ExercisePrefixCache
+from app.core.live_updates import WorkoutChangeHub
+from app.core.metrics import registry
+from app.core.password_hashing import PasswordHashingPool, hashing_metrics
+from app.core.revocation import SessionRevocations
+from app.core.user_cache import AuthenticatedUserCache
+from app.db.metrics import pool_metrics
+from app.db.session import Database, get_db
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware, RateLimitRule
 from app.middleware.request_logging import RequestLoggingMiddleware
 
-app = FastAPI(title="Athos Fitness Platform API")
-logging.basicConfig(level=logging.INFO)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",
-        "http://127.0.0.1:5173",
-    ],
-    allow_credentials=False,
-    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type", "X-Client-Timezone"],
-    expose_headers=["X-Request-ID"],
-)
-app.add_middleware(RequestLoggingMiddleware)
-app.include_router(auth_router)
-app.include_router(workouts_router)
-app.include_router(dashboard_router)
-
-@app.get("/health")
+# Per user (per client IP when unauthenticated); burst size, then a steady refill rate.
+RATE_LIMIT_RULES = [
+    RateLimitRule("POST", "/v1/workouts", burst=30, per_second=0.5),
+    RateLimitRule("GET", "/v1/dashboard/day", burst=60, per_second=2.0),
+    RateLimitRule("GET", "/v1/dashboard/trends", burst=20, per_second=0.5),
+]
+
+health_router = APIRouter()
+
+
+@health_router.get("/health")
 def health():
     return {"status": "ok"}
 
 
-@app.get("/healthz")
+@health_router.get("/healthz")
 def healthz():
     return {"status": "ok"}
 
-@app.get("/health/db")
+
+@health_router.get("/health/db")
 def health_db(db: Session = Depends(get_db)):
     db.execute(text("SELECT 1"))
     return {"db": "ok"}
+
+
+@health_router.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    database: Database = request.app.state.database
+    # Pool gauges only once this app has connected; a scrape shouldn't open the pool.
+    pool = pool_metrics(database.engine()) if database.engine_created else ()
+    extra = itertools.chain(pool, hashing_metrics(request.app.state.password_hashing))
+    return PlainTextResponse(registry.render(extra), media_type="text/plain; version=0.0.4")
+
+
+@health_router.get("/health/db/pool")
+def health_db_pool(request: Request):
+    app_settings: Settings = request.app.state.settings
+    return {
+        **request.app.state.database.engine().pool.stats(),
+        "worker_threads": anyio.to_thread.current_default_thread_limiter().total_tokens,
+        "pre_ping": app_settings.db_pre_ping,
+        "pgbouncer": app_settings.db_pgbouncer,
+    }
+
+
+@health_router.get("/health/password-hashing")
+def health_password_hashing(request: Request):
+    return request.app.state.password_hashing.stats()
+
+
+@health_router.get("/health/live-updates")
+def health_live_updates(request: Request):
+    return request.app.state.workout_changes.stats()
+
+
+def create_app(app_settings: Settings | None = None) -> FastAPI:
+    """Build the API for one process; connections and background workers start in the lifespan.
+
+    Run with ``uvicorn app.main:create_app --factory`` so each worker builds its own app.
+    """
+    app_settings = app_settings or default_settings
+    # Everything holding connections, threads or processes belongs to the app, so two apps never
+    # share, replace or stop each other's. Engines are still only built on first use.
+    database = Database(app_settings)
+    workout_changes = WorkoutChangeHub(app_settings.live_updates_max_subscribers, database)
+    session_revocations = SessionRevocations(database, poll_seconds=app_settings.revocation_poll_seconds)
+    password_hashing = PasswordHashingPool(
+        workers=app_settings.password_hash_workers,
+        max_pending=app_settings.password_hash_max_pending,
+        timeout_seconds=app_settings.password_hash_timeout_seconds,
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        logging.basicConfig(level=logging.INFO)
+        # Sync endpoints hold a pooled connection for most of their run, so threads beyond the pool
+        # only queue on checkout. Signup and login await bcrypt on the event loop, not on a thread.
+        anyio.to_thread.current_default_thread_limiter().total_tokens = app_settings.worker_threads or (
+            app_settings.db_pool_size + app_settings.db_max_overflow
+        )
+        session_revocations.start()
+        yield
+        workout_changes.stop()
+        session_revocations.stop()
+        password_hashing.shutdown()
+        database.dispose()
+
+    app = FastAPI(title="Athos Fitness Platform API", lifespan=lifespan)
+    app.state.settings = app_settings
+    app.state.database = database
+    app.state.workout_changes = workout_changes
+    app.state.session_revocations = session_revocations
+    app.state.password_hashing = password_hashing
+    app.state.user_cache = AuthenticatedUserCache(
+        app_settings.auth_user_cache_ttl_seconds, app_settings.auth_user_cache_max_entries
+    )
+    app.state.exercise_prefixes = ExercisePrefixCache(
+        app_settings.exercise_index_ttl_seconds, app_settings.exercise_index_max_users
+    )
+    if app_settings.rate_limit_enabled:
+        # Added before CORS so 429 responses still carry CORS headers.
+        app.add_middleware(RateLimitMiddleware, rules=RATE_LIMIT_RULES)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[
+            "http://localhost:5173",
+            "http://127.0.0.1:5173",
+        ],
+        allow_credentials=False,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=[
+            "Authorization",
+            "Content-Type",
+            "X-Client-Timezone",
+            "X-Profile-Token",
+            "X-Consistency-Token",
+            "If-Match",
+        ],
+        expose_headers=[
+            "X-Request-ID",
+            "Retry-After",
+            "Server-Timing",
+            "X-Profile-Id",
+            "X-Consistency-Token",
+            "ETag",
+        ],
+    )
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.include_router(auth_router)
+    app.include_router(workouts_router)
+    app.include_router(dashboard_router)
+    app.include_router(personal_records_router)
+    app.include_router(exercises_router)
+    app.include_router(health_router)
+    return app
+
+
+_default_app: FastAPI | None = None
+
+
+def __getattr__(name: str):
+    # ``app.main:app`` keeps working for existing uvicorn commands; it is built on first access.
+    global _default_app
+    if name == "app":
+        if _default_app is None:
+            _default_app = create_app()
+        return _default_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
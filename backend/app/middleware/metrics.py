@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import time
+
+from app.core.metrics import http_request_duration_seconds, http_requests_in_flight, http_requests_total
+
+# Requests that never reached a route (404s, CORS preflight) share one label
+# so arbitrary paths cannot grow the series count.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Records in-flight requests, per-route latency and status counts using the route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            # The router writes the matched route into this same scope dict.
+            route = scope.get("route")
+            route_label = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            http_request_duration_seconds.observe(time.perf_counter() - started, (method, route_label))
+            http_requests_total.inc((method, route_label, str(status_code)))
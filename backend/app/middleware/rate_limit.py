@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import math
+import time
+
+from jose import JWTError
+from starlette.routing import BaseRoute, Match
+
+from app.core.security import VerifiedTokenCache, decode_access_claims
+from app.core.ttl_cache import TTLCache
+
+DEFAULT_MAX_KEYS = 50_000
+# Tokens that failed verification fall back to the IP key without being re-verified for this long.
+REJECTED_TOKEN_TTL_SECONDS = 60.0
+REJECTED_TOKEN_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Token bucket for one method + path: ``burst`` requests at once, refilled at ``per_second``."""
+
+    method: str
+    path: str
+    burst: int
+    per_second: float
+
+
+class TokenBuckets:
+    """Bucket state for one rule, keyed by user or client IP, capped at ``max_keys`` (LRU).
+
+    Only touched from the event loop thread, so it needs no locking. An evicted
+    key simply starts again with a full bucket.
+    """
+
+    def __init__(self, rule: RateLimitRule, max_keys: int = DEFAULT_MAX_KEYS):
+        self.rule = rule
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def take(self, key: str, now: float) -> float:
+        """Spend one token; returns 0.0 when allowed, else seconds until a token is available."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [self.rule.burst - 1.0, now]
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+        self._buckets.move_to_end(key)
+        tokens = min(self.rule.burst, bucket[0] + (now - bucket[1]) * self.rule.per_second)
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return 0.0
+        bucket[0] = tokens
+        return (1.0 - tokens) / self.rule.per_second
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _client_key(scope, rejected_tokens: TTLCache[bytes, bool]) -> str:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                # Both outcomes are cached, so a repeated forged or expired token is not re-verified either.
+                rejected_key = VerifiedTokenCache.digest(token)
+                if rejected_tokens.get(rejected_key) is None:
+                    try:
+                        return f"user:{decode_access_claims(token).user_id}"
+                    except (JWTError, ValueError):
+                        rejected_tokens.set(rejected_key, True)
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    """Pure ASGI per-route rate limiter answering 429 with Retry-After when a bucket is empty."""
+
+    def __init__(self, app, rules: list[RateLimitRule], max_keys: int = DEFAULT_MAX_KEYS):
+        self.app = app
+        self._limits = {(rule.method, rule.path): TokenBuckets(rule, max_keys) for rule in rules}
+        self._routes: dict[tuple[str, str], BaseRoute | None] = {}
+        self._rejected_tokens: TTLCache[bytes, bool] = TTLCache(REJECTED_TOKEN_TTL_SECONDS, REJECTED_TOKEN_MAX_ENTRIES)
+
+    def _route_for(self, scope) -> BaseRoute | None:
+        """The app route a limited path belongs to, resolved once per rule since limited paths are literal."""
+        key = (scope["method"], scope["path"])
+        if key not in self._routes:
+            router = getattr(scope.get("app"), "router", None)
+            routes = router.routes if router is not None else ()
+            self._routes[key] = next((route for route in routes if route.matches(scope)[0] == Match.FULL), None)
+        return self._routes[key]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        buckets = self._limits.get((scope["method"], scope["path"]))
+        if buckets is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = buckets.take(_client_key(scope, self._rejected_tokens), time.monotonic())
+        if retry_after == 0.0:
+            await self.app(scope, receive, send)
+            return
+
+        # The router never sees a rejected request; record its route so metrics label the 429 by template.
+        route = self._route_for(scope)
+        if route is not None:
+            scope["route"] = route
+
+        body = json.dumps({"detail": "Rate limit exceeded"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -4,45 +4,65 @@ import logging
 import time
 from uuid import uuid4
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import PlainTextResponse
 
 logger = logging.getLogger("athos.request")
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("X-Request-ID") or str(uuid4())
-        request.state.request_id = request_id
+def _header(scope, name: bytes) -> str | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class RequestLoggingMiddleware:
+    """Tags every HTTP response with X-Request-ID and logs one request_complete line.
+
+    Implemented as plain ASGI so responses, including streaming ones, pass
+    through without the extra task and body stream of BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _header(scope, b"x-request-id") or str(uuid4())
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
         started = time.perf_counter()
+        status_code = 500
+        response_started = False
+
+        async def send_with_request_id(message):
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         except Exception:
+            if response_started:
+                raise
             response = PlainTextResponse("Internal Server Error", status_code=500)
             response.headers["X-Request-ID"] = request_id
-            duration_ms = (time.perf_counter() - started) * 1000.0
+            await response(scope, receive, send)
+            status_code = 500
+        finally:
             logger.info(
                 "request_complete request_id=%s method=%s path=%s status_code=%s duration_ms=%.2f user_id=%s",
                 request_id,
-                request.method,
-                request.url.path,
-                response.status_code,
-                duration_ms,
-                getattr(request.state, "user_id", None),
+                scope["method"],
+                scope["path"],
+                status_code,
+                (time.perf_counter() - started) * 1000.0,
+                state.get("user_id"),
             )
-            return response
-
-        response.headers["X-Request-ID"] = request_id
-        duration_ms = (time.perf_counter() - started) * 1000.0
-        logger.info(
-            "request_complete request_id=%s method=%s path=%s status_code=%s duration_ms=%.2f user_id=%s",
-            request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration_ms,
-            getattr(request.state, "user_id", None),
-        )
-        return response
@@ -1,14 +1,31 @@
 from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
 
+def _check_timezone(value: str | None) -> str | None:
+    if value is None:
+        return value
+    try:
+        ZoneInfo(value)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError("timezone must be a valid IANA timezone name") from None
+    return value
+
+
 class SignupRequest(BaseModel):
     email: EmailStr
     name: str = Field(min_length=1, max_length=120)
     password: str = Field(min_length=8)
     birth_year: int
     birth_month: int
+    timezone: str | None = Field(default=None, max_length=64)
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, value: str | None) -> str | None:
+        return _check_timezone(value)
 
     @field_validator("birth_year")
     @classmethod
@@ -34,6 +51,11 @@ class LoginRequest(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str = Field(min_length=1, max_length=255)
 
 
 class MeResponse(BaseModel):
@@ -42,3 +64,14 @@ class MeResponse(BaseModel):
     name: str
     birth_year: int
     birth_month: int
+    timezone: str | None = None
+
+
+class MeUpdateRequest(BaseModel):
+    # Default zone for workouts logged without X-Client-Timezone.
+    timezone: str = Field(max_length=64)
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, value: str) -> str:
+        return _check_timezone(value)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -29,6 +29,7 @@ class WorkoutDashboardItemResponse(BaseModel):
     title: str | None
     start_ts: datetime
     end_ts: datetime | None
+    local_date: date | None = None
     source: str | None
     provider: str | None
     client_uuid: UUID | None
@@ -63,3 +64,22 @@ class DayTelemetryResponse(BaseModel):
 class DashboardDayResponse(BaseModel):
     workouts: list[WorkoutDashboardItemResponse] = Field(default_factory=list)
     telemetry: DayTelemetryResponse
+
+
+class TrainingLoadSeriesResponse(BaseModel):
+    daily_load: list[float] = Field(default_factory=list)
+    rolling_7d_load: list[float] = Field(default_factory=list)
+    rolling_28d_load: list[float] = Field(default_factory=list)
+    acute_chronic_ratio: list[float | None] = Field(default_factory=list)
+
+
+class MuscleGroupTrendResponse(TrainingLoadSeriesResponse):
+    muscle_group: str
+
+
+class TrainingLoadTrendsResponse(BaseModel):
+    start_date: date
+    end_date: date
+    dates: list[date] = Field(default_factory=list)
+    overall: TrainingLoadSeriesResponse
+    muscle_groups: list[MuscleGroupTrendResponse] = Field(default_factory=list)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ExerciseHistorySetResponse(BaseModel):
+    id: UUID
+    workout_id: UUID
+    performed_at: datetime
+    set_index: int
+    weight: float | None
+    reps: int | None
+    duration_seconds: int | None
+    rpe: float | None
+    notes: str | None
+    estimated_1rm: float | None
+
+
+class ExerciseHistoryPageResponse(BaseModel):
+    exercise_id: UUID
+    exercise_name: str
+    items: list[ExerciseHistorySetResponse] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class ExerciseChartPointResponse(BaseModel):
+    date: date
+    max_weight: float | None
+    volume: float
+    best_estimated_1rm: float | None
+    set_count: int
+
+
+class ExerciseChartResponse(BaseModel):
+    exercise_id: UUID
+    exercise_name: str
+    method: Literal["bucket", "lttb"]
+    period_days: int
+    source_point_count: int
+    points: list[ExerciseChartPointResponse] = Field(default_factory=list)
+
+
+class ExerciseSearchItemResponse(BaseModel):
+    id: UUID
+    name: str
+    # "prefix" for typeahead matches on the start of a word, "fuzzy" for trigram matches.
+    match: Literal["prefix", "fuzzy"]
+
+
+class ExerciseSearchResponse(BaseModel):
+    items: list[ExerciseSearchItemResponse] = Field(default_factory=list)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class PersonalRecordResponse(BaseModel):
+    exercise_id: UUID
+    exercise_name: str
+    max_weight: float | None
+    max_weight_achieved_at: datetime | None
+    best_set_load: float | None
+    best_set_load_achieved_at: datetime | None
+    best_estimated_1rm: float | None
+    best_estimated_1rm_achieved_at: datetime | None
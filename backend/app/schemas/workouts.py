@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -71,11 +71,59 @@ class WorkoutCreateRequest(BaseModel):
         return self
 
 
+class WorkoutUpdateRequest(BaseModel):
+    """Partial update; only the fields present in the request body are written."""
+
+    title: str | None = Field(default=None, max_length=255)
+    start_ts: datetime | None = None
+    end_ts: datetime | None = None
+    source: str | None = Field(default=None, max_length=50)
+    provider: str | None = Field(default=None, max_length=100)
+
+    @model_validator(mode="after")
+    def validate_changes(self) -> "WorkoutUpdateRequest":
+        if not self.model_fields_set:
+            raise ValueError("Provide at least one field to update")
+        if "start_ts" in self.model_fields_set and self.start_ts is None:
+            raise ValueError("start_ts cannot be null")
+        return self
+
+
+class StrengthSetUpdateRequest(BaseModel):
+    """Partial update of one set; only the fields present in the request body are written."""
+
+    exercise_id: UUID | None = None
+    set_index: int | None = Field(default=None, ge=1)
+    weight: float | None = None
+    reps: int | None = Field(default=None, ge=0)
+    duration_seconds: int | None = Field(default=None, ge=0)
+    rpe: float | None = None
+    notes: str | None = None
+
+    @model_validator(mode="after")
+    def validate_changes(self) -> "StrengthSetUpdateRequest":
+        if not self.model_fields_set:
+            raise ValueError("Provide at least one field to update")
+        for field in ("exercise_id", "set_index"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+
+class PersonalRecordHitResponse(BaseModel):
+    exercise_id: UUID
+    exercise_name: str
+    max_weight: bool = False
+    best_set_load: bool = False
+    best_estimated_1rm: bool = False
+
+
 class WorkoutCreateResponse(BaseModel):
     workout_id: UUID
     workout_type: Modality
     strength_set_count: int = 0
     cardio_session_created: bool = False
+    personal_records: list[PersonalRecordHitResponse] = Field(default_factory=list)
 
 
 class WorkoutListItemResponse(BaseModel):
@@ -86,6 +134,7 @@ class WorkoutListItemResponse(BaseModel):
     title: str | None
     start_ts: datetime
     end_ts: datetime | None
+    local_date: date
     source: str | None
     provider: str | None
     client_uuid: UUID | None
@@ -93,6 +142,11 @@ class WorkoutListItemResponse(BaseModel):
     cardio_session_created: bool = False
 
 
+class WorkoutCalendarDayResponse(BaseModel):
+    date: date
+    workout_count: int
+
+
 class StrengthSetDetailResponse(BaseModel):
     id: UUID
     workout_id: UUID
@@ -126,8 +180,10 @@ class WorkoutDetailResponse(BaseModel):
     title: str | None
     start_ts: datetime
     end_ts: datetime | None
+    local_date: date
     source: str | None
     provider: str | None
     client_uuid: UUID | None
+    version: int
     strength_sets: list[StrengthSetDetailResponse] = Field(default_factory=list)
     cardio_session: CardioSessionDetailResponse | None = None
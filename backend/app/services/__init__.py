@@ -0,0 +1 @@
+"""Domain logic shared by API routers and background jobs."""
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def bucket_bounds(day_ordinals: np.ndarray, budget: int) -> tuple[np.ndarray, np.ndarray, int]:
+    """Split sorted day ordinals into at most ``budget`` equal-width periods.
+
+    Returns the start offset of each non-empty period within the input, the
+    ordinal of each period's first day and the period width in days.
+    """
+    first = int(day_ordinals[0])
+    span = int(day_ordinals[-1]) - first + 1
+    width = max(1, -(-span // budget))
+    period = (day_ordinals - first) // width
+    starts = np.flatnonzero(np.r_[True, period[1:] != period[:-1]])
+    return starts, first + period[starts] * width, width
+
+
+def reduce_max(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-period maximum ignoring NaN (all-NaN periods stay NaN)."""
+    return np.fmax.reduceat(values, starts)
+
+
+def reduce_sum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    return np.add.reduceat(values, starts)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets point selection.
+
+    Keeps the first and last points and, for each of ``threshold - 2`` buckets
+    in between, the point forming the largest triangle with the previously
+    selected point and the average of the next bucket.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    buckets = np.array_split(np.arange(1, n - 1), threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    anchor = 0
+    for i, bucket in enumerate(buckets):
+        following = buckets[i + 1] if i + 1 < len(buckets) else np.array([n - 1])
+        avg_x = x[following].mean()
+        avg_y = y[following].mean()
+        areas = np.abs(
+            (x[anchor] - avg_x) * (y[bucket] - y[anchor])
+            - (x[anchor] - x[bucket]) * (avg_y - y[anchor])
+        )
+        anchor = int(bucket[np.argmax(areas)])
+        selected[i + 1] = anchor
+    return selected
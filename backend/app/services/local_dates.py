@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from sqlalchemy import Date, cast, func, update
+from sqlalchemy.orm import Session
+
+from app.db.archive import archived_workouts
+from app.db.models.user import User
+from app.db.models.workout import Workout
+
+
+def rederive_local_dates(db: Session, user_id: int, zone_name: str) -> int:
+    """Recompute local_date in zone_name for the user's workouts whose date was derived in UTC.
+
+    Migration 048b821145f1 backfilled local_date in UTC for users without a
+    stored timezone; rows whose local_date differs from the UTC day were written
+    with an explicit client zone and are left alone. The caller commits.
+    """
+    updated = 0
+    for workouts in (Workout.__table__, archived_workouts):
+        utc_day = cast(func.timezone("UTC", workouts.c.start_ts), Date)
+        updated += db.execute(
+            update(workouts)
+            .where(workouts.c.user_id == user_id, workouts.c.local_date == utc_day)
+            .values(
+                local_date=cast(func.timezone(zone_name, workouts.c.start_ts), Date),
+                version=workouts.c.version + 1,
+            )
+        ).rowcount
+    return updated
+
+
+def adopt_timezone(db: Session, user_id: int, zone_name: str) -> bool:
+    """Store zone_name as the user's default if none is set yet, re-deriving their UTC-backfilled dates.
+
+    Issued as a bulk UPDATE, so the caller must invalidate the identity cache after committing.
+    """
+    claimed = db.execute(
+        update(User).where(User.user_id == user_id, User.timezone.is_(None)).values(timezone=zone_name)
+    ).rowcount
+    if not claimed:
+        return False
+    rederive_local_dates(db, user_id, zone_name)
+    return True
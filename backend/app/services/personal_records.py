@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import Numeric, case, cast, delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.archive import ARCHIVE, HOT
+from app.db.models.personal_record import PersonalRecord
+from app.db.models.strength_set import StrengthSet
+
+# Epley estimates drift badly past roughly a dozen reps, so higher-rep sets
+# still count toward max weight and best set load but not toward e1RM.
+MAX_ESTIMATED_1RM_REPS = 12
+
+RECORD_METRICS = ("max_weight", "best_set_load", "best_estimated_1rm")
+
+
+def estimated_1rm(weight: float, reps: int) -> float | None:
+    if reps < 1 or reps > MAX_ESTIMATED_1RM_REPS:
+        return None
+    if reps == 1:
+        return weight
+    return weight * (1 + reps / 30)
+
+
+def estimated_1rm_sql(sets=StrengthSet):
+    """SQL counterpart of estimated_1rm over ``sets.weight``/``sets.reps`` (NULL outside the rep window)."""
+    return case(
+        (sets.reps == 1, sets.weight),
+        (
+            sets.reps.between(2, MAX_ESTIMATED_1RM_REPS),
+            func.round(sets.weight * (1 + cast(sets.reps, Numeric) / 30), 2),
+        ),
+    )
+
+
+@dataclass
+class PersonalBests:
+    max_weight: float | None = None
+    best_set_load: float | None = None
+    best_estimated_1rm: float | None = None
+
+    def offer(self, metric: str, value: float | None) -> None:
+        if value is None:
+            return
+        value = round(value, 2)
+        current = getattr(self, metric)
+        if current is None or value > current:
+            setattr(self, metric, value)
+
+
+@dataclass(frozen=True)
+class PersonalRecordHit:
+    exercise_id: UUID
+    max_weight: bool = False
+    best_set_load: bool = False
+    best_estimated_1rm: bool = False
+
+
+def best_performances(sets: Iterable[tuple[UUID, float | None, int | None]]) -> dict[UUID, PersonalBests]:
+    """Reduce (exercise_id, weight, reps) triples to per-exercise bests; unweighted sets are ignored."""
+    bests: dict[UUID, PersonalBests] = {}
+    for exercise_id, weight, reps in sets:
+        if weight is None:
+            continue
+        weight = float(weight)
+        exercise_bests = bests.setdefault(exercise_id, PersonalBests())
+        exercise_bests.offer("max_weight", weight)
+        if reps is not None:
+            exercise_bests.offer("best_set_load", weight * reps)
+            exercise_bests.offer("best_estimated_1rm", estimated_1rm(weight, reps))
+    return bests
+
+
+def record_personal_bests(
+    db: Session,
+    user_id: int,
+    achieved_at: datetime,
+    sets: Iterable[tuple[UUID, float | None, int | None]],
+) -> list[PersonalRecordHit]:
+    """Fold a workout's sets into personal_records and report which records were beaten.
+
+    Runs inside the caller's transaction. Rows are locked in primary-key order so
+    concurrent writes for the same exercise serialize instead of losing updates.
+    A hit is only reported when an earlier record existed and was improved on.
+    """
+    candidates = best_performances(sets)
+    if not candidates:
+        return []
+
+    exercise_ids = sorted(candidates)
+    db.execute(
+        pg_insert(PersonalRecord)
+        .values([{"user_id": user_id, "exercise_id": exercise_id} for exercise_id in exercise_ids])
+        .on_conflict_do_nothing(index_elements=[PersonalRecord.user_id, PersonalRecord.exercise_id])
+    )
+    records = db.execute(
+        select(PersonalRecord)
+        .where(
+            PersonalRecord.user_id == user_id,
+            PersonalRecord.exercise_id.in_(exercise_ids),
+        )
+        .order_by(PersonalRecord.exercise_id)
+        .with_for_update()
+    ).scalars().all()
+
+    hits: list[PersonalRecordHit] = []
+    for record in records:
+        candidate = candidates[record.exercise_id]
+        beaten: dict[str, bool] = {}
+        for metric in RECORD_METRICS:
+            value = getattr(candidate, metric)
+            if value is None:
+                continue
+            current = getattr(record, metric)
+            if current is None or value > float(current):
+                setattr(record, metric, value)
+                setattr(record, f"{metric}_achieved_at", achieved_at)
+                beaten[metric] = current is not None
+        if any(beaten.values()):
+            hits.append(PersonalRecordHit(exercise_id=record.exercise_id, **beaten))
+    return hits
+
+
+def _strength_history(user_id: int, exercise_ids: list[UUID] | None):
+    """The user's sets from the hot tables and the archive, as one subquery."""
+    selects = []
+    for sets in (HOT.strength_sets, ARCHIVE.strength_sets):
+        stmt = select(sets.exercise_id, sets.weight, sets.reps, sets.performed_at).where(
+            sets.user_id == user_id,
+            sets.deleted_at.is_(None),
+        )
+        if exercise_ids is not None:
+            stmt = stmt.where(sets.exercise_id.in_(exercise_ids))
+        selects.append(stmt)
+    return union_all(*selects).subquery("history")
+
+
+def _best_per_exercise(history, value, name: str):
+    return (
+        select(
+            history.c.exercise_id.label("exercise_id"),
+            value.label("value"),
+            history.c.performed_at.label("achieved_at"),
+        )
+        .where(value.is_not(None))
+        .distinct(history.c.exercise_id)
+        .order_by(history.c.exercise_id, value.desc(), history.c.performed_at.asc())
+        .subquery(name)
+    )
+
+
+def rebuild_personal_records(db: Session, user_id: int, exercise_ids: list[UUID] | None = None) -> int:
+    """Recompute a user's records from strength set history, optionally for a subset of exercises.
+
+    Archived sets count as well. Used by the backfill job; runs inside the caller's
+    transaction and returns the number of records written.
+    """
+    delete_stmt = delete(PersonalRecord).where(PersonalRecord.user_id == user_id)
+    if exercise_ids is not None:
+        delete_stmt = delete_stmt.where(PersonalRecord.exercise_id.in_(exercise_ids))
+    db.execute(delete_stmt)
+
+    history = _strength_history(user_id, exercise_ids)
+    max_weight = _best_per_exercise(history, history.c.weight, "max_weight")
+    best_load = _best_per_exercise(history, history.c.weight * history.c.reps, "best_load")
+    best_e1rm = _best_per_exercise(history, estimated_1rm_sql(history.c), "best_e1rm")
+
+    # Every weighted set contributes to max_weight, so it is a superset of the others.
+    source = (
+        select(
+            literal(user_id),
+            max_weight.c.exercise_id,
+            max_weight.c.value,
+            max_weight.c.achieved_at,
+            best_load.c.value,
+            best_load.c.achieved_at,
+            best_e1rm.c.value,
+            best_e1rm.c.achieved_at,
+        )
+        .outerjoin(best_load, best_load.c.exercise_id == max_weight.c.exercise_id)
+        .outerjoin(best_e1rm, best_e1rm.c.exercise_id == max_weight.c.exercise_id)
+    )
+    result = db.execute(
+        pg_insert(PersonalRecord).from_select(
+            [
+                PersonalRecord.user_id,
+                PersonalRecord.exercise_id,
+                PersonalRecord.max_weight,
+                PersonalRecord.max_weight_achieved_at,
+                PersonalRecord.best_set_load,
+                PersonalRecord.best_set_load_achieved_at,
+                PersonalRecord.best_estimated_1rm,
+                PersonalRecord.best_estimated_1rm_achieved_at,
+            ],
+            source,
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import hashlib
+import os
+import secrets
+import uuid
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.refresh_token import RefreshToken
+
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 30))
+
+
+class RefreshTokenRejected(Exception):
+    def __init__(self, reason: str, family_id: uuid.UUID | None = None):
+        super().__init__(reason)
+        self.reason = reason
+        # Set when the rejection revoked the whole session (refresh-token reuse).
+        self.family_id = family_id
+
+
+def _digest(raw_token: str) -> str:
+    return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+
+
+def issue_refresh_token(db: Session, user_id: int, family_id: uuid.UUID | None = None) -> tuple[uuid.UUID, str]:
+    """Add a refresh token row (starting a new session family unless one is given); the caller commits."""
+    raw_token = secrets.token_urlsafe(32)
+    family_id = family_id or uuid.uuid4()
+    db.add(
+        RefreshToken(
+            family_id=family_id,
+            user_id=user_id,
+            token_hash=_digest(raw_token),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    return family_id, raw_token
+
+
+def revoke_family(db: Session, family_id: uuid.UUID) -> None:
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+def rotate_refresh_token(db: Session, raw_token: str) -> tuple[int, uuid.UUID, str]:
+    """Spend a refresh token and issue its successor in the same family.
+
+    Presenting an already-rotated token means it leaked, so the whole family is
+    revoked. The caller commits in both the success and the rejection path.
+    """
+    token = db.execute(
+        select(RefreshToken).where(RefreshToken.token_hash == _digest(raw_token)).with_for_update()
+    ).scalar_one_or_none()
+    if token is None:
+        raise RefreshTokenRejected("unknown")
+    if token.revoked_at is not None:
+        raise RefreshTokenRejected("revoked")
+    if token.rotated_at is not None:
+        revoke_family(db, token.family_id)
+        raise RefreshTokenRejected("reused", family_id=token.family_id)
+
+    now = datetime.now(timezone.utc)
+    if token.expires_at <= now:
+        raise RefreshTokenRejected("expired")
+
+    token.rotated_at = now
+    _, successor = issue_refresh_token(db, token.user_id, token.family_id)
+    return token.user_id, token.family_id, successor
+
+
+def revoke_refresh_token(db: Session, raw_token: str) -> uuid.UUID | None:
+    """Revoke the session a refresh token belongs to; returns its family id, or None if unknown."""
+    family_id = db.execute(
+        select(RefreshToken.family_id).where(RefreshToken.token_hash == _digest(raw_token))
+    ).scalar_one_or_none()
+    if family_id is not None:
+        revoke_family(db, family_id)
+    return family_id
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+
+ACUTE_WINDOW_DAYS = 7
+CHRONIC_WINDOW_DAYS = 28
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling sum along axis 0 (partial windows at the start)."""
+    totals = np.cumsum(values, axis=0)
+    out = totals.copy()
+    out[window:] = totals[window:] - totals[:-window]
+    return out
+
+
+def acute_chronic_ratio(acute: np.ndarray, chronic: np.ndarray) -> np.ndarray:
+    """Acute load divided by average weekly chronic load; NaN when chronic load is zero."""
+    weekly_chronic = chronic * (ACUTE_WINDOW_DAYS / CHRONIC_WINDOW_DAYS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(weekly_chronic > 0, acute / weekly_chronic, np.nan)
+
+
+def daily_load_matrix(
+    day_index: np.ndarray,
+    column_index: np.ndarray,
+    loads: np.ndarray,
+    day_count: int,
+    column_count: int,
+) -> np.ndarray:
+    """Scatter (day, column, load) triples into a dense days x columns matrix."""
+    flat = np.bincount(
+        day_index * column_count + column_index,
+        weights=loads,
+        minlength=day_count * column_count,
+    )
+    return flat.reshape(day_count, column_count)
+
+
+def to_optional_floats(values: np.ndarray, decimals: int = 4) -> list[float | None]:
+    rounded = np.round(values, decimals).astype(object)
+    rounded[np.isnan(values)] = None
+    return rounded.tolist()
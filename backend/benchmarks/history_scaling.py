@@ -0,0 +1,130 @@
+"""Data-volume scaling benchmark: endpoint latency as a user's lifetime history grows.
+
+Run inside the backend container against a live server (rate limiting off):
+
+    RATE_LIMIT_ENABLED=false docker compose up -d
+    docker compose exec backend python -m benchmarks.history_scaling --base-workouts 10 --factors 1,10,100,1000
+
+One synthetic user is generated per factor with ``base-workouts * factor``
+workouts, one workout per day, so the day being read, the list page and the
+workout detail are the same size at every scale. Latency that still grows
+with the factor therefore grows with total history, not page size; such
+endpoints are flagged and the process exits non-zero.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from sqlalchemy import text
+
+from app.core.security import create_access_token, hash_password
+from app.db.session import SessionLocal
+from app.jobs.generate_synthetic_history import DEFAULT_PASSWORD, HistorySpec, generate_user_history
+
+ANALYZE_TABLES = ("users", "workouts", "strength_sets", "cardio_sessions", "exercises", "exercise_muscle_map")
+
+
+def _get(base: str, path: str, token: str) -> float:
+    req = Request(f"{base}{path}", headers={"Authorization": f"Bearer {token}", "X-Client-Timezone": "UTC"})
+    started = time.perf_counter()
+    try:
+        with urlopen(req, timeout=30) as resp:
+            resp.read()
+    except HTTPError as exc:
+        raise SystemExit(f"GET {path} failed with {exc.code}") from exc
+    return (time.perf_counter() - started) * 1000
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _endpoints(user) -> dict[str, str]:
+    day = user.last_day.isoformat()
+    return {
+        "list_workouts": f"/v1/workouts?date={day}&limit=20",
+        "get_workout": f"/v1/workouts/{user.strength_workout_ids[0]}",
+        "dashboard_day": f"/v1/dashboard/day?date={day}&limit=50&top_k=10",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", default="http://127.0.0.1:8000")
+    parser.add_argument("--base-workouts", type=int, default=10, help="workouts in the 1x history")
+    parser.add_argument("--factors", default="1,10,100,1000")
+    parser.add_argument("--sets-per-workout", type=int, default=8)
+    parser.add_argument("--samples", type=int, default=50, help="timed requests per endpoint and scale")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=2.0,
+        help="flag endpoints whose p50 at the largest scale exceeds this multiple of the smallest",
+    )
+    args = parser.parse_args()
+    factors = sorted(int(value) for value in args.factors.split(","))
+
+    password_hash = hash_password(DEFAULT_PASSWORD)
+    users = {}
+    with SessionLocal() as db:
+        for factor in factors:
+            spec = HistorySpec(workouts=args.base_workouts * factor, sets_per_workout=args.sets_per_workout, seed=factor)
+            started = time.perf_counter()
+            users[factor] = generate_user_history(db, spec, password_hash)
+            db.commit()
+            print(
+                f"generated {factor}x: workouts={len(users[factor].workout_ids)} "
+                f"sets={users[factor].set_count} in {time.perf_counter() - started:.1f}s",
+                file=sys.stderr,
+            )
+        for table in ANALYZE_TABLES:
+            db.execute(text(f"ANALYZE {table}"))
+        db.commit()
+
+    results: dict[str, dict[str, dict]] = {}
+    for factor in factors:
+        user = users[factor]
+        token = create_access_token(user.user_id)
+        for name, path in _endpoints(user).items():
+            for _ in range(args.warmup):
+                _get(args.base, path, token)
+            samples = [_get(args.base, path, token) for _ in range(args.samples)]
+            results.setdefault(name, {})[f"{factor}x"] = {
+                "history_workouts": len(user.workout_ids),
+                "history_sets": user.set_count,
+                "p50_ms": round(statistics.median(samples), 2),
+                "p95_ms": round(_percentile(samples, 0.95), 2),
+            }
+
+    flagged = []
+    for name, by_scale in results.items():
+        smallest, largest = by_scale[f"{factors[0]}x"], by_scale[f"{factors[-1]}x"]
+        growth = largest["p50_ms"] / smallest["p50_ms"] if smallest["p50_ms"] else 0.0
+        by_scale["p50_growth"] = round(growth, 2)
+        if growth > args.max_growth:
+            flagged.append(name)
+
+    report = {
+        "factors": factors,
+        "base_workouts": args.base_workouts,
+        "sets_per_workout": args.sets_per_workout,
+        "max_growth": args.max_growth,
+        "endpoints": results,
+        "scales_with_history": flagged,
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    if flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
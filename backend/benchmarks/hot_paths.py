@@ -0,0 +1,210 @@
+"""Micro-benchmark suite for in-process hot paths, compared against stored baselines.
+
+    JWT_SECRET=... DATABASE_URL=... python -m benchmarks.hot_paths
+    JWT_SECRET=... DATABASE_URL=... python -m benchmarks.hot_paths --save   # refresh the baseline
+
+No HTTP server or database is used; DATABASE_URL only has to parse. Each
+case reports the best and median per-call time over ``--repeat`` rounds; the
+best time, the less noisy of the two, is compared with
+``benchmarks/baselines/hot_paths.json`` and cases slower than ``--threshold``
+percent are listed as regressions. Baselines are machine-specific, so refresh
+them on the machine you compare on.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import timeit
+from typing import Callable
+from uuid import uuid4
+
+from starlette.responses import JSONResponse
+
+from app.api.v1.dashboard import _build_day_response
+from app.core.security import create_access_token, decode_access_token, verified_tokens
+from app.db.models.cardio_session import CardioSession
+from app.db.models.enums import Modality
+from app.db.models.strength_set import StrengthSet
+from app.db.models.workout import Workout
+from app.schemas.workouts import WorkoutCreateRequest
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "hot_paths.json"
+
+DAY_WORKOUTS = 12
+SETS_PER_WORKOUT = 25
+EXERCISES = 20
+CREATE_SET_COUNT = 200
+
+
+def _day_rows():
+    """Transient ORM rows shaped like the dashboard_day queries' results for one busy day."""
+    day = date(2026, 1, 15)
+    exercises = [(uuid4(), f"Lift {i}") for i in range(EXERCISES)]
+    groups = [f"Group {i}" for i in range(12)]
+    mappings = [
+        (exercise_id, offset == 0, groups[(i + offset) % len(groups)])
+        for i, (exercise_id, _) in enumerate(exercises)
+        for offset in range(3)
+    ]
+    workouts, strength_rows, cardio_rows = [], [], []
+    for w in range(DAY_WORKOUTS):
+        start_ts = datetime(2026, 1, 15, 6, tzinfo=timezone.utc) + timedelta(hours=w)
+        is_cardio = w % 4 == 3
+        workout = Workout(
+            id=uuid4(),
+            user_id=1,
+            workout_type=Modality.CARDIO if is_cardio else Modality.STRENGTH,
+            title=f"Workout {w}",
+            start_ts=start_ts,
+            end_ts=start_ts + timedelta(minutes=50),
+            local_date=day,
+        )
+        workouts.append(workout)
+        if is_cardio:
+            cardio_rows.append(
+                CardioSession(
+                    id=uuid4(),
+                    user_id=1,
+                    workout_id=workout.id,
+                    distance_miles=Decimal("3.100"),
+                    duration_seconds=1800,
+                )
+            )
+            continue
+        for s in range(SETS_PER_WORKOUT):
+            exercise_id, exercise_name = exercises[(w + s) % EXERCISES]
+            strength_rows.append(
+                (
+                    StrengthSet(
+                        id=uuid4(),
+                        user_id=1,
+                        workout_id=workout.id,
+                        exercise_id=exercise_id,
+                        set_index=s + 1,
+                        performed_at=start_ts,
+                        weight=Decimal(60 + s),
+                        reps=8,
+                        rpe=Decimal("8.00"),
+                    ),
+                    exercise_name,
+                )
+            )
+    return workouts, strength_rows, cardio_rows, mappings
+
+
+def _create_payload() -> dict:
+    return {
+        "workout_type": "STRENGTH",
+        "title": "Large session",
+        "start_ts": "2026-01-15T06:00:00+00:00",
+        "end_ts": "2026-01-15T08:00:00+00:00",
+        "client_uuid": str(uuid4()),
+        "strength_sets": [
+            {
+                "exercise_name": f"Lift {i % EXERCISES}",
+                "set_index": i + 1,
+                "weight": 60.0 + i % 40,
+                "reps": 8,
+                "rpe": 8.0,
+                "notes": "felt strong",
+            }
+            for i in range(CREATE_SET_COUNT)
+        ],
+    }
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    workouts, strength_rows, cardio_rows, mappings = _day_rows()
+    response = _build_day_response(workouts, strength_rows, cardio_rows, mappings, top_k=10)
+    payload = _create_payload()
+    token = create_access_token(42)
+
+    def decode_uncached():
+        verified_tokens.clear()
+        return decode_access_token(token)
+
+    return {
+        "dashboard_day_aggregation": lambda: _build_day_response(workouts, strength_rows, cardio_rows, mappings, 10),
+        "workout_create_validation": lambda: WorkoutCreateRequest.model_validate(payload),
+        "dashboard_day_serialization": lambda: JSONResponse(response.model_dump(mode="json")).body,
+        "decode_access_token_uncached": decode_uncached,
+        "decode_access_token_cached": lambda: decode_access_token(token),
+    }
+
+
+def _measure(call: Callable[[], object], repeat: int, min_time: float) -> dict:
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    per_call_us = [elapsed / number * 1e6 for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "best_us": round(min(per_call_us), 2),
+        "median_us": round(statistics.median(per_call_us), 2),
+        "calls_per_round": number,
+    }
+
+
+def _compare(results: dict, baseline: dict, threshold_pct: float) -> tuple[dict, list[str]]:
+    comparison, regressions = {}, []
+    for name, result in results.items():
+        previous = baseline.get("cases", {}).get(name)
+        if previous is None:
+            comparison[name] = {"status": "new"}
+            continue
+        change = (result["best_us"] - previous["best_us"]) / previous["best_us"] * 100.0
+        status = "regressed" if change > threshold_pct else "improved" if change < -threshold_pct else "unchanged"
+        comparison[name] = {
+            "baseline_best_us": previous["best_us"],
+            "best_us": result["best_us"],
+            "change_pct": round(change, 1),
+            "status": status,
+        }
+        if status == "regressed":
+            regressions.append(name)
+    return comparison, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="timed rounds per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="target seconds per round")
+    parser.add_argument("--only", action="append", help="run only this case (repeatable)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=30.0, help="percent slowdown counted as a regression")
+    args = parser.parse_args()
+
+    cases = _cases()
+    selected = args.only or list(cases)
+    results = {name: _measure(cases[name], args.repeat, args.min_time) for name in selected}
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": results,
+    }
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(json.dumps(report, indent=2, sort_keys=True))
+        return
+
+    regressions = []
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        report["comparison"], regressions = _compare(results, baseline, args.threshold)
+        report["regressions"] = regressions
+    print(json.dumps(report, indent=2, sort_keys=True))
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
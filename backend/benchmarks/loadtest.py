@@ -0,0 +1,263 @@
+"""Mixed-scenario load test for the full API, reporting per-endpoint latency percentiles as JSON.
+
+Run against a live stack (rate limiting off so the limiter does not shape the numbers):
+
+    RATE_LIMIT_ENABLED=false docker compose up -d
+    docker compose exec backend pip install -r benchmarks/requirements.txt
+    docker compose exec backend python -m benchmarks.loadtest --users 32 --duration 60 --output /tmp/run.json
+
+Each virtual user signs up, then loops over a weighted mix of workout creation
+(varying set counts), list, detail, day dashboard, trends and re-login. The mix
+is driven by ``--seed`` so two runs issue the same request sequence per user.
+Pass ``--baseline`` with an earlier report to add p95/throughput deltas.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+import json
+import random
+import sys
+import time
+from uuid import uuid4
+
+import httpx
+
+PASSWORD = "loadtest-password"
+SET_COUNTS = (1, 3, 5, 10, 20, 40)
+EXERCISES = ("Bench Press", "Back Squat", "Deadlift", "Overhead Press", "Barbell Row", "Pull Up", "Lunge", "Curl")
+
+# Relative weights of the steady-state scenarios a virtual user picks from.
+SCENARIO_WEIGHTS = {
+    "create_workout": 20,
+    "list_workouts": 20,
+    "workout_detail": 20,
+    "dashboard_day": 25,
+    "dashboard_trends": 10,
+    "login": 5,
+}
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+    def record(self, latency_ms: float, status: int | None, ok: bool) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.statuses[str(status) if status is not None else "transport_error"] += 1
+        if not ok:
+            self.errors += 1
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@dataclass
+class VirtualUser:
+    index: int
+    rng: random.Random
+    email: str
+    token: str | None = None
+    workout_ids: list[str] = field(default_factory=list)
+    days: list[date] = field(default_factory=list)
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, run_id: str, seed: int, deadline: float):
+        self.client = client
+        self.run_id = run_id
+        self.seed = seed
+        self.deadline = deadline
+        self.stats: dict[str, EndpointStats] = defaultdict(EndpointStats)
+
+    async def _call(self, name: str, method: str, path: str, user: VirtualUser | None = None, expected=(200,), **kwargs):
+        headers = {"X-Client-Timezone": "UTC"}
+        if user is not None and user.token:
+            headers["Authorization"] = f"Bearer {user.token}"
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.stats[name].record((time.perf_counter() - started) * 1000.0, None, False)
+            return None
+        self.stats[name].record((time.perf_counter() - started) * 1000.0, response.status_code, response.status_code in expected)
+        return response if response.status_code in expected else None
+
+    async def signup(self, user: VirtualUser) -> bool:
+        payload = {
+            "email": user.email,
+            "name": f"Load User {user.index}",
+            "password": PASSWORD,
+            "birth_year": 1990,
+            "birth_month": 1 + user.index % 12,
+            "timezone": "UTC",
+        }
+        response = await self._call("signup", "POST", "/v1/auth/signup", json=payload, expected=(201,))
+        if response is None:
+            return False
+        user.token = response.json()["access_token"]
+        return True
+
+    async def login(self, user: VirtualUser) -> None:
+        payload = {"email": user.email, "password": PASSWORD}
+        response = await self._call("login", "POST", "/v1/auth/login", json=payload)
+        if response is not None:
+            user.token = response.json()["access_token"]
+
+    async def create_workout(self, user: VirtualUser) -> None:
+        rng = user.rng
+        day = date.today() - timedelta(days=rng.randrange(0, 28))
+        start = datetime(day.year, day.month, day.day, rng.randrange(6, 21), tzinfo=timezone.utc)
+        set_count = rng.choice(SET_COUNTS)
+        exercises = rng.sample(EXERCISES, k=min(len(EXERCISES), 1 + set_count // 5))
+        payload = {
+            "workout_type": "STRENGTH",
+            "title": f"Load workout {set_count} sets",
+            "start_ts": start.isoformat(),
+            "end_ts": (start + timedelta(minutes=45)).isoformat(),
+            "strength_sets": [
+                {
+                    "exercise_name": exercises[i % len(exercises)],
+                    "weight": round(rng.uniform(20, 180), 1),
+                    "reps": rng.randrange(3, 15),
+                    "rpe": rng.choice((6.0, 7.0, 8.0, 9.0)),
+                }
+                for i in range(set_count)
+            ],
+        }
+        response = await self._call(
+            f"create_workout[{set_count}_sets]", "POST", "/v1/workouts", user, json=payload, expected=(201,)
+        )
+        if response is not None:
+            user.workout_ids.append(response.json()["workout_id"])
+            user.days.append(day)
+
+    def _pick_day(self, user: VirtualUser) -> date:
+        return user.rng.choice(user.days) if user.days else date.today()
+
+    async def list_workouts(self, user: VirtualUser) -> None:
+        params = {"date": self._pick_day(user).isoformat(), "limit": 20}
+        await self._call("list_workouts", "GET", "/v1/workouts", user, params=params)
+
+    async def workout_detail(self, user: VirtualUser) -> None:
+        if not user.workout_ids:
+            await self.create_workout(user)
+            return
+        workout_id = user.rng.choice(user.workout_ids)
+        await self._call("workout_detail", "GET", f"/v1/workouts/{workout_id}", user)
+
+    async def dashboard_day(self, user: VirtualUser) -> None:
+        params = {"date": self._pick_day(user).isoformat(), "limit": 50, "top_k": 10}
+        await self._call("dashboard_day", "GET", "/v1/dashboard/day", user, params=params)
+
+    async def dashboard_trends(self, user: VirtualUser) -> None:
+        end = date.today()
+        params = {"start": (end - timedelta(days=27)).isoformat(), "end": end.isoformat()}
+        await self._call("dashboard_trends", "GET", "/v1/dashboard/trends", user, params=params)
+
+    async def run_user(self, index: int) -> None:
+        user = VirtualUser(
+            index=index,
+            rng=random.Random(self.seed * 100_003 + index),
+            email=f"load-{self.run_id}-{index}@example.com",
+        )
+        if not await self.signup(user):
+            return
+        names = list(SCENARIO_WEIGHTS)
+        weights = list(SCENARIO_WEIGHTS.values())
+        while time.perf_counter() < self.deadline:
+            scenario = user.rng.choices(names, weights=weights)[0]
+            await getattr(self, scenario)(user)
+
+
+def _report(stats: dict[str, EndpointStats], elapsed: float, args) -> dict:
+    endpoints = {}
+    for name in sorted(stats):
+        entry = stats[name]
+        count = len(entry.latencies_ms)
+        endpoints[name] = {
+            "count": count,
+            "throughput_rps": round(count / elapsed, 2),
+            "errors": entry.errors,
+            "error_rate": round(entry.errors / count, 4) if count else 0.0,
+            "p50_ms": round(_percentile(entry.latencies_ms, 0.50), 2),
+            "p95_ms": round(_percentile(entry.latencies_ms, 0.95), 2),
+            "p99_ms": round(_percentile(entry.latencies_ms, 0.99), 2),
+            "max_ms": round(max(entry.latencies_ms, default=0.0), 2),
+            "statuses": dict(sorted(entry.statuses.items())),
+        }
+    total = sum(item["count"] for item in endpoints.values())
+    errors = sum(item["errors"] for item in endpoints.values())
+    return {
+        "config": {"base": args.base, "users": args.users, "duration_s": args.duration, "seed": args.seed},
+        "elapsed_s": round(elapsed, 2),
+        "total_requests": total,
+        "throughput_rps": round(total / elapsed, 2),
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def _compare(report: dict, baseline: dict) -> dict:
+    def change(new: float, old: float) -> float | None:
+        return round((new - old) / old * 100.0, 1) if old else None
+
+    comparison = {"throughput_change_pct": change(report["throughput_rps"], baseline["throughput_rps"]), "endpoints": {}}
+    for name, entry in report["endpoints"].items():
+        previous = baseline["endpoints"].get(name)
+        if previous is None:
+            continue
+        comparison["endpoints"][name] = {
+            "p95_change_pct": change(entry["p95_ms"], previous["p95_ms"]),
+            "p99_change_pct": change(entry["p99_ms"], previous["p99_ms"]),
+            "error_rate_delta": round(entry["error_rate"] - previous["error_rate"], 4),
+        }
+    return comparison
+
+
+async def _run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base, timeout=args.timeout, limits=limits) as client:
+        started = time.perf_counter()
+        load = LoadTest(client, run_id=uuid4().hex[:10], seed=args.seed, deadline=started + args.duration)
+        await asyncio.gather(*(load.run_user(index) for index in range(args.users)))
+        return _report(load.stats, time.perf_counter() - started, args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=16, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of steady-state load")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="also write the JSON report to this path")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    args = parser.parse_args()
+
+    report = asyncio.run(_run(args))
+    if args.baseline:
+        with open(args.baseline) as handle:
+            report["comparison"] = _compare(report, json.load(handle))
+    rendered = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(rendered + "\n")
+    print(rendered)
+    if report["error_rate"] > args.max_error_rate:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Login-storm load test: non-auth read latency with and without a concurrent login flood.
+
+Run against a live server:
+
+    python -m benchmarks.login_storm --base http://127.0.0.1:8000 --storm-threads 64
+
+Exits non-zero when the read p95 during the storm exceeds ``--max-slowdown``
+times the quiet p95.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+import json
+import statistics
+import sys
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from uuid import uuid4
+
+
+def _request(base: str, method: str, path: str, payload: dict | None = None, token: str | None = None):
+    headers = {"Content-Type": "application/json", "X-Client-Timezone": "UTC"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = Request(f"{base}{path}", data=data, headers=headers, method=method)
+    try:
+        with urlopen(req, timeout=30) as resp:
+            return resp.status, json.loads(resp.read() or b"null")
+    except HTTPError as exc:
+        return exc.code, None
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _measure_reads(base: str, token: str, day: str, count: int) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        status, _ = _request(base, "GET", f"/v1/dashboard/day?date={day}&limit=50&top_k=10", token=token)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if status != 200:
+            raise SystemExit(f"dashboard read failed with {status}")
+    return latencies
+
+
+def _storm(base: str, email: str, password: str, stop: threading.Event, statuses: Counter, lock: threading.Lock):
+    while not stop.is_set():
+        status, _ = _request(base, "POST", "/v1/auth/login", payload={"email": email, "password": password})
+        with lock:
+            statuses[status] += 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", default="http://127.0.0.1:8000")
+    parser.add_argument("--storm-threads", type=int, default=64)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--max-slowdown", type=float, default=3.0)
+    args = parser.parse_args()
+
+    email = f"storm.{uuid4().hex[:10]}@example.com"
+    password = f"Pw-{uuid4().hex[:12]}"
+    status, body = _request(
+        args.base,
+        "POST",
+        "/v1/auth/signup",
+        payload={"email": email, "name": "Storm", "password": password, "birth_year": 1990, "birth_month": 1},
+    )
+    if status != 201:
+        raise SystemExit(f"signup failed with {status}")
+    token = body["access_token"]
+    day = "2026-02-06"
+    _request(
+        args.base,
+        "POST",
+        "/v1/workouts",
+        payload={
+            "workout_type": "STRENGTH",
+            "start_ts": f"{day}T17:00:00Z",
+            "strength_sets": [{"exercise_name": "Bench Press", "weight": 135, "reps": 8}],
+        },
+        token=token,
+    )
+
+    quiet = _measure_reads(args.base, token, day, args.reads)
+
+    stop = threading.Event()
+    statuses: Counter = Counter()
+    lock = threading.Lock()
+    workers = [
+        threading.Thread(target=_storm, args=(args.base, email, password, stop, statuses, lock), daemon=True)
+        for _ in range(args.storm_threads)
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(1.0)
+    stormy = _measure_reads(args.base, token, day, args.reads)
+    stop.set()
+    for worker in workers:
+        worker.join(timeout=35)
+
+    _, pool_stats = _request(args.base, "GET", "/health/password-hashing")
+    quiet_p95 = _percentile(quiet, 0.95)
+    stormy_p95 = _percentile(stormy, 0.95)
+    report = {
+        "quiet_ms": {"p50": round(statistics.median(quiet), 2), "p95": round(quiet_p95, 2)},
+        "storm_ms": {"p50": round(statistics.median(stormy), 2), "p95": round(stormy_p95, 2)},
+        "login_statuses": dict(statuses),
+        "password_hashing": pool_stats,
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0 if stormy_p95 <= quiet_p95 * args.max_slowdown else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Micro-benchmark: per-request cost of request logging as BaseHTTPMiddleware vs plain ASGI.
+
+    python -m benchmarks.middleware_overhead --requests 20000
+
+Log output is disabled so only the middleware machinery is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from uuid import uuid4
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+
+from app.middleware.request_logging import RequestLoggingMiddleware, logger
+
+
+class BaseHTTPRequestLogging(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware implementation, kept here as the comparison baseline."""
+
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID") or str(uuid4())
+        request.state.request_id = request_id
+        started = time.perf_counter()
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        logger.info(
+            "request_complete request_id=%s method=%s path=%s status_code=%s duration_ms=%.2f user_id=%s",
+            request_id,
+            request.method,
+            request.url.path,
+            response.status_code,
+            (time.perf_counter() - started) * 1000.0,
+            getattr(request.state, "user_id", None),
+        )
+        return response
+
+
+SCOPE = {
+    "type": "http",
+    "http_version": "1.1",
+    "method": "GET",
+    "path": "/health",
+    "raw_path": b"/health",
+    "scheme": "http",
+    "query_string": b"",
+    "headers": [],
+    "client": ("bench", 1234),
+    "server": ("bench", 80),
+}
+
+
+async def _drive(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    logging.getLogger("athos.request").disabled = True
+
+    endpoint = PlainTextResponse("ok")
+    bare = asyncio.run(_drive(endpoint, args.requests))
+    legacy = asyncio.run(_drive(BaseHTTPRequestLogging(endpoint), args.requests))
+    asgi = asyncio.run(_drive(RequestLoggingMiddleware(endpoint), args.requests))
+    report = {
+        "requests": args.requests,
+        "bare_us": round(bare, 2),
+        "base_http_middleware_overhead_us": round(legacy - bare, 2),
+        "asgi_middleware_overhead_us": round(asgi - bare, 2),
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
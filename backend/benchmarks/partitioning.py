@@ -0,0 +1,170 @@
+"""Insert and read latency of workouts/strength_sets, for comparing table layouts.
+
+Run once per schema revision and compare:
+
+    docker compose exec backend alembic downgrade 9c3e5f1a2b7d     # unpartitioned
+    docker compose exec backend python -m benchmarks.partitioning --output /tmp/plain.json
+    docker compose exec backend alembic upgrade head                # hash-partitioned
+    docker compose exec backend python -m benchmarks.partitioning --baseline /tmp/plain.json
+
+Background users are generated first so the tables hold many users' history.
+The measured user's writes go through the ORM as create_workout does, and its
+reads run the same statements as list_workouts, get_workout and dashboard_day.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import json
+import statistics
+import time
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from app.api.v1.dashboard import _day_strength_rows_stmt, _day_workouts_stmt
+from app.api.v1.workouts import _list_workouts_stmt, _workout_strength_rows_stmt
+from app.core.security import hash_password
+from app.db.models.enums import Modality
+from app.db.models.strength_set import StrengthSet
+from app.db.models.workout import Workout
+from app.db.session import SessionLocal
+from app.jobs.generate_synthetic_history import DEFAULT_PASSWORD, HistorySpec, generate_user_history
+
+
+def _percentiles(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 3),
+    }
+
+
+def _layout(db) -> str:
+    partitioned = db.execute(
+        text("SELECT count(*) FROM pg_partitioned_table WHERE partrelid = 'strength_sets'::regclass")
+    ).scalar_one()
+    return "hash_partitioned" if partitioned else "plain"
+
+
+def _insert_workouts(db, user, exercise_ids, count: int, sets_per_workout: int) -> list[float]:
+    latencies = []
+    for w in range(count):
+        start_ts = datetime.now(timezone.utc) - timedelta(minutes=w)
+        started = time.perf_counter()
+        workout = Workout(
+            user_id=user.user_id,
+            workout_type=Modality.STRENGTH,
+            start_ts=start_ts,
+            local_date=start_ts.date(),
+            client_uuid=uuid4(),
+        )
+        db.add(workout)
+        db.flush()
+        for s in range(sets_per_workout):
+            db.add(
+                StrengthSet(
+                    user_id=user.user_id,
+                    workout_id=workout.id,
+                    exercise_id=exercise_ids[s % len(exercise_ids)],
+                    set_index=s + 1,
+                    performed_at=start_ts,
+                    weight=100,
+                    reps=5,
+                )
+            )
+        db.commit()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def _time_statement(db, stmt, samples: int) -> list[float]:
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        db.execute(stmt).all()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--background-users", type=int, default=50)
+    parser.add_argument("--workouts-per-user", type=int, default=300)
+    parser.add_argument("--sets-per-workout", type=int, default=8)
+    parser.add_argument("--inserts", type=int, default=200, help="timed workout inserts for the measured user")
+    parser.add_argument("--samples", type=int, default=200, help="timed executions per read statement")
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    args = parser.parse_args()
+
+    password_hash = hash_password(DEFAULT_PASSWORD)
+    with SessionLocal() as db:
+        layout = _layout(db)
+        for index in range(args.background_users):
+            spec = HistorySpec(workouts=args.workouts_per_user, sets_per_workout=args.sets_per_workout, seed=index)
+            generate_user_history(db, spec, password_hash)
+            db.commit()
+        user = generate_user_history(
+            db, HistorySpec(workouts=args.workouts_per_user, sets_per_workout=args.sets_per_workout), password_hash
+        )
+        db.commit()
+        db.execute(text("ANALYZE workouts"))
+        db.execute(text("ANALYZE strength_sets"))
+        db.commit()
+
+        exercise_ids = [
+            row[0]
+            for row in db.execute(
+                text("SELECT id FROM exercises WHERE user_id = :user_id ORDER BY name"), {"user_id": user.user_id}
+            )
+        ]
+        insert_ms = _insert_workouts(db, user, exercise_ids, args.inserts, args.sets_per_workout)
+
+        day_workout_ids = [user.strength_workout_ids[0]]
+        reads = {
+            "list_workouts": _list_workouts_stmt(user.user_id, user.last_day, 20),
+            "get_workout_sets": _workout_strength_rows_stmt(user.user_id, user.strength_workout_ids[0]),
+            "dashboard_day_workouts": _day_workouts_stmt(user.user_id, user.last_day, 50),
+            "dashboard_day_strength_rows": _day_strength_rows_stmt(user.user_id, day_workout_ids),
+        }
+        read_ms = {name: _percentiles(_time_statement(db, stmt, args.samples)) for name, stmt in reads.items()}
+
+    report = {
+        "layout": layout,
+        "rows": {
+            "users": args.background_users + 1,
+            "workouts_per_user": args.workouts_per_user,
+            "sets_per_workout": args.sets_per_workout,
+        },
+        "insert_workout_with_sets": _percentiles(insert_ms),
+        "reads": read_ms,
+    }
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+
+        def change(new: float, old: float) -> float | None:
+            return round((new - old) / old * 100.0, 1) if old else None
+
+        report["comparison"] = {
+            "baseline_layout": baseline["layout"],
+            "insert_p50_change_pct": change(
+                report["insert_workout_with_sets"]["p50_ms"], baseline["insert_workout_with_sets"]["p50_ms"]
+            ),
+            "reads_p50_change_pct": {
+                name: change(entry["p50_ms"], baseline["reads"][name]["p50_ms"])
+                for name, entry in read_ms.items()
+                if name in baseline["reads"]
+            },
+        }
+    rendered = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(rendered + "\n")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Startup benchmark: import, app construction, lifespan startup and time to first request.
+
+    JWT_SECRET=... DATABASE_URL=... python -m benchmarks.startup --runs 10 [--with-db]
+
+Every run is a fresh interpreter, as a newly forked or spawned worker would be.
+The first request goes through the full ASGI stack in-process. It hits
+``/health``, or ``/health/db`` with ``--with-db`` so the lazily created engine
+and first connection are included.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = r"""
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+from app.main import create_app
+t1 = time.perf_counter()
+app = create_app()
+t2 = time.perf_counter()
+
+async def run(path):
+    sent = []
+    async def lifespan_receive():
+        if not sent:
+            sent.append(1)
+            return {"type": "lifespan.startup"}
+        await asyncio.Event().wait()
+    async def lifespan_send(message):
+        started.set_result(message["type"])
+    started = asyncio.get_running_loop().create_future()
+    lifespan = asyncio.create_task(app({"type": "lifespan", "asgi": {"version": "3.0"}}, lifespan_receive, lifespan_send))
+    if await started != "lifespan.startup.complete":
+        raise SystemExit("lifespan startup failed")
+    t3 = time.perf_counter()
+    status = []
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "path": path, "raw_path": path.encode(), "root_path": "", "scheme": "http", "query_string": b"",
+             "headers": [], "client": ("bench", 1), "server": ("bench", 80)}
+    await app(scope, receive, send)
+    t4 = time.perf_counter()
+    lifespan.cancel()
+    return t3, t4, status[0]
+
+t3, t4, status = asyncio.run(run(sys.argv[1]))
+print(json.dumps({"import_ms": (t1 - t0) * 1e3, "create_app_ms": (t2 - t1) * 1e3,
+                  "lifespan_startup_ms": (t3 - t2) * 1e3, "first_request_ms": (t4 - t3) * 1e3,
+                  "time_to_first_request_ms": (t4 - t0) * 1e3, "status": status}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--with-db", action="store_true", help="first request is /health/db")
+    args = parser.parse_args()
+
+    path = "/health/db" if args.with_db else "/health"
+    runs = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, "-c", CHILD, path], capture_output=True, text=True, check=True)
+        runs.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    statuses = sorted({run["status"] for run in runs})
+    report = {
+        "runs": args.runs,
+        "path": path,
+        "statuses": statuses,
+        **{
+            f"median_{key}": round(statistics.median(run[key] for run in runs), 2)
+            for key in ("import_ms", "create_app_ms", "lifespan_startup_ms", "first_request_ms", "time_to_first_request_ms")
+        },
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import re
 import time
 import unittest
 from urllib.error import HTTPError
@@ -53,7 +54,21 @@ class BackendTestBase(unittest.TestCase):
         token: str | None = None,
         include_tz: bool = True,
         tz_value: str | None = None,
+        headers: dict[str, str] | None = None,
     ) -> tuple[int, dict]:
+        status, body, _ = self._request_with_headers(method, path, payload, token, include_tz, tz_value, headers)
+        return status, body
+
+    def _request_with_headers(
+        self,
+        method: str,
+        path: str,
+        payload: dict | None = None,
+        token: str | None = None,
+        include_tz: bool = True,
+        tz_value: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, dict, dict]:
         data = None if payload is None else json.dumps(payload).encode()
         req = Request(self.base + path, data=data, method=method)
         if payload is not None:
@@ -62,18 +77,42 @@ class BackendTestBase(unittest.TestCase):
             req.add_header("Authorization", f"Bearer {token}")
         if include_tz:
             req.add_header("X-Client-Timezone", tz_value or self.tz)
+        for name, value in (headers or {}).items():
+            req.add_header(name, value)
 
         try:
             with urlopen(req) as resp:
                 body = resp.read().decode()
-                return resp.status, json.loads(body) if body else {}
+                headers = {k.lower(): v for k, v in resp.headers.items()}
+                return resp.status, json.loads(body) if body else {}, headers
         except HTTPError as err:
             body = err.read().decode()
             try:
                 parsed = json.loads(body) if body else {}
             except json.JSONDecodeError:
                 parsed = {"raw": body}
-            return err.code, parsed
+            return err.code, parsed, {k.lower(): v for k, v in err.headers.items()}
+
+    def _assert_query_budget(
+        self,
+        label: str,
+        max_queries: int,
+        method: str,
+        path: str,
+        **kwargs,
+    ) -> tuple[int, dict, int]:
+        """Issue a request and fail if its Server-Timing header reports more than max_queries SQL statements."""
+        status, body, headers = self._request_with_headers(method, path, **kwargs)
+        match = re.search(r'db;dur=[0-9.]+;desc="(\d+) queries"', headers.get("server-timing", ""))
+        if match is None:
+            self.skipTest("Server-Timing is disabled on the server (SERVER_TIMING_ENABLED)")
+        queries = int(match.group(1))
+        if queries > max_queries:
+            self._fail_with(
+                f"{label}: at most {max_queries} queries",
+                {"queries": queries, "server_timing": headers["server-timing"]},
+            )
+        return status, body, queries
 
     def _email(self, prefix: str) -> str:
         return f"{prefix}.{uuid4().hex[:12]}@example.com"
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+
+from app.core.config import settings
+from app.db.archive import archive_cutoff, may_be_archived
+from app.db import session as db_session
+from app.main import create_app
+from app.middleware.rate_limit import RateLimitMiddleware
+from tests.base import BackendTestBase
+
+
+class AppFactoryTests(BackendTestBase):
+    def test_engine_is_created_on_first_use(self):
+        self._info("Checks building the app opens no engine, and a missing DATABASE_URL only fails on first use.")
+        app = create_app(replace(settings, database_url=None))
+        self.assertFalse(app.state.database.engine_created)
+        session = db_session.SessionLocal(database=app.state.database)
+        with self.assertRaises(RuntimeError):
+            session.get_bind()
+        session.close()
+        self._pass("engine deferred until a session needs it", "RuntimeError on first use")
+
+    def test_factory_applies_per_app_settings(self):
+        self._info("Checks create_app wires middleware and state from the settings it is given.")
+        limited = create_app(replace(settings, rate_limit_enabled=True))
+        unlimited = create_app(replace(settings, rate_limit_enabled=False))
+        self.assertIn(RateLimitMiddleware, [m.cls for m in limited.user_middleware])
+        self.assertNotIn(RateLimitMiddleware, [m.cls for m in unlimited.user_middleware])
+        self.assertFalse(unlimited.state.settings.rate_limit_enabled)
+        self._pass("rate limiting follows the factory settings", "ok")
+
+    def test_apps_keep_their_own_database(self):
+        self._info("Checks a second create_app neither replaces nor reuses the first app's engine or settings.")
+        first = create_app(replace(settings, database_url="postgresql+psycopg://a:a@127.0.0.1:1/first"))
+        second = create_app(replace(settings, database_url="postgresql+psycopg://b:b@127.0.0.1:1/second"))
+        first_engine = first.state.database.engine()
+        second_engine = second.state.database.engine()
+        self.assertIsNot(first_engine, second_engine)
+        self.assertEqual(first_engine.url.database, "first")
+        self.assertEqual(second_engine.url.database, "second")
+        self.assertIs(first.state.database.engine(), first_engine)
+        self.assertIs(first.state.database.settings, first.state.settings)
+        self.assertIs(first.state.workout_changes.database, first.state.database)
+        self.assertIs(first.state.session_revocations.database, first.state.database)
+        self.assertIsNot(first.state.password_hashing, second.state.password_hashing)
+        self.assertIsNot(first_engine.pool.telemetry, second_engine.pool.telemetry)
+        first.state.database.dispose()
+        second.state.database.dispose()
+        self._pass("one engine per app", {"first": "first", "second": "second"})
+
+    def test_archive_horizon_follows_app_settings(self):
+        self._info("Checks the archive fallback uses the horizon of the settings it is given.")
+        today = date(2026, 10, 19)
+        short = replace(settings, archive_after_days=30)
+        long = replace(settings, archive_after_days=730)
+        self.assertEqual(archive_cutoff(short, today), date(2026, 9, 19))
+        self.assertTrue(may_be_archived(short, date(2026, 1, 1)))
+        self.assertFalse(may_be_archived(long, date(2026, 1, 1)))
+        self._pass("per-settings archive horizon", {"short": 30, "long": 730})
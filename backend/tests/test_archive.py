@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from contextlib import redirect_stderr
+from datetime import datetime, time, timedelta, timezone
+import io
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.db.archive import ARCHIVE, archive_cutoff
+from app.db.models.strength_set import StrengthSet
+from app.db.models.user import User
+from app.db.models.workout import Workout
+from app.db.session import SessionLocal
+from app.jobs.archive_workouts import main, move_workouts
+from tests.base import BackendTestBase
+
+
+class ArchiveTests(BackendTestBase):
+    def _archived_workout(self) -> tuple[str, int, str, str]:
+        """Sign up, log a workout older than the horizon and archive it; return token, user id, workout id, date."""
+        email, _, token = self._signup()
+        day = archive_cutoff(settings) - timedelta(days=30)
+        start_ts = datetime.combine(day, time(19, 0), tzinfo=timezone.utc)
+        status, created = self._create_strength_workout(
+            token,
+            start_ts.isoformat().replace("+00:00", "Z"),
+            [
+                {"exercise_name": "Archived Bench", "weight": 100, "reps": 5},
+                {"exercise_name": "Archived Bench", "weight": 105, "reps": 3},
+            ],
+        )
+        self.assertEqual(status, 201, created)
+
+        with SessionLocal() as db:
+            user_id = db.execute(select(User.user_id).where(User.email == email)).scalar_one()
+            moved = move_workouts(db, user_id, archive_cutoff(settings), to_archive=True)
+            db.commit()
+        self.assertEqual(moved, 1)
+        return token, user_id, created["workout_id"], day.isoformat()
+
+    def _hot_and_archived_counts(self, user_id: int) -> tuple[int, int]:
+        with SessionLocal() as db:
+            hot = db.execute(select(func.count()).select_from(Workout).where(Workout.user_id == user_id)).scalar_one()
+            archived = db.execute(
+                select(func.count()).select_from(ARCHIVE.workouts).where(ARCHIVE.workouts.user_id == user_id)
+            ).scalar_one()
+            archived_sets = db.execute(
+                select(func.count())
+                .select_from(ARCHIVE.strength_sets)
+                .where(ARCHIVE.strength_sets.user_id == user_id)
+            ).scalar_one()
+            hot_sets = db.execute(
+                select(func.count()).select_from(StrengthSet).where(StrengthSet.user_id == user_id)
+            ).scalar_one()
+        return hot + hot_sets, archived + archived_sets
+
+    def test_archived_workout_is_read_transparently(self):
+        self._info("Archives an old workout and reads it back through detail, list, day, calendar and history.")
+        token, user_id, workout_id, day = self._archived_workout()
+        self.assertEqual(self._hot_and_archived_counts(user_id), (0, 3))
+
+        detail_status, detail = self._request("GET", f"/v1/workouts/{workout_id}", token=token)
+        self.assertEqual(detail_status, 200, detail)
+        self.assertEqual([s["weight"] for s in detail["strength_sets"]], [100.0, 105.0])
+
+        list_status, listed = self._request("GET", f"/v1/workouts?date={day}", token=token)
+        self.assertEqual(list_status, 200, listed)
+        self.assertEqual([(w["id"], w["strength_set_count"]) for w in listed], [(workout_id, 2)])
+
+        day_status, dashboard = self._request("GET", f"/v1/dashboard/day?date={day}", token=token)
+        self.assertEqual(day_status, 200, dashboard)
+        self.assertEqual(len(dashboard["workouts"]), 1)
+        self.assertEqual(dashboard["telemetry"]["total_training_load"], 815.0)
+
+        calendar_status, calendar = self._request("GET", f"/v1/workouts/calendar?start={day}&end={day}", token=token)
+        self.assertEqual(calendar_status, 200, calendar)
+        self.assertEqual(calendar, [{"date": day, "workout_count": 1}])
+
+        exercise_id = detail["strength_sets"][0]["exercise_id"]
+        history_status, history = self._request("GET", f"/v1/exercises/{exercise_id}/history", token=token)
+        self.assertEqual(history_status, 200, history)
+        self.assertEqual(len(history["items"]), 2)
+
+        self._pass(
+            "archived workout served from the archive by every read endpoint",
+            {"detail": detail_status, "list": len(listed), "day": len(dashboard["workouts"]), "calendar": calendar},
+        )
+
+    def test_backdated_write_into_archived_day_reads_both_tiers(self):
+        self._info("Logs a workout on a day that was already archived and checks reads merge the hot and archive rows.")
+        token, user_id, workout_id, day = self._archived_workout()
+        start_ts = datetime.combine(datetime.fromisoformat(day).date(), time(8, 0), tzinfo=timezone.utc)
+        status, created = self._create_strength_workout(
+            token,
+            start_ts.isoformat().replace("+00:00", "Z"),
+            [
+                {"exercise_name": "Archived Bench", "weight": 90, "reps": 8},
+                {"exercise_name": "Archived Bench", "weight": 95, "reps": 6},
+            ],
+        )
+        self.assertEqual(status, 201, created)
+        self.assertEqual(self._hot_and_archived_counts(user_id), (3, 3))
+
+        list_status, listed = self._request("GET", f"/v1/workouts?date={day}", token=token)
+        self.assertEqual(list_status, 200, listed)
+        self.assertEqual([w["id"] for w in listed], [workout_id, created["workout_id"]])
+
+        day_status, dashboard = self._request("GET", f"/v1/dashboard/day?date={day}", token=token)
+        self.assertEqual(day_status, 200, dashboard)
+        self.assertEqual(len(dashboard["workouts"]), 2)
+        self.assertEqual(dashboard["telemetry"]["total_training_load"], 815.0 + 1290.0)
+
+        calendar_status, calendar = self._request("GET", f"/v1/workouts/calendar?start={day}&end={day}", token=token)
+        self.assertEqual(calendar_status, 200, calendar)
+        self.assertEqual(calendar, [{"date": day, "workout_count": 2}])
+
+        _, detail = self._request("GET", f"/v1/workouts/{workout_id}", token=token)
+        exercise_id = detail["strength_sets"][0]["exercise_id"]
+        items, cursor = [], None
+        while True:
+            query = f"/v1/exercises/{exercise_id}/history?limit=3" + (f"&cursor={cursor}" if cursor else "")
+            history_status, page = self._request("GET", query, token=token)
+            self.assertEqual(history_status, 200, page)
+            items += page["items"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(len({item["id"] for item in items}), 4)
+        performed = [item["performed_at"] for item in items]
+        self.assertEqual(performed, sorted(performed, reverse=True))
+
+        self._pass(
+            "hot and archived workouts of one day merged by every read endpoint",
+            {"list": len(listed), "calendar": calendar, "history": len(items)},
+        )
+
+    def test_job_rejects_horizon_shorter_than_api(self):
+        self._info("Checks the job refuses to archive dates the API would not look for in the archive.")
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--horizon-days", str(settings.archive_after_days - 1)])
+        self._pass("--horizon-days below ARCHIVE_AFTER_DAYS rejected", settings.archive_after_days)
+
+    def test_restore_moves_workout_back(self):
+        self._info("Restores an archived workout once the horizon no longer covers it.")
+        token, user_id, workout_id, day = self._archived_workout()
+
+        with SessionLocal() as db:
+            restored = move_workouts(db, user_id, datetime.fromisoformat(day).date(), to_archive=False)
+            db.commit()
+        self.assertEqual(restored, 1)
+        self.assertEqual(self._hot_and_archived_counts(user_id), (3, 0))
+
+        status, detail = self._request("GET", f"/v1/workouts/{workout_id}", token=token)
+        self.assertEqual(status, 200, detail)
+        self.assertEqual(len(detail["strength_sets"]), 2)
+        self._pass("workout and sets back in the hot tables", self._hot_and_archived_counts(user_id))
@@ -1,5 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
+from jose import JWTError
+from sqlalchemy import func, select
+
+from app.core.password_hashing import PasswordHashingPool, PasswordHashingUnavailable
+from app.core.security import AccessClaims, VerifiedTokenCache, create_access_token, decode_access_token, verified_tokens
+from app.core.user_cache import AuthenticatedUserCache, CachedUser
+from app.db.models.user import User
+from app.db.session import SessionLocal
 from tests.base import BackendTestBase
 
 
@@ -30,3 +41,211 @@ class AuthTests(BackendTestBase):
             expected_payload={"access_token": "<jwt>", "me": {"user_id": "<int>", "email": email.lower()}},
             received_payload={"login": body_login, "me": me},
         )
+
+    def test_identity_cache_bounds_and_invalidation(self):
+        self._info("Checks the authenticated-user cache evicts LRU entries, expires by TTL, and drops updated users.")
+        cache = AuthenticatedUserCache(ttl_seconds=0.2, max_entries=2)
+        cache.put(CachedUser(user_id=1, timezone=None))
+        cache.put(CachedUser(user_id=2, timezone=None))
+        cache.get(1)
+        cache.put(CachedUser(user_id=3, timezone=None))
+        self.assertIsNone(cache.get(2))
+        self.assertIsNotNone(cache.get(1))
+        time.sleep(0.25)
+        self.assertIsNone(cache.get(1))
+
+        # Server side: a write caches the identity (and its timezone), the timezone changes through the
+        # API, and the next header-less write must be dated in the new zone rather than the cached one.
+        _, _, token = self._signup()
+
+        def write_without_header() -> str:
+            status, created = self._request(
+                "POST",
+                "/v1/workouts",
+                payload={
+                    "workout_type": "CARDIO",
+                    "start_ts": "2026-02-07T05:30:00Z",
+                    "cardio_session": {"distance_miles": 1.0},
+                },
+                token=token,
+                include_tz=False,
+            )
+            self.assertEqual(status, 201, created)
+            _, detail = self._request("GET", f"/v1/workouts/{created['workout_id']}", token=token)
+            return detail["local_date"]
+
+        before = write_without_header()
+        status_patch, me = self._request("PATCH", "/v1/auth/me", payload={"timezone": "Asia/Tokyo"}, token=token)
+        self.assertEqual(status_patch, 200, me)
+        after = write_without_header()
+        self.assertEqual((before, after), ("2026-02-06", "2026-02-07"))
+        self._pass(
+            "LRU eviction, TTL expiry, and update invalidation in the server",
+            {"evicted": 2, "expired": 1, "local_date_before": before, "local_date_after": after},
+        )
+
+    def test_claims_only_reads_and_verified_writes(self):
+        self._info("Checks reads trust token claims while writes still reject tokens for missing users.")
+        with SessionLocal() as db:
+            missing_user_id = (db.execute(select(func.max(User.user_id))).scalar_one() or 0) + 1_000_000
+        token = create_access_token(missing_user_id)
+
+        status_read, body_read = self._request("GET", "/v1/workouts?date=2026-02-06&limit=5", token=token)
+        self.assertEqual(status_read, 200, body_read)
+        self.assertEqual(body_read, [])
+
+        status_write, body_write = self._create_strength_workout(
+            token,
+            "2026-02-06T17:00:00Z",
+            [{"exercise_name": "Bench Press", "weight": 135, "reps": 8}],
+        )
+        self.assertEqual(status_write, 401, body_write)
+        self._pass(
+            "claims-only read 200 with empty list, verified write 401",
+            {"read_status": status_read, "write_status": status_write},
+            received_payload={"read": body_read, "write": body_write},
+        )
+
+    def test_password_hashing_pool_backpressure(self):
+        self._info("Checks the hashing pool round-trips bcrypt and rejects work once its queue is full.")
+        pool = PasswordHashingPool(workers=1, max_pending=1)
+        try:
+            password_hash = asyncio.run(pool.hash_async("correct horse"))
+            self.assertTrue(asyncio.run(pool.verify_async("correct horse", password_hash)))
+            self.assertFalse(asyncio.run(pool.verify_async("wrong horse", password_hash)))
+
+            pool._slots.acquire()
+            try:
+                with self.assertRaises(PasswordHashingUnavailable):
+                    asyncio.run(pool.hash_async("queued behind a full pool"))
+            finally:
+                pool._slots.release()
+            stats = pool.stats()
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(stats["queue_depth"], 0)
+        self._pass("bcrypt off-process with fail-fast rejection", stats, received_payload=stats)
+
+        status, body = self._request("GET", "/health/password-hashing", include_tz=False)
+        self.assertEqual(status, 200, body)
+        self.assertIn("queue_depth", body)
+        status_metrics, _ = self._request("GET", "/metrics", include_tz=False)
+        self.assertEqual(status_metrics, 200)
+
+    def test_password_hashing_timeout_keeps_slot(self):
+        self._info("Checks an awaited job that times out keeps its slot until the worker is done with it.")
+        pool = PasswordHashingPool(workers=1, max_pending=1)
+        try:
+            password_hash = asyncio.run(pool.hash_async("correct horse"))
+            self.assertTrue(asyncio.run(pool.verify_async("correct horse", password_hash)))
+
+            pool.timeout_seconds = 0.1
+            with self.assertRaises(PasswordHashingUnavailable):
+                asyncio.run(pool._run_async(time.sleep, 1.0))
+            # The sleep is still running in the worker, so the only slot is still taken.
+            self.assertEqual(pool.stats()["queue_depth"], 1)
+            with self.assertRaises(PasswordHashingUnavailable):
+                asyncio.run(pool.hash_async("while the slot is held"))
+
+            deadline = time.monotonic() + 5
+            while pool.stats()["queue_depth"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+            stats = pool.stats()
+        finally:
+            pool.shutdown()
+
+        self.assertEqual((stats["queue_depth"], stats["timed_out"], stats["rejected"]), (0, 1, 1))
+        self._pass("slot released when the job finishes, not when its caller gives up", stats)
+
+    def test_verified_token_cache(self):
+        self._info("Checks repeat tokens are served from the verified-token cache and tampered tokens never are.")
+        token = create_access_token(7)
+        key = VerifiedTokenCache.digest(token)
+        self.assertEqual(decode_access_token(token), 7)
+        self.assertEqual(verified_tokens.get(key).user_id, 7)
+        self.assertEqual(decode_access_token(token), 7)
+
+        with self.assertRaises(JWTError):
+            decode_access_token(token[:-2] + ("aa" if not token.endswith("aa") else "bb"))
+
+        cache = VerifiedTokenCache(max_entries=1)
+        cache.put(b"expired", time.time() - 1, AccessClaims(user_id=1, session_id=None))
+        self.assertIsNone(cache.get(b"expired"))
+        cache.put(b"a", time.time() + 60, AccessClaims(user_id=1, session_id=None))
+        cache.put(b"b", time.time() + 60, AccessClaims(user_id=2, session_id=None))
+        self.assertIsNone(cache.get(b"a"))
+        self.assertEqual(cache.get(b"b").user_id, 2)
+        self._pass("cache hit, tamper rejection, exp and size bounds", {"cached_user_id": 7, "entries": len(cache)})
+
+    def test_refresh_rotation_and_revocation(self):
+        self._info("Checks refresh rotates tokens, reuse revokes the session, and logout revokes live access tokens.")
+        email, password, _ = self._signup()
+        status_login, login = self._request(
+            "POST",
+            "/v1/auth/login",
+            payload={"email": email, "password": password},
+            include_tz=False,
+        )
+        self.assertEqual(status_login, 200, login)
+        self.assertTrue(login["refresh_token"])
+
+        status_refresh, rotated = self._request(
+            "POST",
+            "/v1/auth/refresh",
+            payload={"refresh_token": login["refresh_token"]},
+            include_tz=False,
+        )
+        self.assertEqual(status_refresh, 200, rotated)
+        self.assertNotEqual(rotated["refresh_token"], login["refresh_token"])
+        self._me(rotated["access_token"])
+
+        status_reuse, _ = self._request(
+            "POST",
+            "/v1/auth/refresh",
+            payload={"refresh_token": login["refresh_token"]},
+            include_tz=False,
+        )
+        self.assertEqual(status_reuse, 401)
+        status_revoked_me, body_revoked_me = self._request(
+            "GET", "/v1/auth/me", token=rotated["access_token"], include_tz=False
+        )
+        self.assertEqual(status_revoked_me, 401, body_revoked_me)
+        status_successor, _ = self._request(
+            "POST",
+            "/v1/auth/refresh",
+            payload={"refresh_token": rotated["refresh_token"]},
+            include_tz=False,
+        )
+        self.assertEqual(status_successor, 401)
+
+        _, second = self._request(
+            "POST",
+            "/v1/auth/login",
+            payload={"email": email, "password": password},
+            include_tz=False,
+        )
+        status_logout, _ = self._request(
+            "POST",
+            "/v1/auth/logout",
+            payload={"refresh_token": second["refresh_token"]},
+            include_tz=False,
+        )
+        self.assertEqual(status_logout, 204)
+        status_after_logout, _ = self._request(
+            "GET", "/v1/workouts?date=2026-02-06", token=second["access_token"]
+        )
+        self.assertEqual(status_after_logout, 401)
+        self._pass(
+            "rotation 200, reuse 401 + session revoked, logout 401 on next request",
+            {
+                "refresh": status_refresh,
+                "reuse": status_reuse,
+                "revoked_me": status_revoked_me,
+                "successor": status_successor,
+                "logout": status_logout,
+                "after_logout": status_after_logout,
+            },
+        )
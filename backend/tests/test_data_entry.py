@@ -178,6 +178,23 @@ class DataEntryTests(BackendTestBase):
             received_payload={"first_status": s1, "second_status": s2, "first_body": b1, "second_body": b2},
         )
 
+    def test_idempotent_replay_of_deleted_workout(self):
+        self._info("Checks a replayed create for a deleted workout answers 410 instead of a dangling id.")
+        _, _, token = self._signup()
+        cid = str(uuid4())
+        sets = [{"exercise_name": "Squat", "weight": 225, "reps": 5}]
+        s1, b1 = self._create_strength_workout(token, "2026-02-16T15:00:00Z", sets, client_uuid=cid)
+        self.assertEqual(s1, 201, b1)
+        s_delete, _ = self._request(
+            "DELETE", f"/v1/workouts/{b1['workout_id']}", token=token, headers={"If-Match": '"1"'}
+        )
+        self.assertEqual(s_delete, 204)
+
+        s2, b2 = self._create_strength_workout(token, "2026-02-16T15:00:00Z", sets, client_uuid=cid)
+        if s2 != 410:
+            self._fail_with("410 for a replay of a deleted workout", {"status": s2, "body": b2})
+        self._pass("replay of deleted workout is 410 Gone", {"status": s2})
+
     def test_user_isolation_exercise_reference(self):
         self._info("Checks user isolation: user B cannot reference user A exercise_id.")
         _, _, token_a = self._signup()
@@ -233,6 +250,24 @@ class DataEntryTests(BackendTestBase):
             received_payload={"canonical_count": count},
         )
 
+    def test_exercise_names_python_and_postgres_lowercase_differently(self):
+        self._info("Checks names whose Python and Postgres lowercasings differ are created and reused, not 500s.")
+        _, _, token = self._signup()
+        sets = [
+            {"exercise_name": "ΔΡΟΜΟΣ", "weight": 1, "reps": 1},
+            {"exercise_name": "İnce Row", "weight": 50, "reps": 8},
+        ]
+        status_first, first = self._create_strength_workout(token, "2026-02-16T18:00:00Z", sets, "Unicode1")
+        status_second, second = self._create_strength_workout(token, "2026-02-16T18:10:00Z", sets, "Unicode2")
+        self.assertEqual((status_first, status_second), (201, 201), (first, second))
+
+        exercise_ids = []
+        for created in (first, second):
+            _, detail = self._request("GET", f"/v1/workouts/{created['workout_id']}", token=token)
+            exercise_ids.append([s["exercise_id"] for s in detail["strength_sets"]])
+        self.assertEqual(exercise_ids[0], exercise_ids[1])
+        self._pass("both names resolved to the same rows on reuse", {"statuses": [status_first, status_second]})
+
     def test_concurrency_create_on_write(self):
         self._info("Checks 20 parallel writes for same new exercise all succeed and dedupe exercise row.")
         _, _, token = self._signup()
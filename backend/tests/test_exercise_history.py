@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+
+from app.services.downsampling import bucket_bounds, lttb_indices, reduce_max, reduce_sum
+from tests.base import BackendTestBase
+
+
+class ExerciseHistoryTests(BackendTestBase):
+    def test_downsampling_helpers(self):
+        self._info("Checks LTTB keeps endpoints/peaks and period bucketing respects the point budget.")
+        x = np.arange(1000, dtype=np.float64)
+        y = np.zeros(1000)
+        y[500] = 10.0
+        keep = lttb_indices(x, y, 50)
+        self.assertEqual(len(keep), 50)
+        self.assertEqual(int(keep[0]), 0)
+        self.assertEqual(int(keep[-1]), 999)
+        self.assertIn(500, keep.tolist())
+
+        days = np.arange(0, 3000, 3, dtype=np.int64)
+        starts, period_first, width = bucket_bounds(days, 100)
+        self.assertLessEqual(len(starts), 100)
+        self.assertEqual(int(period_first[0]), 0)
+        weights = np.where(days % 2 == 0, days.astype(np.float64), np.nan)
+        first_period = days[(days < width) & (days % 2 == 0)]
+        self.assertEqual(float(reduce_max(weights, starts)[0]), float(first_period.max()))
+        self.assertEqual(int(reduce_sum(np.ones(len(days), dtype=np.int64), starts).sum()), len(days))
+        self._pass(
+            "LTTB + bucket aggregation",
+            {"lttb_points": len(keep), "bucket_points": len(starts), "period_days": width},
+        )
+
+    def test_exercise_history_pagination_and_chart(self):
+        self._info("Checks exercise history keyset pagination, chart mode, and cross-user 404.")
+        _, _, token = self._signup()
+
+        for day, weight in (("2026-02-02", 100), ("2026-02-04", 105), ("2026-02-06", 110)):
+            status, created = self._create_strength_workout(
+                token,
+                f"{day}T18:50:00Z",
+                [
+                    {"exercise_name": "Squat", "weight": weight, "reps": 5},
+                    {"exercise_name": "Squat", "weight": weight - 20, "reps": 8},
+                ],
+            )
+            self.assertEqual(status, 201, created)
+
+        _, detail = self._request("GET", f"/v1/workouts/{created['workout_id']}", token=token)
+        exercise_id = detail["strength_sets"][0]["exercise_id"]
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            path = f"/v1/exercises/{exercise_id}/history?limit=4"
+            if cursor:
+                path += f"&cursor={cursor}"
+            status, page = self._request("GET", path, token=token)
+            self.assertEqual(status, 200, page)
+            seen.extend(page["items"])
+            pages += 1
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, 2)
+        self.assertEqual(len(seen), 6)
+        self.assertEqual(len({item["id"] for item in seen}), 6)
+        performed = [item["performed_at"] for item in seen]
+        self.assertEqual(performed, sorted(performed, reverse=True))
+
+        status_chart, chart = self._request(
+            "GET", f"/v1/exercises/{exercise_id}/history/chart?points=10", token=token
+        )
+        self.assertEqual(status_chart, 200, chart)
+        self.assertEqual(chart["source_point_count"], 3)
+        self.assertEqual([p["max_weight"] for p in chart["points"]], [100.0, 105.0, 110.0])
+        self.assertEqual(chart["points"][0]["volume"], 100 * 5 + 80 * 8)
+
+        status_bad_cursor, _ = self._request(
+            "GET", f"/v1/exercises/{exercise_id}/history?cursor=not-a-cursor", token=token
+        )
+        self.assertEqual(status_bad_cursor, 422)
+
+        _, _, token_other = self._signup()
+        status_other, _ = self._request("GET", f"/v1/exercises/{exercise_id}/history", token=token_other)
+        self.assertEqual(status_other, 404)
+
+        self._pass(
+            "history pages + chart + cursor validation + cross-user 404",
+            "ok",
+            expected_payload={"pages": 2, "items": 6, "chart_max_weight": [100.0, 105.0, 110.0], "bad_cursor": 422, "other_user": 404},
+            received_payload={"pages": pages, "items": len(seen), "chart": chart, "bad_cursor": status_bad_cursor, "other_user": status_other},
+        )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+from app.core.exercise_index import ExerciseName, ExercisePrefixIndex
+from tests.base import BackendTestBase
+
+
+class ExerciseSearchTests(BackendTestBase):
+    def test_prefix_index_ranks_name_starts_first(self):
+        self._info("Checks whole-name prefixes come before word prefixes and punctuation is ignored.")
+        names = ["Bench Press", "Incline Bench Press", "Press Around", "T-Bar Row", "Overhead Press"]
+        index = ExercisePrefixIndex(ExerciseName(id=uuid4(), name=name) for name in names)
+
+        def lookup(prefix: str, limit: int = 10) -> list[str]:
+            return [exercise.name for exercise in index.lookup(prefix, limit)]
+
+        self.assertEqual(lookup("press"), ["Press Around", "Bench Press", "Incline Bench Press", "Overhead Press"])
+        self.assertEqual(lookup("bench"), ["Bench Press", "Incline Bench Press"])
+        self.assertEqual(lookup("t bar"), ["T-Bar Row"])
+        self.assertEqual(lookup("  INCLINE   be"), ["Incline Bench Press"])
+        self.assertEqual(lookup("press", limit=2), ["Press Around", "Bench Press"])
+        self.assertEqual((lookup("squat"), lookup("-")), ([], []))
+        self._pass("prefix matches in rank order", lookup("press"))
+
+    def test_prefix_lookup_stays_fast_for_large_catalogs(self):
+        self._info("Times keystroke lookups against 5000 exercise names.")
+        words = ["bench", "press", "row", "squat", "curl", "fly", "pull", "deadlift", "lunge", "raise"]
+        names = [f"{words[i % 10]} {words[(i // 10) % 10]} variation {i}" for i in range(5000)]
+        index = ExercisePrefixIndex(ExerciseName(id=uuid4(), name=name) for name in names)
+
+        queries = [word[:length] for word in words for length in range(1, len(word) + 1)]
+        started = time.perf_counter()
+        for query in queries:
+            index.lookup(query, 10)
+        per_lookup_ms = (time.perf_counter() - started) * 1000 / len(queries)
+        self.assertLess(per_lookup_ms, 1.0)
+        self._pass("sub-millisecond prefix lookups", {"exercises": len(index), "per_lookup_ms": round(per_lookup_ms, 4)})
+
+    def test_search_endpoint_prefix_and_fuzzy(self):
+        self._info("Checks /v1/exercises/search returns prefix matches and tolerates typos.")
+        _, _, token = self._signup()
+        status, created = self._create_strength_workout(
+            token,
+            "2026-03-02T18:00:00Z",
+            [
+                {"exercise_name": "Romanian Deadlift", "weight": 100, "reps": 8},
+                {"exercise_name": "Incline Bench Press", "weight": 60, "reps": 8},
+            ],
+        )
+        self.assertEqual(status, 201, created)
+
+        status_prefix, prefix = self._request("GET", "/v1/exercises/search?q=dead", token=token)
+        self.assertEqual(status_prefix, 200, prefix)
+        self.assertEqual([(i["name"], i["match"]) for i in prefix["items"]], [("Romanian Deadlift", "prefix")])
+
+        status_fuzzy, fuzzy = self._request("GET", "/v1/exercises/search?q=incline%20bech%20press", token=token)
+        self.assertEqual(status_fuzzy, 200, fuzzy)
+        self.assertEqual([(i["name"], i["match"]) for i in fuzzy["items"]], [("Incline Bench Press", "fuzzy")])
+
+        _, _, other_token = self._signup()
+        _, other = self._request("GET", "/v1/exercises/search?q=dead", token=other_token)
+        self.assertEqual(other["items"], [])
+        self._pass("prefix and fuzzy matches scoped to the user", {"prefix": prefix, "fuzzy": fuzzy})
+
+    def test_new_exercise_is_searchable_immediately(self):
+        self._info("Checks a newly logged exercise shows up in the typeahead on the next keystroke.")
+        _, _, token = self._signup()
+        self._create_strength_workout(
+            token, "2026-03-02T18:00:00Z", [{"exercise_name": "Goblet Squat", "weight": 20, "reps": 10}]
+        )
+        _, before = self._request("GET", "/v1/exercises/search?q=g", token=token)
+        self._create_strength_workout(
+            token, "2026-03-03T18:00:00Z", [{"exercise_name": "Good Morning", "weight": 40, "reps": 10}]
+        )
+        _, after = self._request("GET", "/v1/exercises/search?q=g", token=token)
+        self.assertEqual(
+            ([i["name"] for i in before["items"]], [i["name"] for i in after["items"]]),
+            (["Goblet Squat"], ["Goblet Squat", "Good Morning"]),
+        )
+        self._pass("index refreshed after the write", after)
@@ -24,6 +24,17 @@ class HealthAndSmokeTests(BackendTestBase):
             received_payload={"health": b1, "health_db": b2},
         )
 
+    def test_db_pool_telemetry(self):
+        self._info("Checks /health/db/pool reports pool sizing, checkout waits, and threadpool alignment.")
+        self._request("GET", "/health/db", include_tz=False)
+        status, body = self._request("GET", "/health/db/pool", include_tz=False)
+        self.assertEqual(status, 200, body)
+        for key in ("pool_size", "max_overflow", "checked_out", "saturation", "checkouts", "wait_ms_p99"):
+            self.assertIn(key, body)
+        self.assertGreaterEqual(body["checkouts"], 1)
+        self.assertGreaterEqual(body["worker_threads"], body["pool_size"] + body["max_overflow"])
+        self._pass("pool stats with checkout waits and worker threads >= pool capacity", body, received_payload=body)
+
     def test_schema_indexes_constraints_exist(self):
         self._info("Checks expected DB indexes/constraints exist for current schema contract.")
         with SessionLocal() as db:
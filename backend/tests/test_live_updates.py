@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from urllib.request import Request, urlopen
+
+from app.core.config import settings
+from app.core.live_updates import Subscriber, WorkoutChangeHub
+from app.db.session import Database
+from tests.base import BackendTestBase
+
+
+class LiveUpdateTests(BackendTestBase):
+    def _open_stream(self, token: str):
+        req = Request(self.base + "/v1/dashboard/stream")
+        req.add_header("Authorization", f"Bearer {token}")
+        return urlopen(req, timeout=10)
+
+    def _next_event(self, stream) -> tuple[str, dict]:
+        """Read up to the next named event, skipping retry and keepalive lines."""
+        event, data = None, None
+        while True:
+            line = stream.readline().decode().rstrip("\n")
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+            elif not line and event is not None:
+                return event, data
+
+    def test_hub_merges_bursts_per_user(self):
+        self._info("Checks that notifications arriving before a stream wakes are merged into one event.")
+
+        async def scenario():
+            hub = WorkoutChangeHub(max_subscribers=10, database=Database(settings))
+            mine, other = Subscriber(1), Subscriber(2)
+            hub._subscribers = {1: {mine}, 2: {other}}
+            hub._deliver(1, ["2026-03-02"])
+            hub._deliver(1, ["2026-03-04", "2026-03-02"])
+            first = (mine.wakeup.is_set(), other.wakeup.is_set(), mine.take(), mine.wakeup.is_set())
+            hub._listening = asyncio.Event()
+            hub._connected(reconnected=True)
+            return first, other.take()
+
+        first, resync = asyncio.run(scenario())
+        self.assertEqual(first, (True, False, (["2026-03-02", "2026-03-04"], False), False))
+        self.assertEqual(resync, ([], True))
+        self._pass("one merged event per burst, resync after reconnect", {"burst": first[2], "reconnect": resync})
+
+    def test_stream_announces_changed_days(self):
+        self._info("Opens a stream, logs a workout and expects an event naming its day; other users see nothing.")
+        _, _, token = self._signup()
+        _, _, other_token = self._signup()
+
+        with self._open_stream(token) as stream, self._open_stream(other_token) as other_stream:
+            self.assertEqual(stream.headers.get("content-type"), "text/event-stream; charset=utf-8")
+            self.assertEqual(self._next_event(stream), ("ready", {}))
+            self.assertEqual(self._next_event(other_stream), ("ready", {}))
+
+            status, created = self._create_strength_workout(
+                token,
+                "2026-03-02T18:00:00Z",
+                [{"exercise_name": "Live Squat", "weight": 100, "reps": 5}],
+            )
+            self.assertEqual(status, 201, created)
+            event = self._next_event(stream)
+            self.assertEqual(event, ("workouts_changed", {"dates": ["2026-03-02"], "resync": False}))
+
+            status_delete, _ = self._request(
+                "DELETE", f"/v1/workouts/{created['workout_id']}", token=token, headers={"If-Match": '"1"'}
+            )
+            self.assertEqual(status_delete, 204)
+            self.assertEqual(self._next_event(stream)[1]["dates"], ["2026-03-02"])
+
+        status_health, health = self._request("GET", "/health/live-updates")
+        self.assertEqual(status_health, 200, health)
+        self.assertTrue(health["listening"])
+        self._pass("workouts_changed event for the edited day", event, received_payload=health)
+
+    def test_stream_requires_token(self):
+        self._info("Checks the stream rejects unauthenticated clients before subscribing.")
+        status, body = self._request("GET", "/v1/dashboard/stream")
+        self.assertEqual(status, 401, body)
+        self._pass("401 without a bearer token", status)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from urllib.request import urlopen
+
+from app.core.metrics import Registry
+from tests.base import BackendTestBase
+
+
+class MetricsTests(BackendTestBase):
+    def test_registry_renders_prometheus_text(self):
+        self._info("Checks counters and histograms render cumulative buckets in Prometheus text format.")
+        registry = Registry()
+        requests = registry.counter("demo_requests_total", "Demo requests.", ("route",))
+        latency = registry.histogram("demo_seconds", "Demo latency.", ("route",), buckets=(0.1, 1.0))
+        requests.inc(("/a",))
+        requests.inc(("/a",))
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value, ("/a",))
+
+        lines = registry.render().splitlines()
+        self.assertIn("# TYPE demo_requests_total counter", lines)
+        self.assertIn('demo_requests_total{route="/a"} 2', lines)
+        self.assertIn('demo_seconds_bucket{route="/a",le="0.1"} 1', lines)
+        self.assertIn('demo_seconds_bucket{route="/a",le="1"} 2', lines)
+        self.assertIn('demo_seconds_bucket{route="/a",le="+Inf"} 3', lines)
+        self.assertIn('demo_seconds_count{route="/a"} 3', lines)
+        self._pass("cumulative buckets, sum and count per label set", "ok", received_payload=lines)
+
+    def test_metrics_endpoint_reports_routes_and_db(self):
+        self._info("Checks /metrics labels requests by route template and includes SQL and pool series.")
+        _, _, token = self._signup()
+        status_read, body_read = self._request("GET", "/v1/workouts?date=2026-02-06&limit=5", token=token)
+        self.assertEqual(status_read, 200, body_read)
+
+        exposition = self._raw_metrics()
+        self.assertIn('http_requests_total{method="GET",route="/v1/workouts",status="200"}', exposition)
+        self.assertIn('http_request_duration_seconds_count{method="GET",route="/v1/workouts"}', exposition)
+        self.assertIn('db_query_duration_seconds_count{operation="SELECT"}', exposition)
+        self.assertIn("db_pool_checked_out", exposition)
+        self.assertIn("http_requests_in_flight", exposition)
+        self._pass("route, SQL and pool series present", "ok")
+
+    def _raw_metrics(self) -> str:
+        with urlopen(self.base + "/metrics") as resp:
+            self.assertEqual(resp.status, 200)
+            self.assertTrue(resp.headers["Content-Type"].startswith("text/plain"))
+            return resp.read().decode()
@@ -7,13 +7,26 @@ from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 from uuid import uuid4
 
-from starlette.requests import Request as StarletteRequest
 from starlette.responses import PlainTextResponse
 
 from app.middleware.request_logging import RequestLoggingMiddleware
 from tests.base import BackendTestBase
 
 
+def _run_asgi(app, scope: dict) -> tuple[int, dict]:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = next(message for message in sent if message["type"] == "http.response.start")
+    return start["status"], {key.decode().lower(): value.decode() for key, value in start["headers"]}
+
+
 class ObservabilityTests(BackendTestBase):
     def _raw_request(
         self,
@@ -113,7 +126,7 @@ class ObservabilityTests(BackendTestBase):
 
     def test_request_log_line_contains_required_keys(self):
         self._info("Checks request log format always includes stable request keys.")
-        middleware = RequestLoggingMiddleware(app=lambda scope, receive, send: None)
+        middleware = RequestLoggingMiddleware(app=PlainTextResponse("ok", status_code=200))
 
         scope = {
             "type": "http",
@@ -127,15 +140,11 @@ class ObservabilityTests(BackendTestBase):
             "client": ("testclient", 1234),
             "server": ("testserver", 80),
         }
-        request = StarletteRequest(scope)
-
-        async def call_next(_request):
-            return PlainTextResponse("ok", status_code=200)
 
         with patch("app.middleware.request_logging.logger.info") as mocked_info:
-            response = asyncio.run(middleware.dispatch(request, call_next))
+            status, _ = _run_asgi(middleware, scope)
 
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(status, 200)
         self.assertTrue(mocked_info.called)
         format_string = mocked_info.call_args[0][0]
         self.assertIn("request_id=", format_string)
@@ -154,7 +163,10 @@ class ObservabilityTests(BackendTestBase):
 
     def test_request_id_header_present_on_500_in_middleware(self):
         self._info("Checks middleware returns 500 response with X-Request-ID when downstream raises.")
-        middleware = RequestLoggingMiddleware(app=lambda scope, receive, send: None)
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("boom")
+
+        middleware = RequestLoggingMiddleware(app=failing_app)
         request_id = str(uuid4())
         scope = {
             "type": "http",
@@ -168,17 +180,13 @@ class ObservabilityTests(BackendTestBase):
             "client": ("testclient", 1234),
             "server": ("testserver", 80),
         }
-        request = StarletteRequest(scope)
 
-        async def call_next(_request):
-            raise RuntimeError("boom")
-
-        response = asyncio.run(middleware.dispatch(request, call_next))
-        self.assertEqual(response.status_code, 500)
-        self.assertEqual(response.headers.get("x-request-id"), request_id)
+        status, headers = _run_asgi(middleware, scope)
+        self.assertEqual(status, 500)
+        self.assertEqual(headers.get("x-request-id"), request_id)
         self._pass(
             "500 middleware fallback includes X-Request-ID",
             "ok",
             expected_payload={"status": 500, "x-request-id": request_id},
-            received_payload={"status": response.status_code, "x-request-id": response.headers.get("x-request-id")},
+            received_payload={"status": status, "x-request-id": headers.get("x-request-id")},
         )
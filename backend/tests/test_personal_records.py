@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from app.services.personal_records import best_performances, estimated_1rm
+from tests.base import BackendTestBase
+
+
+class PersonalRecordTests(BackendTestBase):
+    def test_best_performances_reduction(self):
+        self._info("Checks per-exercise best reduction and the Epley e1RM rep window.")
+        exercise_id = uuid4()
+        bests = best_performances(
+            [
+                (exercise_id, 100, 5),
+                (exercise_id, 90, 10),
+                (exercise_id, None, 20),
+                (exercise_id, 40, 30),
+            ]
+        )[exercise_id]
+        self.assertEqual(bests.max_weight, 100.0)
+        self.assertEqual(bests.best_set_load, 1200.0)
+        self.assertEqual(bests.best_estimated_1rm, 120.0)
+        self.assertEqual(estimated_1rm(225, 1), 225)
+        self.assertIsNone(estimated_1rm(40, 30))
+        self._pass(
+            "max weight / best set load / e1RM reduced per exercise",
+            bests,
+            expected_payload={"max_weight": 100.0, "best_set_load": 1200.0, "best_estimated_1rm": 120.0},
+            received_payload=vars(bests),
+        )
+
+    def test_personal_records_maintained_on_write(self):
+        self._info("Checks PR hit flags on create and the /v1/personal-records list/detail endpoints.")
+        _, _, token = self._signup()
+
+        s1, first = self._create_strength_workout(
+            token,
+            "2026-02-06T18:50:00Z",
+            [{"exercise_name": "Bench Press", "weight": 100, "reps": 5}],
+        )
+        self.assertEqual(s1, 201, first)
+        self.assertEqual(first["personal_records"], [])
+
+        s2, second = self._create_strength_workout(
+            token,
+            "2026-02-08T18:50:00Z",
+            [
+                {"exercise_name": "Bench Press", "weight": 95, "reps": 8},
+                {"exercise_name": "Dead Hang", "duration_seconds": 60},
+            ],
+        )
+        self.assertEqual(s2, 201, second)
+        self.assertEqual(len(second["personal_records"]), 1)
+        hit = second["personal_records"][0]
+        self.assertEqual(hit["exercise_name"], "Bench Press")
+        self.assertFalse(hit["max_weight"])
+        self.assertTrue(hit["best_set_load"])
+        self.assertTrue(hit["best_estimated_1rm"])
+
+        status_list, records = self._request("GET", "/v1/personal-records", token=token)
+        self.assertEqual(status_list, 200, records)
+        self.assertEqual([r["exercise_name"] for r in records], ["Bench Press"])
+        record = records[0]
+        self.assertEqual(record["max_weight"], 100.0)
+        self.assertTrue(record["max_weight_achieved_at"].startswith("2026-02-06"))
+        self.assertEqual(record["best_set_load"], 760.0)
+        self.assertTrue(record["best_set_load_achieved_at"].startswith("2026-02-08"))
+
+        status_detail, detail = self._request("GET", f"/v1/personal-records/{hit['exercise_id']}", token=token)
+        self.assertEqual(status_detail, 200, detail)
+        self.assertEqual(detail, record)
+
+        _, _, token_other = self._signup()
+        status_other, _ = self._request("GET", f"/v1/personal-records/{hit['exercise_id']}", token=token_other)
+        self.assertEqual(status_other, 404)
+
+        self._pass(
+            "PR flags on create + list/detail + cross-user 404",
+            "ok",
+            expected_payload={
+                "second_create_hits": [{"exercise_name": "Bench Press", "max_weight": False, "best_set_load": True}],
+                "record": {"max_weight": 100.0, "best_set_load": 760.0},
+                "cross_user_status": 404,
+            },
+            received_payload={"second_create": second, "records": records, "cross_user_status": status_other},
+        )
+
+    def test_extreme_sets_fit_personal_records(self):
+        self._info("Checks the largest storable weight with a huge rep count still records a personal best.")
+        _, _, token = self._signup()
+        status, created = self._create_strength_workout(
+            token,
+            "2026-02-06T18:50:00Z",
+            [{"exercise_name": "Sled Push", "weight": 999999.99, "reps": 2_000_000_000}],
+        )
+        if status != 201:
+            self._fail_with("201 for a set whose load exceeds the old Numeric(12, 2)", {"status": status, "body": created})
+        status_list, records = self._request("GET", "/v1/personal-records", token=token)
+        self.assertEqual(status_list, 200, records)
+        self.assertEqual(records[0]["best_set_load"], 1999999980000000.0)
+        self._pass("best_set_load holds weight * reps at the column limits", records[0]["best_set_load"])
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+from pathlib import Path
+import tempfile
+import threading
+
+from app.core.config import settings
+from app.core.profiling import StackSampler, save_profile, should_profile
+from tests.base import BackendTestBase
+
+
+def _spin(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _scope(headers: dict[str, str] | None = None) -> dict:
+    return {"headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]}
+
+
+class ProfilingTests(BackendTestBase):
+    def test_sampler_writes_speedscope_profile(self):
+        self._info("Checks the stack sampler captures the handler's frames and saves speedscope JSON by request id.")
+        sampler = StackSampler(threading.get_ident(), interval_seconds=0.001)
+        sampler.start()
+        _spin(3_000_000)
+        sampler.stop()
+        self.assertGreater(len(sampler.samples), 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = save_profile(sampler, "req/../1", "/v1/dashboard/day", directory)
+            self.assertEqual(file_name, "req_.._1.speedscope.json")
+            document = json.loads((Path(directory) / file_name).read_text())
+
+        profile = document["profiles"][0]
+        frame_names = {frame["name"] for frame in document["shared"]["frames"]}
+        self.assertEqual(profile["type"], "sampled")
+        self.assertEqual(len(profile["samples"]), len(profile["weights"]))
+        self.assertIn("_spin", frame_names)
+        self._pass("speedscope profile with handler frames", {"samples": len(profile["samples"])})
+
+    def test_profile_selection_guards(self):
+        self._info("Checks profiling triggers only on the exact admin token or the configured route sampling.")
+        guarded = replace(settings, profile_token="s3cret", profile_sample_rate=0.0, profile_routes=())
+        self.assertTrue(should_profile(guarded, _scope({"X-Profile-Token": "s3cret"}), "/v1/workouts"))
+        self.assertFalse(should_profile(guarded, _scope({"X-Profile-Token": "guess"}), "/v1/workouts"))
+        self.assertFalse(should_profile(guarded, _scope(), "/v1/workouts"))
+        non_ascii = {"headers": [(b"x-profile-token", "sécret".encode("latin-1"))]}
+        self.assertFalse(should_profile(guarded, non_ascii, "/v1/workouts"))
+
+        sampled = replace(settings, profile_token=None, profile_sample_rate=1.0, profile_routes=("/v1/dashboard/day",))
+        self.assertTrue(should_profile(sampled, _scope(), "/v1/dashboard/day"))
+        self.assertFalse(should_profile(sampled, _scope(), "/v1/workouts"))
+        self._pass("token and route sampling guards hold", "ok")
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from tests.base import BackendTestBase
+
+# Statement ceilings per endpoint; they must not grow with the number of sets or workouts.
+CREATE_WORKOUT_MAX_QUERIES = 12
+DASHBOARD_DAY_MAX_QUERIES = 6
+LIST_WORKOUTS_MAX_QUERIES = 2
+WORKOUT_DETAIL_MAX_QUERIES = 3
+
+
+def _strength_payload(start_ts: str, exercise_count: int, sets_per_exercise: int) -> dict:
+    return {
+        "workout_type": "STRENGTH",
+        "title": "Budget",
+        "start_ts": start_ts,
+        "strength_sets": [
+            {"exercise_name": f"Budget Lift {e}", "weight": 100 + s, "reps": 5}
+            for e in range(exercise_count)
+            for s in range(sets_per_exercise)
+        ],
+    }
+
+
+class QueryBudgetTests(BackendTestBase):
+    def test_create_workout_query_count_is_flat_in_sets(self):
+        self._info("Checks create_workout issues the same bounded number of statements for 1 set and 36 sets.")
+        _, _, small_token = self._signup()
+        status_small, body_small, small = self._assert_query_budget(
+            "create_workout 1 set",
+            CREATE_WORKOUT_MAX_QUERIES,
+            "POST",
+            "/v1/workouts",
+            payload=_strength_payload("2026-02-06T17:00:00Z", 1, 1),
+            token=small_token,
+        )
+        self.assertEqual(status_small, 201, body_small)
+
+        _, _, large_token = self._signup()
+        status_large, body_large, large = self._assert_query_budget(
+            "create_workout 36 sets",
+            CREATE_WORKOUT_MAX_QUERIES,
+            "POST",
+            "/v1/workouts",
+            payload=_strength_payload("2026-02-06T17:00:00Z", 12, 3),
+            token=large_token,
+        )
+        self.assertEqual(status_large, 201, body_large)
+        self.assertEqual(body_large["strength_set_count"], 36)
+        self.assertLessEqual(large, small + 1)
+        self._pass(
+            f"<= {CREATE_WORKOUT_MAX_QUERIES} statements regardless of set count",
+            {"one_set": small, "thirty_six_sets": large},
+        )
+
+    def test_read_endpoint_query_budgets(self):
+        self._info("Checks dashboard_day, list_workouts and get_workout stay within their statement budgets.")
+        _, _, token = self._signup()
+        workout_ids = []
+        for hour in (7, 12, 18):
+            status, body = self._request(
+                "POST",
+                "/v1/workouts",
+                payload=_strength_payload(f"2026-02-06T{hour:02d}:00:00Z", 4, 3),
+                token=token,
+            )
+            self.assertEqual(status, 201, body)
+            workout_ids.append(body["workout_id"])
+
+        status_day, _, day = self._assert_query_budget(
+            "dashboard_day",
+            DASHBOARD_DAY_MAX_QUERIES,
+            "GET",
+            "/v1/dashboard/day?date=2026-02-06&limit=50&top_k=10",
+            token=token,
+        )
+        status_list, _, listed = self._assert_query_budget(
+            "list_workouts",
+            LIST_WORKOUTS_MAX_QUERIES,
+            "GET",
+            "/v1/workouts?date=2026-02-06&limit=20",
+            token=token,
+        )
+        status_detail, _, detail = self._assert_query_budget(
+            "get_workout",
+            WORKOUT_DETAIL_MAX_QUERIES,
+            "GET",
+            f"/v1/workouts/{workout_ids[0]}",
+            token=token,
+        )
+        self.assertEqual([status_day, status_list, status_detail], [200, 200, 200])
+        self._pass(
+            "read endpoints within budget",
+            {"dashboard_day": day, "list_workouts": listed, "get_workout": detail},
+        )
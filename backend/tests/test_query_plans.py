@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.dashboard import (
+    _day_cardio_rows_stmt,
+    _day_strength_rows_stmt,
+    _day_workouts_stmt,
+    _muscle_mappings_stmt,
+    _trend_load_stmt,
+)
+from app.api.v1.workouts import _list_workouts_stmt, _workout_strength_rows_stmt
+from app.db.models.cardio_session import CardioSession
+from app.db.models.enums import Modality
+from app.db.models.exercise import Exercise
+from app.db.models.muscle_group import ExerciseMuscleMap, MuscleGroup
+from app.db.models.strength_set import StrengthSet
+from app.db.models.user import User
+from app.db.models.workout import Workout
+from app.db.session import SessionLocal
+from tests.base import BackendTestBase
+
+HOT_TABLES = {"workouts", "strength_sets", "cardio_sessions", "exercises", "exercise_muscle_map"}
+# Hash partitions of workouts / strength_sets appear in plans as "<table>_p<n>".
+PARTITIONED_TABLES = {"workouts", "strength_sets"}
+
+USER_COUNT = 40
+WORKOUTS_PER_USER = 120
+SETS_PER_WORKOUT = 8
+EXERCISES_PER_USER = 30
+MUSCLE_GROUP_COUNT = 12
+FIRST_DAY = date(2025, 6, 1)
+
+
+def _explain(db, stmt) -> dict:
+    sql = stmt.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True, "render_postcompile": True},
+    )
+    return db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()[0]["Plan"]
+
+
+def _parent_table(relation: str | None) -> str | None:
+    if relation is None:
+        return None
+    parent, sep, suffix = relation.rpartition("_p")
+    return parent if sep and suffix.isdigit() and parent in PARTITIONED_TABLES else relation
+
+
+def _seq_scanned_tables(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and _parent_table(plan.get("Relation Name")) in HOT_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scanned_tables(child))
+    return found
+
+
+def _scanned_partitions(plan: dict) -> dict[str, set[str]]:
+    """Partitions each partitioned table is read from, per parent table."""
+    found: dict[str, set[str]] = {}
+    relation = plan.get("Relation Name")
+    parent = _parent_table(relation)
+    if parent in PARTITIONED_TABLES and relation != parent:
+        found.setdefault(parent, set()).add(relation)
+    for child in plan.get("Plans", []):
+        for table, partitions in _scanned_partitions(child).items():
+            found.setdefault(table, set()).update(partitions)
+    return found
+
+
+def _seed_history() -> tuple[int, list, list]:
+    """Seed USER_COUNT users with full histories; return the first user's id, workout ids and exercise ids."""
+    suffix = uuid4().hex[:8]
+    with SessionLocal() as db:
+        group_rows = [{"id": uuid4(), "name": f"PlanGroup-{suffix}-{i}"} for i in range(MUSCLE_GROUP_COUNT)]
+        db.execute(insert(MuscleGroup), group_rows)
+
+        target = None
+        for u in range(USER_COUNT):
+            user_id = db.execute(
+                insert(User)
+                .values(
+                    email=f"plans.{suffix}.{u}@example.com",
+                    name="Plan User",
+                    birth_year=1990,
+                    birth_month=1,
+                    password_hash="x",
+                )
+                .returning(User.user_id)
+            ).scalar_one()
+
+            exercise_rows = [
+                {"id": uuid4(), "user_id": user_id, "name": f"Lift {i}", "default_modality": Modality.STRENGTH}
+                for i in range(EXERCISES_PER_USER)
+            ]
+            db.execute(insert(Exercise), exercise_rows)
+            db.execute(
+                insert(ExerciseMuscleMap),
+                [
+                    {
+                        "exercise_id": row["id"],
+                        "muscle_group_id": group_rows[(i + offset) % MUSCLE_GROUP_COUNT]["id"],
+                        "is_primary": offset == 0,
+                    }
+                    for i, row in enumerate(exercise_rows)
+                    for offset in (0, 1)
+                ],
+            )
+
+            workout_rows, set_rows, cardio_rows = [], [], []
+            for w in range(WORKOUTS_PER_USER):
+                local_date = FIRST_DAY + timedelta(days=w)
+                start_ts = datetime.combine(local_date, time(17, 0), tzinfo=timezone.utc)
+                is_cardio = w % 5 == 4
+                workout_id = uuid4()
+                workout_rows.append(
+                    {
+                        "id": workout_id,
+                        "user_id": user_id,
+                        "workout_type": Modality.CARDIO if is_cardio else Modality.STRENGTH,
+                        "start_ts": start_ts,
+                        "local_date": local_date,
+                    }
+                )
+                if is_cardio:
+                    cardio_rows.append(
+                        {"id": uuid4(), "user_id": user_id, "workout_id": workout_id, "distance_miles": 3.1}
+                    )
+                    continue
+                for s in range(SETS_PER_WORKOUT):
+                    set_rows.append(
+                        {
+                            "id": uuid4(),
+                            "user_id": user_id,
+                            "workout_id": workout_id,
+                            "exercise_id": exercise_rows[(w + s) % EXERCISES_PER_USER]["id"],
+                            "set_index": s + 1,
+                            "performed_at": start_ts,
+                            "weight": 100 + s,
+                            "reps": 8,
+                        }
+                    )
+            db.execute(insert(Workout), workout_rows)
+            db.execute(insert(StrengthSet), set_rows)
+            db.execute(insert(CardioSession), cardio_rows)
+
+            if target is None:
+                target = (
+                    user_id,
+                    [row["id"] for row in workout_rows],
+                    [row["id"] for row in exercise_rows],
+                )
+        db.commit()
+
+        for table in sorted(HOT_TABLES | {"muscle_groups"}):
+            db.execute(text(f"ANALYZE {table}"))
+        db.commit()
+    return target
+
+
+class QueryPlanTests(BackendTestBase):
+    """Asserts hot-path queries stay index-driven and partition-pruned against a seeded multi-user history."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.user_id, cls.workout_ids, cls.exercise_ids = _seed_history()
+        cls.day = FIRST_DAY + timedelta(days=10)
+
+    def _assert_index_driven(self, label: str, stmt):
+        with SessionLocal() as db:
+            plan = _explain(db, stmt)
+        seq_scans = _seq_scanned_tables(plan)
+        if seq_scans:
+            self._fail_with(f"{label}: no Seq Scan on {sorted(HOT_TABLES)}", {"seq_scans": seq_scans, "plan": plan})
+        unpruned = {table: sorted(parts) for table, parts in _scanned_partitions(plan).items() if len(parts) > 1}
+        if unpruned:
+            self._fail_with(f"{label}: one partition per partitioned table", {"partitions": unpruned, "plan": plan})
+        self._pass(f"{label} is index-driven", plan.get("Node Type"), received_payload=plan)
+
+    def test_list_workouts_plan(self):
+        self._info("Checks list_workouts resolves the day and per-row counts through indexes.")
+        self._assert_index_driven("list_workouts", _list_workouts_stmt(self.user_id, self.day, 20))
+
+    def test_workout_detail_plan(self):
+        self._info("Checks get_workout set rows come from strength_sets_workout_order.")
+        self._assert_index_driven("get_workout sets", _workout_strength_rows_stmt(self.user_id, self.workout_ids[10]))
+
+    def test_dashboard_day_plans(self):
+        self._info("Checks every dashboard_day query is index-driven.")
+        day_workouts = self.workout_ids[8:12]
+        self._assert_index_driven("dashboard workouts", _day_workouts_stmt(self.user_id, self.day, 50))
+        self._assert_index_driven("dashboard strength rows", _day_strength_rows_stmt(self.user_id, day_workouts))
+        self._assert_index_driven("dashboard cardio rows", _day_cardio_rows_stmt(self.user_id, day_workouts))
+        self._assert_index_driven("dashboard muscle mappings", _muscle_mappings_stmt(self.exercise_ids[:8]))
+
+    def test_trend_load_plan(self):
+        self._info("Checks the trends daily-load query only touches the user's rows via indexes.")
+        self._assert_index_driven(
+            "trends daily load",
+            _trend_load_stmt(self.user_id, self.day, self.day + timedelta(days=60)),
+        )
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+from fastapi import FastAPI
+
+from app.core import security
+from app.core.security import create_access_token
+from app.middleware.rate_limit import RateLimitMiddleware, RateLimitRule, TokenBuckets
+from tests.base import BackendTestBase
+
+
+async def _ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def _scope(path: str, token: str | None = None, client: str = "10.0.0.1") -> dict:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return {"type": "http", "method": "GET", "path": path, "headers": headers, "client": (client, 4321)}
+
+
+def _call(middleware, scope) -> tuple[int, dict]:
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(middleware(scope, None, send))
+    start = next(message for message in sent if message["type"] == "http.response.start")
+    return start["status"], {name.decode(): value.decode() for name, value in start["headers"]}
+
+
+class RateLimitTests(BackendTestBase):
+    def test_token_bucket_refill_and_bounded_keys(self):
+        self._info("Checks buckets allow a burst, refill over time, and keep at most max_keys entries.")
+        buckets = TokenBuckets(RateLimitRule("GET", "/x", burst=3, per_second=1.0), max_keys=2)
+        waits = [buckets.take("a", 0.0) for _ in range(4)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 1.0)
+        self.assertEqual(buckets.take("a", 1.0), 0.0)
+
+        buckets.take("b", 1.0)
+        buckets.take("c", 1.0)
+        self.assertEqual(len(buckets), 2)
+        self._pass("burst of 3, refill after 1s, LRU-capped state", {"waits": waits, "keys": len(buckets)})
+
+    def test_middleware_keys_by_user_then_ip(self):
+        self._info("Checks the middleware limits per user token and per IP, answering 429 with Retry-After.")
+        middleware = RateLimitMiddleware(_ok_app, [RateLimitRule("GET", "/limited", burst=2, per_second=0.5)])
+        token = create_access_token(4242)
+
+        user_statuses = [_call(middleware, _scope("/limited", token))[0] for _ in range(2)]
+        status_limited, headers = _call(middleware, _scope("/limited", token))
+        self.assertEqual(user_statuses, [200, 200])
+        self.assertEqual(status_limited, 429)
+        self.assertEqual(headers["retry-after"], "2")
+
+        # Same client IP without the token gets its own bucket; unlisted paths are never limited.
+        self.assertEqual(_call(middleware, _scope("/limited"))[0], 200)
+        self.assertEqual(_call(middleware, _scope("/elsewhere", token))[0], 200)
+        self._pass(
+            "third request for the same user is 429 with Retry-After",
+            {"user": user_statuses + [status_limited], "retry_after": headers["retry-after"]},
+        )
+
+    def test_rejected_tokens_and_route_label(self):
+        self._info("Checks a bad token is verified once, then keyed by IP, and a 429 carries its route for metrics.")
+        routed = FastAPI()
+        routed.get("/limited")(lambda: {})
+        middleware = RateLimitMiddleware(_ok_app, [RateLimitRule("GET", "/limited", burst=2, per_second=0.5)])
+        forged = create_access_token(4242)[:-2] + "xx"
+
+        with mock.patch.object(security, "_verify_access_token", wraps=security._verify_access_token) as verify:
+            scopes = [{**_scope("/limited", forged, client="10.0.0.9"), "app": routed} for _ in range(3)]
+            statuses = [_call(middleware, scope)[0] for scope in scopes]
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(verify.call_count, 1)
+        # The token-less request from the same IP shares the bucket the forged token fell back to.
+        self.assertEqual(_call(middleware, _scope("/limited", client="10.0.0.9"))[0], 429)
+        self.assertEqual(scopes[2]["route"].path_format, "/limited")
+        self._pass(
+            "one verification for a repeated forged token; 429 labelled /limited",
+            {"statuses": statuses, "verifications": verify.call_count},
+        )
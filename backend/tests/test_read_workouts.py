@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from sqlalchemy import update
+
+from app.db.models.user import User
+from app.db.session import SessionLocal
 from tests.base import BackendTestBase
 
 
@@ -156,3 +160,99 @@ class ReadWorkoutsContractTests(BackendTestBase):
             expected_payload={"set_indexes": [1, 2, 3]},
             received_payload={"set_indexes": set_indexes, "detail": body},
         )
+
+    def test_local_date_fixed_at_write_time(self):
+        self._info("Checks local_date comes from the writer's timezone (header or user default) and drives day/calendar reads.")
+        _, _, token = self._signup()
+        me = self._me(token)
+        self.assertEqual(me["timezone"], self.tz)
+
+        # 05:30Z on the 7th is 21:30 on the 6th in America/Los_Angeles.
+        s1, b1 = self._create_strength_workout(
+            token,
+            "2026-02-07T05:30:00Z",
+            [{"exercise_name": "Late Bench", "weight": 100, "reps": 5}],
+            title="Late night",
+        )
+        self.assertEqual(s1, 201, b1)
+
+        # No header: falls back to the user's stored default timezone.
+        s2, b2 = self._request(
+            "POST",
+            "/v1/workouts",
+            payload={
+                "workout_type": "CARDIO",
+                "title": "Late run",
+                "start_ts": "2026-02-07T06:00:00Z",
+                "cardio_session": {"distance_miles": 1.0},
+            },
+            token=token,
+            include_tz=False,
+        )
+        self.assertEqual(s2, 201, b2)
+
+        status_utc, items = self._request(
+            "GET", "/v1/workouts?date=2026-02-06&limit=20", token=token, tz_value="UTC"
+        )
+        self.assertEqual(status_utc, 200, items)
+        self.assertEqual({i["id"] for i in items}, {b1["workout_id"], b2["workout_id"]})
+        self.assertTrue(all(i["local_date"] == "2026-02-06" for i in items))
+
+        status_next, next_day = self._request("GET", "/v1/workouts?date=2026-02-07&limit=20", token=token)
+        self.assertEqual(status_next, 200, next_day)
+        self.assertEqual(next_day, [])
+
+        status_cal, calendar = self._request(
+            "GET", "/v1/workouts/calendar?start=2026-02-01&end=2026-02-28", token=token
+        )
+        self.assertEqual(status_cal, 200, calendar)
+        self.assertEqual(calendar, [{"date": "2026-02-06", "workout_count": 2}])
+
+        status_bad_range, _ = self._request(
+            "GET", "/v1/workouts/calendar?start=2026-02-28&end=2026-02-01", token=token
+        )
+        self.assertEqual(status_bad_range, 422)
+
+        self._pass(
+            "local_date from writer timezone + calendar counts",
+            "ok",
+            expected_payload={"day_items": 2, "next_day": [], "calendar": [{"date": "2026-02-06", "workout_count": 2}], "bad_range": 422},
+            received_payload={"day_items": items, "next_day": next_day, "calendar": calendar, "bad_range": status_bad_range},
+        )
+
+    def test_utc_backfilled_dates_follow_first_timezone(self):
+        self._info("Checks an account without a stored timezone gets its UTC-derived dates redone once it sets one.")
+        email, _, token = self._signup()
+        # Written in UTC: 05:30Z on the 7th, which is the 6th in America/Los_Angeles.
+        status, created = self._request(
+            "POST",
+            "/v1/workouts",
+            payload={
+                "workout_type": "STRENGTH",
+                "start_ts": "2026-02-07T05:30:00Z",
+                "strength_sets": [{"exercise_name": "Backfilled Bench", "weight": 100, "reps": 5}],
+            },
+            token=token,
+            tz_value="UTC",
+        )
+        self.assertEqual(status, 201, created)
+        # Simulate an account from before users.timezone existed.
+        with SessionLocal() as db:
+            db.execute(update(User).where(User.email == email).values(timezone=None))
+            db.commit()
+
+        status_patch, me = self._request("PATCH", "/v1/auth/me", payload={"timezone": self.tz}, token=token)
+        self.assertEqual(status_patch, 200, me)
+        self.assertEqual(me["timezone"], self.tz)
+        _, detail = self._request("GET", f"/v1/workouts/{created['workout_id']}", token=token)
+        self.assertEqual(detail["local_date"], "2026-02-06")
+
+        # Later zone changes leave existing dates alone.
+        self._request("PATCH", "/v1/auth/me", payload={"timezone": "Asia/Tokyo"}, token=token)
+        _, detail_after_move = self._request("GET", f"/v1/workouts/{created['workout_id']}", token=token)
+        self.assertEqual(detail_after_move["local_date"], "2026-02-06")
+
+        self._pass(
+            "UTC-derived local_date redone in the first stored timezone only",
+            {"after_first_zone": detail["local_date"], "after_move": detail_after_move["local_date"]},
+        )
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import numpy as np
+
+from app.services.training_load import acute_chronic_ratio, rolling_sum
+from tests.base import BackendTestBase
+
+
+class TrainingLoadTrendTests(BackendTestBase):
+    def test_rolling_window_math(self):
+        self._info("Checks vectorized rolling sums and acute:chronic ratio against hand-computed values.")
+        daily = np.array([[10.0], [0.0], [20.0], [0.0], [0.0], [0.0], [0.0], [5.0]])
+        acute = rolling_sum(daily, 7)
+        self.assertEqual(acute[:, 0].tolist(), [10.0, 10.0, 30.0, 30.0, 30.0, 30.0, 30.0, 25.0])
+
+        chronic = rolling_sum(daily, 28)
+        ratio = acute_chronic_ratio(acute, chronic)
+        self.assertAlmostEqual(float(ratio[0, 0]), 4.0)
+        self.assertTrue(np.isnan(acute_chronic_ratio(np.zeros((1, 1)), np.zeros((1, 1)))[0, 0]))
+        self._pass(
+            "rolling sums and ratio match",
+            "ok",
+            expected_payload={"acute": [10.0, 10.0, 30.0, 30.0, 30.0, 30.0, 30.0, 25.0], "ratio_day0": 4.0},
+            received_payload={"acute": acute[:, 0].tolist(), "ratio_day0": float(ratio[0, 0])},
+        )
+
+    def test_trends_contract(self):
+        self._info("Checks /v1/dashboard/trends daily series, rolling windows and validation errors.")
+        _, _, token = self._signup()
+
+        # 2026-02-06 and 2026-02-10 local (America/Los_Angeles) days.
+        self._create_strength_workout(
+            token,
+            "2026-02-06T18:50:00Z",
+            [{"exercise_name": "Bench Press", "weight": 100, "reps": 10}],
+        )
+        self._create_strength_workout(
+            token,
+            "2026-02-10T18:50:00Z",
+            [
+                {"exercise_name": "Bench Press", "weight": 100, "reps": 5},
+                {"exercise_name": "Dead Hang", "duration_seconds": 60},
+            ],
+        )
+
+        status, body = self._request("GET", "/v1/dashboard/trends?start=2026-02-05&end=2026-02-14", token=token)
+        self.assertEqual(status, 200, body)
+        self.assertEqual(len(body["dates"]), 10)
+        self.assertEqual(body["dates"][0], "2026-02-05")
+
+        overall = body["overall"]
+        by_date = dict(zip(body["dates"], overall["daily_load"]))
+        self.assertEqual(by_date["2026-02-06"], 1000.0)
+        self.assertEqual(by_date["2026-02-10"], 500.0)
+        rolling_7d = dict(zip(body["dates"], overall["rolling_7d_load"]))
+        self.assertEqual(rolling_7d["2026-02-10"], 1500.0)
+        self.assertEqual(rolling_7d["2026-02-13"], 500.0)
+        self.assertIsNone(overall["acute_chronic_ratio"][0])
+
+        status_order, _ = self._request("GET", "/v1/dashboard/trends?start=2026-02-14&end=2026-02-05", token=token)
+        self.assertEqual(status_order, 422)
+        status_bad_tz, _ = self._request(
+            "GET",
+            "/v1/dashboard/trends?start=2026-02-05&end=2026-02-14",
+            token=token,
+            tz_value="Not/A_Real_TZ",
+        )
+        self.assertEqual(status_bad_tz, 422)
+        status_no_auth, _ = self._request("GET", "/v1/dashboard/trends?start=2026-02-05&end=2026-02-14")
+        self.assertEqual(status_no_auth, 401)
+
+        self._pass(
+            "trends daily/rolling series and validation",
+            "ok",
+            expected_payload={
+                "daily_load": {"2026-02-06": 1000.0, "2026-02-10": 500.0},
+                "rolling_7d_load": {"2026-02-10": 1500.0, "2026-02-13": 500.0},
+                "reversed_range_status": 422,
+                "bad_tz_status": 422,
+                "missing_auth_status": 401,
+            },
+            received_payload={
+                "body": body,
+                "reversed_range_status": status_order,
+                "bad_tz_status": status_bad_tz,
+                "missing_auth_status": status_no_auth,
+            },
+        )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from tests.base import BackendTestBase
+
+
+class WorkoutEditTests(BackendTestBase):
+    def _strength_workout(self) -> tuple[str, str, list[dict]]:
+        _, _, token = self._signup()
+        status, created = self._create_strength_workout(
+            token,
+            "2026-03-02T18:00:00Z",
+            [
+                {"exercise_name": "Edit Squat", "weight": 100, "reps": 5},
+                {"exercise_name": "Edit Squat", "weight": 120, "reps": 3},
+            ],
+        )
+        self.assertEqual(status, 201, created)
+        workout_id = created["workout_id"]
+        status, detail = self._request("GET", f"/v1/workouts/{workout_id}", token=token)
+        self.assertEqual(status, 200, detail)
+        return token, workout_id, detail["strength_sets"]
+
+    def test_patch_workout_requires_current_version(self):
+        self._info("Checks If-Match handling: 428 without it, 200 and a new ETag with it, 412 when stale.")
+        token, workout_id, _ = self._strength_workout()
+
+        status, detail, headers = self._request_with_headers("GET", f"/v1/workouts/{workout_id}", token=token)
+        self.assertEqual(status, 200, detail)
+        self.assertEqual((headers.get("etag"), detail["version"]), ('"1"', 1))
+
+        status_missing, _ = self._request("PATCH", f"/v1/workouts/{workout_id}", payload={"title": "Legs"}, token=token)
+        self.assertEqual(status_missing, 428)
+
+        status_ok, updated, ok_headers = self._request_with_headers(
+            "PATCH",
+            f"/v1/workouts/{workout_id}",
+            payload={"title": "Legs", "start_ts": "2026-03-04T18:00:00Z"},
+            token=token,
+            headers={"If-Match": '"1"'},
+        )
+        self.assertEqual(status_ok, 200, updated)
+        self.assertEqual(ok_headers.get("etag"), '"2"')
+        self.assertEqual((updated["title"], updated["local_date"]), ("Legs", "2026-03-04"))
+        self.assertEqual(len(updated["strength_sets"]), 2)
+
+        _, moved = self._request("GET", "/v1/workouts?date=2026-03-04", token=token)
+        _, old_day = self._request("GET", "/v1/workouts?date=2026-03-02", token=token)
+        self.assertEqual(([w["id"] for w in moved], old_day), ([workout_id], []))
+
+        status_stale, _, stale_headers = self._request_with_headers(
+            "PATCH",
+            f"/v1/workouts/{workout_id}",
+            payload={"title": "Lost update"},
+            token=token,
+            headers={"If-Match": '"1"'},
+        )
+        self.assertEqual(status_stale, 412)
+        self.assertEqual(stale_headers.get("etag"), '"2"')
+
+        self._pass(
+            "optimistic concurrency on PATCH /v1/workouts/{id}",
+            {"missing": status_missing, "ok": status_ok, "stale": status_stale},
+        )
+
+    def test_set_edits_and_soft_deletes(self):
+        self._info("Checks set PATCH/DELETE, workout DELETE, and that reads and records ignore deleted rows.")
+        token, workout_id, sets = self._strength_workout()
+        exercise_id = sets[0]["exercise_id"]
+
+        status_set, edited, headers = self._request_with_headers(
+            "PATCH",
+            f"/v1/workouts/{workout_id}/sets/{sets[1]['id']}",
+            payload={"weight": 130},
+            token=token,
+            headers={"If-Match": '"1"'},
+        )
+        self.assertEqual(status_set, 200, edited)
+        self.assertEqual((edited["weight"], edited["reps"], headers.get("etag")), (130.0, 3, '"2"'))
+        _, record = self._request("GET", f"/v1/personal-records/{exercise_id}", token=token)
+        self.assertEqual(record["max_weight"], 130.0)
+
+        status_delete_set, _ = self._request("DELETE", f"/v1/workouts/{workout_id}/sets/{sets[1]['id']}", token=token)
+        self.assertEqual(status_delete_set, 204)
+        _, detail = self._request("GET", f"/v1/workouts/{workout_id}", token=token)
+        self.assertEqual(([s["id"] for s in detail["strength_sets"]], detail["version"]), ([sets[0]["id"]], 3))
+        _, record = self._request("GET", f"/v1/personal-records/{exercise_id}", token=token)
+        self.assertEqual(record["max_weight"], 100.0)
+
+        status_delete, _ = self._request(
+            "DELETE", f"/v1/workouts/{workout_id}", token=token, headers={"If-Match": '"3"'}
+        )
+        self.assertEqual(status_delete, 204)
+        status_gone, _ = self._request("GET", f"/v1/workouts/{workout_id}", token=token)
+        self.assertEqual(status_gone, 404)
+        _, listed = self._request("GET", "/v1/workouts?date=2026-03-02", token=token)
+        _, day = self._request("GET", "/v1/dashboard/day?date=2026-03-02", token=token)
+        _, history = self._request("GET", f"/v1/exercises/{exercise_id}/history", token=token)
+        self.assertEqual((listed, day["workouts"], history["items"]), ([], [], []))
+
+        self._pass(
+            "deleted sets and workouts disappear from reads and records",
+            {"set_patch": status_set, "set_delete": status_delete_set, "workout_delete": status_delete},
+        )
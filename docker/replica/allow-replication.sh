@@ -0,0 +1,5 @@
+#!/usr/bin/env bash
+# Lets the db-replica service stream WAL from the primary with the application credentials.
+set -euo pipefail
+
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"